@@ -1,3 +1,5 @@
 from .analyzer import ContentAnalyzer
+from .analysis_cache import AnalysisCache
+from .summarizer import ArticleSummarizer
 
-__all__ = ['ContentAnalyzer']
+__all__ = ['ContentAnalyzer', 'AnalysisCache', 'ArticleSummarizer']
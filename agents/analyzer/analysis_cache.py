@@ -0,0 +1,111 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from agents.common.article import Article
+
+
+class AnalysisCache:
+    """기사 분석 결과 캐시 (SQLite, LRU)
+
+    기사 ID별로 제목 + 발췌문 + 소스 해시와 분석 규칙 버전을 함께 저장하고,
+    둘 다 같을 때만 저장된 분석 필드(importance / category / tags / summary ...)를 재사용한다.
+    키워드 / 신뢰도 테이블을 고치면 규칙 버전이 바뀌어 자동으로 다시 분석된다.
+    항목 수가 max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 삭제한다.
+    """
+
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: str = 'data/cache/analysis.sqlite', max_entries: int = 20000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis ("
+            "id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, ruleset TEXT NOT NULL, "
+            "result TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS analysis_last_used ON analysis (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def content_hash(article: Dict) -> str:
+        """분석 입력(제목 + 발췌문 + 소스) 해시 (Article은 계산해 둔 값 재사용)"""
+        if isinstance(article, Article):
+            return article.content_hash
+        return Article.hash_content(article['title'], article.get('excerpt', ''), article['source'])
+
+    def get_many(self, articles: List[Dict], ruleset: str) -> Dict[str, Dict]:
+        """캐시된 분석 필드 {기사 ID: 필드}. 내용이나 규칙이 바뀐 기사는 제외."""
+        expected = {article['id']: self.content_hash(article) for article in articles}
+        ids = list(expected)
+        found = {}
+        with self._lock:
+            for i in range(0, len(ids), self.QUERY_CHUNK):
+                chunk = ids[i:i + self.QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id, content_hash, ruleset, result FROM analysis WHERE id IN ({placeholders})",
+                    chunk
+                )
+                for article_id, content_hash, row_ruleset, result in rows:
+                    if content_hash == expected[article_id] and row_ruleset == ruleset:
+                        found[article_id] = json.loads(result)
+
+            # LRU: 사용 시각 갱신
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE analysis SET last_used = ? WHERE id = ?",
+                [(now, article_id) for article_id in found]
+            )
+            self._conn.commit()
+
+        self.hits += len(found)
+        self.misses += len(expected) - len(found)
+        return found
+
+    def put_many(self, analyzed: Iterable[Dict], fields: Iterable[str], ruleset: str):
+        """분석 결과 중 fields만 저장하고 max_entries를 넘는 오래된 항목 삭제"""
+        fields = list(fields)
+        now = time.time()
+        rows = [
+            (
+                article['id'],
+                self.content_hash(article),
+                ruleset,
+                json.dumps({field: article[field] for field in fields}, ensure_ascii=False),
+                now
+            )
+            for article in analyzed
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analysis (id, content_hash, ruleset, result, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM analysis WHERE id IN "
+                    "(SELECT id FROM analysis ORDER BY last_used LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {'hit': self.hits, 'miss': self.misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
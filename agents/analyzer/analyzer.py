@@ -1,4 +1,16 @@
-from typing import Dict, Any, List
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Dict, List, Optional, FrozenSet
+
+import numpy as np
+from scipy import sparse
+
+from agents.common.keyword_matcher import KeywordMatcher
+from .analysis_cache import AnalysisCache
+from .summarizer import ArticleSummarizer
 
 
 class ContentAnalyzer:
@@ -48,51 +60,249 @@ class ContentAnalyzer:
         'Hacker News': 7, 'Reddit': 6
     }
 
+    # 태그 후보
+    TAG_COMPANIES = ['OpenAI', 'Anthropic', 'Google', 'Meta', 'Microsoft', 'DeepMind', 'Nvidia']
+    TAG_MODELS = ['GPT', 'Claude', 'Gemini', 'Llama', 'Mistral', 'DALL-E', 'Midjourney', 'Stable Diffusion']
+    TAG_TECHS = ['LLM', 'RAG', 'Fine-tuning', 'Vision', 'Multimodal', 'Agents', 'API']
+
+    # 이 크기 이상의 배치는 행렬 연산으로 일괄 채점 (작은 스트리밍 배치는 기사별 처리가 더 빠름)
+    BATCH_MIN_SIZE = 64
+    # 이 크기 이상이면 프로세스 풀로 나눠 채점 (일일 실행은 풀 시작 비용이 더 커서 직렬 유지)
+    PARALLEL_MIN_SIZE = 5000
+    # 워커당 샤드 수 (샤드가 작을수록 워커 간 부하가 고르게 분산)
+    SHARDS_PER_WORKER = 4
+
+    # 분석이 기사에 추가하는 필드 (분석 캐시에 저장되는 필드)
+    ANALYSIS_FIELDS = ('importance', 'importance_score', 'category', 'tags', 'summary', 'key_points')
+    # 채점 / 요약 코드를 바꾸면 올려서 분석 캐시 무효화 (키워드 / 신뢰도 테이블 변경은 자동 반영)
+    RULESET_REVISION = 2
+
+    def __init__(self, matcher: Optional[KeywordMatcher] = None,
+                 cache: Optional[AnalysisCache] = None,
+                 summarizer: Optional[ArticleSummarizer] = None,
+                 workers: int = 1, parallel_min_size: Optional[int] = None):
+        # 키워드 매처 (orchestrator가 공유 매처를 넘기면 collector/filter와 hits 재사용)
+        self.matcher = matcher or KeywordMatcher(self.keywords())
+        self._build_tables()
+
+        # 프로세스 풀 채점 (workers 0이면 CPU 수, 1이면 항상 직렬)
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_min_size = parallel_min_size or self.PARALLEL_MIN_SIZE
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Claude 배치 요약 (없으면 발췌문 앞부분을 요약으로 사용)
+        self.summarizer = summarizer
+
+        # 분석 결과 캐시 (내용 / 규칙이 바뀌지 않은 기사는 분석 생략)
+        self.cache = cache
+        self.ruleset = self.ruleset_version()
+
+    @classmethod
+    def keywords(cls) -> List[str]:
+        """중요도/카테고리/태그 판정에 쓰이는 모든 키워드 (소문자)"""
+        keywords = list(cls.IMPORTANCE_KEYWORDS)
+        for category_keywords in cls.CATEGORY_KEYWORDS.values():
+            keywords.extend(category_keywords)
+        for tag in cls.TAG_COMPANIES + cls.TAG_MODELS + cls.TAG_TECHS:
+            keywords.append(tag.lower())
+        return keywords
+
+    def ruleset_version(self) -> str:
+        """키워드 / 신뢰도 / 태그 테이블 + 매칭 방식 + 요약 모델·프롬프트 + 코드 리비전 해시"""
+        rules = json.dumps([
+            self.IMPORTANCE_KEYWORDS, self.CATEGORY_KEYWORDS, self.SOURCE_CREDIBILITY,
+            self.TAG_COMPANIES, self.TAG_MODELS, self.TAG_TECHS,
+            self.matcher.version, self.RULESET_REVISION,
+            self.summarizer.version if self.summarizer is not None else None
+        ], ensure_ascii=False)
+        return hashlib.md5(rules.encode()).hexdigest()[:12]
+
     def analyze(self, articles: List[Dict]) -> List[Dict]:
-        """기사 목록 분석"""
+        """기사 목록 분석 (캐시에 있는 기사는 저장된 분석 결과 사용)"""
+        cached = self.cache.get_many(articles, self.ruleset) if self.cache is not None else {}
+        pending = [article for article in articles if article['id'] not in cached]
+
+        if self.workers > 1 and len(pending) >= self.parallel_min_size:
+            fresh = self._score_parallel(pending)
+        else:
+            fresh = self._score(pending)
+
+        # 요약: 새로 분석한 기사만 묶어서 요청. 발췌문 요약으로 대체된 기사는 캐시하지 않음.
+        if self.summarizer is not None and fresh:
+            summarized = self.summarizer.summarize(fresh)
+            finished = [article for article in fresh if article['id'] in summarized]
+        else:
+            finished = fresh
+        if self.cache is not None and finished:
+            self.cache.put_many(finished, self.ANALYSIS_FIELDS, self.ruleset)
+
+        # 캐시된 기사는 저장된 분석 필드를 제자리에서 채움 (병렬 채점 결과는 워커가 만든 새 레코드)
+        fresh_iter = iter(fresh)
         analyzed = []
         for article in articles:
-            analyzed_article = self._analyze_article(article)
-            analyzed.append(analyzed_article)
+            if article['id'] in cached:
+                article.update(cached[article['id']])
+                analyzed.append(article)
+            else:
+                analyzed.append(next(fresh_iter))
 
         # 중요도 순 정렬
         analyzed.sort(key=lambda x: x['importance_score'], reverse=True)
         return analyzed
 
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _score(self, articles: List[Dict]) -> List[Dict]:
+        """중요도 / 카테고리 / 태그 채점 (크기에 따라 일괄 / 기사별, 입력 순서 유지)"""
+        if len(articles) >= self.BATCH_MIN_SIZE:
+            return self.analyze_batch(articles)
+        return [self._analyze_article(article) for article in articles]
+
+    def _score_parallel(self, articles: List[Dict]) -> List[Dict]:
+        """연속 구간 샤드를 프로세스 풀에서 채점하고 샤드 순서대로 이어붙임 (직렬과 같은 결과 / 순서)"""
+        if self._pool is None:
+            # 워커마다 한 번만 매처 / 키워드 테이블을 만들고 이후 샤드에서 재사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.matcher.keywords,)
+            )
+        shard_size = max(self.BATCH_MIN_SIZE, -(-len(articles) // (self.workers * self.SHARDS_PER_WORKER)))
+        shards = [articles[i:i + shard_size] for i in range(0, len(articles), shard_size)]
+        return list(chain.from_iterable(self._pool.map(_score_shard, shards)))
+
+    def analyze_batch(self, articles: List[Dict]) -> List[Dict]:
+        """기사 × 키워드 히트 행렬로 중요도 / 카테고리 / 태그를 일괄 계산 (기사에 제자리에서 추가, 입력 순서 유지)
+
+        _analyze_article과 결과가 같도록 가중치는 IMPORTANCE_KEYWORDS 순서대로 열 단위로
+        누적하고, 카테고리는 첫 번째 최댓값, 태그는 후보 목록 순서로 앞 5개를 쓴다.
+        """
+        if not articles:
+            return []
+        hits = self._hit_matrix(articles)
+
+        # 중요도: 기본 5.0 + 키워드 가중치 (열 단위 누적) → 소스 신뢰도 혼합
+        importance_hits = hits[:, self._importance_columns].toarray()
+        scores = np.full(len(articles), 5.0)
+        for column, weight in enumerate(self._importance_weights):
+            scores += importance_hits[:, column] * weight
+        credibility = np.array(
+            [self.SOURCE_CREDIBILITY.get(article['source'], 5) for article in articles], dtype=float
+        )
+        scores = np.minimum(scores * 0.7 + credibility * 0.3, 10.0).tolist()
+
+        # 카테고리: 카테고리별 히트 수의 argmax (모두 0이면 기본값)
+        category_counts = (hits @ self._category_matrix).toarray()
+        best = category_counts.argmax(axis=1)
+        has_category = category_counts.max(axis=1) > 0
+
+        # 태그: 태그 후보 열만 잘라 히트 위치를 행별 구간으로 (행 → 열 순서라 후보 목록 순서 유지)
+        tag_rows, tag_cols = hits[:, self._tag_columns].toarray().nonzero()
+        bounds = np.searchsorted(tag_rows, np.arange(len(articles) + 1)).tolist()
+        tag_cols = tag_cols.tolist()
+        tag_name = self._tag_names.__getitem__
+
+        labels = [self._score_to_label(score) for score in scores]
+        categories = [
+            self._category_names[column] if found else '💭 Opinion'
+            for column, found in zip(best.tolist(), has_category.tolist())
+        ]
+
+        for i, article in enumerate(articles):
+            article.update(
+                importance=labels[i],
+                importance_score=round(scores[i], 1),
+                category=categories[i],
+                tags=list(map(tag_name, tag_cols[bounds[i]:bounds[i + 1]][:5])),
+                summary=ArticleSummarizer.fallback_summary(article),
+                key_points=[]
+            )
+        return articles
+
+    def _build_tables(self):
+        """키워드 테이블을 열 인덱스 / 가중치 배열 / 카테고리 소속 행렬로 변환"""
+        self._terms = list(dict.fromkeys(self.keywords()))
+        self._term_index = {term: i for i, term in enumerate(self._terms)}
+
+        self._importance_columns = np.array(
+            [self._term_index[kw] for kw in self.IMPORTANCE_KEYWORDS], dtype=np.intp
+        )
+        self._importance_weights = list(self.IMPORTANCE_KEYWORDS.values())
+
+        self._category_names = list(self.CATEGORY_KEYWORDS)
+        rows, cols = [], []
+        for c, keywords in enumerate(self.CATEGORY_KEYWORDS.values()):
+            for kw in keywords:
+                rows.append(self._term_index[kw])
+                cols.append(c)
+        self._category_matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(self._terms), len(self._category_names))
+        )
+
+        self._tag_names = self.TAG_COMPANIES + self.TAG_MODELS + self.TAG_TECHS
+        self._tag_columns = np.array(
+            [self._term_index[tag.lower()] for tag in self._tag_names], dtype=np.intp
+        )
+
+        # 매처 키워드 → 열 인덱스 (공유 매처의 분석에 쓰지 않는 키워드는 -1)
+        self._matcher_columns = {kw: self._term_index.get(kw, -1) for kw in self.matcher.keywords}
+
+    def _hit_matrix(self, articles: List[Dict]) -> sparse.csr_matrix:
+        """기사 × 키워드 희소 히트 행렬 (공유 매처 hits 중 분석 키워드만)"""
+        hit_sets = [self.matcher.article_hits(article) for article in articles]
+        lengths = np.fromiter(map(len, hit_sets), dtype=np.intp, count=len(hit_sets))
+        # 매처 키워드 → 열 인덱스 (분석에 쓰지 않는 키워드는 -1)
+        columns = np.fromiter(
+            map(self._matcher_columns.__getitem__, chain.from_iterable(hit_sets)),
+            dtype=np.intp, count=int(lengths.sum())
+        )
+        rows = np.repeat(np.arange(len(articles)), lengths)
+        keep = columns >= 0
+        return sparse.csr_matrix(
+            (np.ones(int(keep.sum()), dtype=np.int32), (rows[keep], columns[keep])),
+            shape=(len(articles), len(self._terms))
+        )
+
     def _analyze_article(self, article: Dict) -> Dict:
-        """개별 기사 분석"""
-        text = f"{article['title']} {article.get('excerpt', '')}".lower()
+        """개별 기사 분석 (기사에 분석 필드를 제자리에서 추가)"""
+        # 제목 + 발췌문 1회 스캔 결과를 중요도/카테고리/태그에서 공유
+        hits = self.matcher.article_hits(article)
 
         # 중요도 점수 계산
-        importance_score = self._calculate_importance(text, article['source'])
+        importance_score = self._calculate_importance(hits, article['source'])
         importance_label = self._score_to_label(importance_score)
 
         # 카테고리 분류
-        category = self._classify_category(text)
+        category = self._classify_category(hits)
 
         # 태그 추출
-        tags = self._extract_tags(text)
-
-        # 요약 생성 (실제로는 Claude API 호출)
-        summary = article.get('excerpt', '')[:200] + '...'
-
-        return {
-            **article,
-            'importance': importance_label,
-            'importance_score': round(importance_score, 1),
-            'category': category,
-            'tags': tags,
-            'summary': summary,
-            'key_points': []  # Claude가 생성
-        }
-
-    def _calculate_importance(self, text: str, source: str) -> float:
+        tags = self._extract_tags(hits)
+
+        # 기본 요약 (summarizer가 있으면 analyze()에서 Claude 요약으로 교체)
+        summary = ArticleSummarizer.fallback_summary(article)
+
+        article.update(
+            importance=importance_label,
+            importance_score=round(importance_score, 1),
+            category=category,
+            tags=tags,
+            summary=summary,
+            key_points=[]
+        )
+        return article
+
+    def _calculate_importance(self, hits: FrozenSet[str], source: str) -> float:
         """중요도 점수 계산"""
         score = 5.0  # 기본 점수
 
         # 키워드 기반 점수
         for keyword, weight in self.IMPORTANCE_KEYWORDS.items():
-            if keyword in text:
+            if keyword in hits:
                 score += weight
 
         # 소스 신뢰도 반영
@@ -112,39 +322,51 @@ class ContentAnalyzer:
         else:
             return '⚪ Low'
 
-    def _classify_category(self, text: str) -> str:
+    def _classify_category(self, hits: FrozenSet[str]) -> str:
         """카테고리 분류"""
         max_score = 0
         best_category = '💭 Opinion'  # 기본값
 
         for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text)
+            score = sum(1 for kw in keywords if kw in hits)
             if score > max_score:
                 max_score = score
                 best_category = category
 
         return best_category
 
-    def _extract_tags(self, text: str) -> List[str]:
+    def _extract_tags(self, hits: FrozenSet[str]) -> List[str]:
         """태그 추출"""
         tags = []
 
         # 회사명
-        companies = ['OpenAI', 'Anthropic', 'Google', 'Meta', 'Microsoft', 'DeepMind', 'Nvidia']
-        for company in companies:
-            if company.lower() in text:
+        for company in self.TAG_COMPANIES:
+            if company.lower() in hits:
                 tags.append(company)
 
         # 모델명
-        models = ['GPT', 'Claude', 'Gemini', 'Llama', 'Mistral', 'DALL-E', 'Midjourney', 'Stable Diffusion']
-        for model in models:
-            if model.lower() in text:
+        for model in self.TAG_MODELS:
+            if model.lower() in hits:
                 tags.append(model)
 
         # 기술
-        techs = ['LLM', 'RAG', 'Fine-tuning', 'Vision', 'Multimodal', 'Agents', 'API']
-        for tech in techs:
-            if tech.lower() in text:
+        for tech in self.TAG_TECHS:
+            if tech.lower() in hits:
                 tags.append(tech)
 
-        return list(set(tags))[:5]  # 최대 5개
+        # 후보 목록 순서로 최대 5개 (set 순서는 프로세스마다 달라 병렬 / 직렬 결과가 어긋남)
+        return tags[:5]
+
+
+# 프로세스 풀 워커 상태 (워커 시작 시 _init_worker가 한 번 생성)
+_worker_analyzer: Optional[ContentAnalyzer] = None
+
+
+def _init_worker(keywords: List[str]):
+    """워커 초기화: 부모와 같은 키워드로 매처 / 테이블 컴파일 (매처 버전이 같아 기사에 캐시된 hits 재사용)"""
+    global _worker_analyzer
+    _worker_analyzer = ContentAnalyzer(matcher=KeywordMatcher(keywords))
+
+
+def _score_shard(articles: List[Dict]) -> List[Dict]:
+    return _worker_analyzer._score(articles)
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set
+
+import anthropic
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleSummarizer:
+    """Claude 배치 요약: 여러 기사를 한 요청에 묶어 summary / key_points 생성
+
+    - 요청 하나에 batch_size건씩 번호를 붙여 보내고 JSON 배열로 받는다.
+      출력 토큰 상한은 배치 크기 × max_tokens_per_article로 잡고, max_tokens를 넘지 않도록 배치 크기를 줄인다.
+    - 시스템 프롬프트는 Haiku의 최소 캐시 길이보다 짧아 프롬프트 캐시를 걸지 않는다.
+    - 요청은 max_concurrency개까지 동시에 보낸다.
+    - 응답 JSON이 잘렸거나 깨졌으면 같은 요청을 다시 보내지 않고 읽을 수 있는 항목만 사용한다.
+    - 실패한 배치 / 응답에서 빠진 기사는 발췌문 앞부분으로 대체한다.
+    """
+
+    SYSTEM_PROMPT = """너는 AI/테크 뉴스 큐레이터다. 여러 개의 뉴스 기사를 받아 기사마다 한국어 요약과 핵심 포인트를 만든다.
+
+## 입력 형식
+기사마다 아래 블록이 반복된다.
+
+[번호]
+제목: ...
+출처: ...
+발췌: ...
+
+## 작성 규칙
+1. summary: 2~3문장, 300자 이내. 무엇이 발표/변경되었고 왜 중요한지 쓴다.
+2. key_points: 2~4개. 각 항목은 한 문장, 80자 이내. 수치/기업명/제품명을 우선한다.
+3. 발췌에 없는 사실을 추측해 덧붙이지 않는다. 정보가 부족하면 summary만 짧게 쓰고 key_points는 빈 배열로 둔다.
+4. 기업명/제품명/모델명은 원문 표기를 유지한다 (예: OpenAI, Claude, Gemini).
+5. 입력된 모든 번호에 대해 빠짐없이 한 항목씩 출력한다.
+
+## 출력 형식
+반드시 아래 JSON 배열만 출력한다 (코드블록/설명 없이).
+[{"n": 1, "summary": "...", "key_points": ["...", "..."]}, {"n": 2, "summary": "...", "key_points": []}]"""
+
+    # 재시도하지 않는 상태 코드 (요청 자체가 잘못됨 / 인증 / 크레딧)
+    PERMANENT_STATUS = {400, 401, 402, 403, 404, 413}
+
+    # 응답 JSON 배열 밖 여유 토큰
+    RESPONSE_OVERHEAD_TOKENS = 100
+
+    def __init__(self, config: Dict[str, Any], api_key: str = '', client: Optional[Any] = None):
+        self.model = config.get('model', 'claude-haiku-4-5-20251001')
+        self.max_concurrency = config.get('max_concurrency', 4)
+        self.max_tokens = config.get('max_tokens', 16000)
+        self.max_tokens_per_article = config.get('max_tokens_per_article', 600)
+        # 출력 상한 안에 모든 기사의 요약이 들어가는 배치 크기
+        fits = (self.max_tokens - self.RESPONSE_OVERHEAD_TOKENS) // self.max_tokens_per_article
+        self.batch_size = max(1, min(config.get('batch_size', 20), fits))
+        self.excerpt_chars = config.get('excerpt_chars', 500)
+        self.max_retries = config.get('max_retries', 3)
+        self.retry_delay = config.get('retry_delay', 2)
+
+        # 테스트 / 벤치마크에서는 messages.create만 구현한 가짜 클라이언트를 넘긴다
+        self.client = client or anthropic.Anthropic(api_key=api_key)
+        # 요약 식별자: 모델이나 프롬프트가 바뀌면 분석 캐시가 다시 요약하도록
+        self.version = hashlib.md5(f"{self.model}\n{self.SYSTEM_PROMPT}".encode()).hexdigest()[:12]
+
+        self.stats = {
+            'requests': 0, 'failed_requests': 0, 'summarized': 0, 'fallback': 0,
+            'truncated': 0, 'input_tokens': 0, 'output_tokens': 0
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def fill_size(self) -> int:
+        """동시 요청 한 번으로 요약할 수 있는 기사 수 (스트리밍 수집에서 피드를 모으는 단위)"""
+        return self.batch_size * self.max_concurrency
+
+    @staticmethod
+    def fallback_summary(article: Dict) -> str:
+        """요약 실패 시 사용하는 발췌문 앞부분"""
+        return article.get('excerpt', '')[:200] + '...'
+
+    def summarize(self, articles: List[Dict]) -> Set[str]:
+        """기사의 summary / key_points를 제자리에서 채움. Claude가 요약한 기사 ID 집합 반환."""
+        batches = [articles[i:i + self.batch_size] for i in range(0, len(articles), self.batch_size)]
+        if not batches:
+            return set()
+
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._summarize_batch, batches))
+
+        summarized = set()
+        for batch, items in zip(batches, results):
+            for n, article in enumerate(batch, 1):
+                item = items.get(n)
+                if item:
+                    article['summary'] = item['summary']
+                    article['key_points'] = item['key_points']
+                    summarized.add(article['id'])
+                else:
+                    article['summary'] = self.fallback_summary(article)
+                    article['key_points'] = []
+
+        self.stats['summarized'] += len(summarized)
+        self.stats['fallback'] += len(articles) - len(summarized)
+        return summarized
+
+    def _summarize_batch(self, batch: List[Dict]) -> Dict[int, Dict]:
+        """배치 1건 요청 (일시적 오류는 지수 백오프 재시도). 실패하면 빈 결과."""
+        prompt = self._build_user_prompt(batch)
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self._count('requests')
+                response = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=self.RESPONSE_OVERHEAD_TOKENS + self.max_tokens_per_article * len(batch),
+                    system=self.SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                break
+
+            except anthropic.APIStatusError as e:
+                self._count('failed_requests')
+                if e.status_code in self.PERMANENT_STATUS or attempt == self.max_retries:
+                    logger.warning(f"  ⚠️ 요약 실패 ({len(batch)}건, {e.status_code}): {e.message}")
+                    return {}
+
+            except Exception as e:
+                self._count('failed_requests')
+                if attempt == self.max_retries:
+                    logger.warning(f"  ⚠️ 요약 실패 ({len(batch)}건): {e}")
+                    return {}
+
+            time.sleep(self.retry_delay * 2 ** (attempt - 1))
+        else:
+            return {}
+
+        # 응답 형식 오류는 재시도해도 같은 비용이 들므로 읽을 수 있는 항목만 사용
+        self._record_usage(response.usage)
+        if getattr(response, 'stop_reason', None) == 'max_tokens':
+            self._count('truncated')
+            logger.warning(f"  ⚠️ 요약 응답이 출력 토큰 상한에서 잘림 ({len(batch)}건)")
+        return self._parse_response(response.content[0].text, len(batch))
+
+    def _build_user_prompt(self, batch: List[Dict]) -> str:
+        """번호 붙인 기사 블록 (ID 대신 번호를 써서 토큰 절약)"""
+        blocks = [
+            f"[{n}]\n제목: {article.get('title', '')}\n출처: {article.get('source', '')}\n"
+            f"발췌: {article.get('excerpt', '')[:self.excerpt_chars]}"
+            for n, article in enumerate(batch, 1)
+        ]
+        return f"아래 {len(batch)}개 기사를 요약해주세요.\n\n" + '\n\n'.join(blocks)
+
+    def _parse_response(self, text: str, size: int) -> Dict[int, Dict]:
+        """JSON 배열 응답 → {번호: {summary, key_points}} (형식이 틀린 항목은 제외)
+
+        배열이 중간에 잘렸거나 깨졌으면 그 앞까지 온전한 항목만 읽는다.
+        """
+        text = text.strip()
+        # 코드블록 감싸진 경우 처리
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[4:]
+            text = text.strip()
+
+        items = {}
+        for item in self._json_items(text):
+            if not isinstance(item, dict):
+                continue
+            n = item.get('n')
+            summary = item.get('summary')
+            if not isinstance(n, int) or not 1 <= n <= size or not isinstance(summary, str) or not summary:
+                continue
+            key_points = item.get('key_points') or []
+            items[n] = {
+                'summary': summary.strip(),
+                'key_points': [str(point).strip() for point in key_points if str(point).strip()]
+            }
+        return items
+
+    @staticmethod
+    def _json_items(text: str) -> List[Any]:
+        """JSON 배열의 항목 목록. 파싱에 실패하면 첫 오류 위치 앞까지의 항목."""
+        try:
+            parsed = json.loads(text)
+            return parsed if isinstance(parsed, list) else []
+        except ValueError:
+            pass
+
+        decoder = json.JSONDecoder()
+        items = []
+        position = text.find('[') + 1
+        if position == 0:
+            return items
+        while True:
+            while position < len(text) and text[position] in ' \t\r\n,':
+                position += 1
+            if position >= len(text) or text[position] == ']':
+                return items
+            try:
+                item, position = decoder.raw_decode(text, position)
+            except ValueError:
+                return items
+            items.append(item)
+
+    def _record_usage(self, usage: Any):
+        self._count('input_tokens', getattr(usage, 'input_tokens', 0) or 0)
+        self._count('output_tokens', getattr(usage, 'output_tokens', 0) or 0)
+
+    def _count(self, key: str, value: int = 1):
+        with self._lock:
+            self.stats[key] += value
@@ -1,3 +1,4 @@
 from .notion_archiver import NotionArchiver
+from .sinks import ArchiveSink, JsonlSink, ParquetSink, SQLiteSink, build_sinks
 
-__all__ = ['NotionArchiver']
+__all__ = ['NotionArchiver', 'ArchiveSink', 'JsonlSink', 'SQLiteSink', 'ParquetSink', 'build_sinks']
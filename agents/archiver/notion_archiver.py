@@ -1,46 +1,96 @@
 import requests
-from datetime import datetime
-from typing import Dict, Any, List
-import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set
+
+from agents.archiver.sinks import ArchiveSink, build_sinks
+from agents.collector.seen_index import SeenIndex
+from agents.notion.client import NotionAPIError, NotionClient, NotionPageWriter, is_transient
+from agents.notion.mirror import NotionMirror
+from agents.notion.outbox import NotionOutbox
+from agents.notion.schema import NotionSchemaCache
 
 
 class NotionArchiver:
-    """노션 데이터베이스에 뉴스 저장"""
+    """노션 데이터베이스 + 로컬 저장소(JSONL / SQLite / Parquet)에 뉴스 저장
 
-    BASE_URL = "https://api.notion.com/v1"
+    로컬 저장소는 분석된 기사 전체를 받아 flush()에서 한 번에 쓰고,
+    노션에는 notion.yaml의 sinks.notion 설정(사용 여부, 중요도 필터)을 통과한 기사만 페이지로 만든다.
+    """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], seen_index: Optional[SeenIndex] = None,
+                 client: Optional[NotionClient] = None, mirror: Optional[NotionMirror] = None,
+                 outbox: Optional[NotionOutbox] = None):
         self.token = config['integration_token']
         self.database_id = config['database_id']
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
+        # 저장(또는 노션에 이미 존재)이 확인된 기사 ID를 기록해 다음 실행에서 제외
+        self.seen_index = seen_index
+        # 커넥션 풀 + 공유 속도 제한 클라이언트 (orchestrator가 post_archiver와 같은 인스턴스를 넘김)
+        self.client = client or NotionClient(self.token)
+        # 페이지 생성 동시 실행 수 (중복 체크는 생성 전에 순차로 끝냄)
+        self.writer = NotionPageWriter(config.get('writer', {}).get('max_workers', 4))
+        # 저장소: 로컬 일괄 저장소 + 노션(선택, 중요도 필터)
+        sinks_config = config.get('sinks', {})
+        self.sinks: List[ArchiveSink] = build_sinks(sinks_config, 'news')
+        notion_sink = sinks_config.get('notion', {})
+        self.notion_enabled = notion_sink.get('enabled', True)
+        self.notion_importance = set(notion_sink.get('importance', []))
+
+        # DB 스키마 캐시: 전송 전에 payload를 스키마 / 요청 제한에 맞춤
+        self.schemas = NotionSchemaCache(self.client, config.get('schema', {}).get('ttl_seconds', 3600))
+
+        # 노션 DB 로컬 미러: 있으면 델타 동기화 후 미러의 전체 URL로 중복 확인, 저장 결과도 기록
+        self.mirror = mirror
+        self.mirror_sync: Optional[Dict[str, Any]] = None
+        # 페이지 payload를 전송 전에 기록해 두고 실패분은 drain()에서 재전송
+        self.outbox = outbox
+
+        # 중복 체크: 최근 window_days 동안 저장된 페이지 URL을 한 번에 조회해 두고 집합으로 확인
+        # (미러가 없거나 동기화에 실패한 경우)
+        duplicate_config = config.get('duplicate_check', {})
+        self.prefetch = duplicate_config.get('prefetch', True)
+        self.window_days = duplicate_config.get('window_days', 7)
+        self._archived_urls: Optional[Set[str]] = None
+        self._window_start: Optional[datetime] = None
+        self.query_stats = {'sync_queries': 0, 'prefetch_queries': 0, 'fallback_queries': 0, 'set_lookups': 0}
 
     def archive(self, articles: List[Dict]) -> Dict[str, Any]:
-        """기사 목록을 노션에 저장"""
+        """기사 목록을 로컬 저장소(flush 때 일괄 저장)와 노션에 저장
+
+        success / skipped / failed는 노션 기준, filtered는 노션 필터(또는 노션 미사용)로 로컬에만 저장한 기사 수.
+        """
         results = {
             'success': 0,
             'skipped': 0,
             'failed': 0,
+            'filtered': 0,
             'errors': []
         }
+        archived_ids = []
+        query_stats_before = dict(self.query_stats)
+
+        for sink in self.sinks:
+            sink.add(articles)
 
+        notion_articles = []
         for article in articles:
+            if self._to_notion(article):
+                notion_articles.append(article)
+            else:
+                results['filtered'] += 1
+                archived_ids.extend(self._archived_ids(article))
+
+        if notion_articles:
+            self._prepare_duplicate_check()
+
+        # 중복 체크 (순차)
+        to_create = []
+        for article in notion_articles:
             try:
-                # 중복 체크
-                if self._is_duplicate(article['url']):
+                if self._check_duplicate(article):
                     results['skipped'] += 1
-                    continue
-
-                # 페이지 생성
-                self._create_page(article)
-                results['success'] += 1
-
-                # Rate limit 방지
-                time.sleep(0.5)
-
+                    archived_ids.extend(self._archived_ids(article))
+                else:
+                    to_create.append(article)
             except Exception as e:
                 results['failed'] += 1
                 results['errors'].append({
@@ -48,12 +98,177 @@ class NotionArchiver:
                     'error': str(e)
                 })
 
+        # 페이지 생성 (동시 실행, 결과는 기사 순서대로)
+        for article, outcome in zip(to_create, self.writer.run(self._create_page, to_create)):
+            if isinstance(outcome, Exception):
+                results['failed'] += 1
+                results['errors'].append({
+                    'title': article['title'],
+                    'error': str(outcome)
+                })
+                continue
+
+            results['success'] += 1
+            archived_ids.extend(self._archived_ids(article))
+            self._record_created(article['url'], outcome)
+
+        if self.seen_index is not None and archived_ids:
+            self.seen_index.mark(archived_ids)
+
+        # 이번 호출의 조회 수 (기사별 조회 대비 절약한 query 호출 수)
+        calls = {key: self.query_stats[key] - query_stats_before[key] for key in self.query_stats}
+        results['duplicate_check'] = {
+            'sync_queries': calls['sync_queries'],
+            'prefetch_queries': calls['prefetch_queries'],
+            'fallback_queries': calls['fallback_queries'],
+            'query_calls_saved': calls['set_lookups'] - calls['sync_queries'] - calls['prefetch_queries']
+        }
+
         return results
 
+    def flush(self) -> Dict[str, int]:
+        """로컬 저장소에 모아 둔 기사를 저장소마다 한 번에 쓰기. 저장소별 기록 수 반환."""
+        return {sink.name: sink.flush() for sink in self.sinks}
+
+    def _to_notion(self, article: Dict) -> bool:
+        """노션 페이지로 만들 기사인지 (노션 사용 + 중요도 필터)"""
+        if not self.notion_enabled:
+            return False
+        return not self.notion_importance or article.get('importance') in self.notion_importance
+
+    def drain(self) -> Dict[str, Any]:
+        """outbox에 남은 뉴스 페이지 payload 재전송 (다시 수집 / 분석하지 않음)
+
+        응답만 유실되고 페이지는 이미 만들어졌을 수 있으므로 URL 중복 확인 후 전송한다.
+        """
+        results = {'success': 0, 'skipped': 0, 'failed': 0, 'errors': []}
+        if self.outbox is None or not self.notion_enabled:
+            return results
+        entries = self.outbox.pending('news', self.database_id)
+        if not entries:
+            return results
+
+        self._prepare_duplicate_check()
+        archived_ids = []
+        to_send = []
+        for entry in entries:
+            meta = entry['meta']
+            try:
+                if self._check_duplicate({'url': meta['url'], 'published_at': meta.get('published_at')}):
+                    self.outbox.ack(entry['id'])
+                    results['skipped'] += 1
+                    archived_ids.extend(meta.get('ids', []))
+                else:
+                    to_send.append(entry)
+            except Exception as e:
+                results['failed'] += 1
+                results['errors'].append({'title': meta.get('title', ''), 'error': str(e)})
+
+        for entry, outcome in zip(to_send, self.writer.run(self._replay, to_send)):
+            meta = entry['meta']
+            if isinstance(outcome, Exception):
+                results['failed'] += 1
+                results['errors'].append({'title': meta.get('title', ''), 'error': str(outcome)})
+                continue
+
+            results['success'] += 1
+            archived_ids.extend(meta.get('ids', []))
+            self._record_created(meta['url'], outcome)
+
+        if self.seen_index is not None and archived_ids:
+            self.seen_index.mark(archived_ids)
+
+        return results
+
+    def _prepare_duplicate_check(self):
+        """중복 확인용 URL 집합 준비 (미러 동기화 → 실패 시 최근 구간 prefetch, 인스턴스당 1회)"""
+        if self._archived_urls is not None:
+            return
+        if self.mirror is not None:
+            self._sync_mirror()
+        if self._archived_urls is None and self.prefetch:
+            self._prefetch_archived_urls()
+
+    def _record_created(self, url: str, page: Dict):
+        """생성된 페이지를 중복 확인 집합 / 미러에 반영"""
+        if self._archived_urls is not None:
+            self._archived_urls.add(url)
+        if self.mirror is not None:
+            self.mirror.record(self.database_id, [page])
+
+    def _sync_mirror(self):
+        """미러 델타 동기화 후 미러의 URL 전체를 중복 확인 집합으로 사용 (조회 구간 제한 없음)"""
+        try:
+            self.mirror_sync = self.mirror.sync(self.client, self.database_id)
+        except (requests.RequestException, RuntimeError) as e:
+            print(f"   ⚠️ Notion mirror sync failed, falling back to prefetch: {e}")
+            return
+        self.query_stats['sync_queries'] += self.mirror_sync['queries']
+        self._archived_urls = self.mirror.urls(self.database_id)
+        self._window_start = None
+
+    def _prefetch_archived_urls(self):
+        """Archived 날짜가 window_days 이내인 페이지 URL을 페이지네이션 조회 1회로 수집"""
+        window_start = datetime.utcnow() - timedelta(days=self.window_days)
+        payload = {
+            "filter": {
+                "property": "Archived",
+                "date": {"on_or_after": window_start.isoformat()}
+            },
+            "page_size": 100
+        }
+
+        urls = set()
+        while True:
+            self.query_stats['prefetch_queries'] += 1
+            try:
+                response = self.client.query_database(self.database_id, payload)
+            except requests.RequestException as e:
+                print(f"   ⚠️ Duplicate prefetch failed, checking each article: {e}")
+                return
+            if response.status_code != 200:
+                print(f"   ⚠️ Duplicate prefetch failed ({response.status_code}), checking each article")
+                return
+
+            data = response.json()
+            for page in data.get('results', []):
+                url = page.get('properties', {}).get('URL', {}).get('url')
+                if url:
+                    urls.add(url)
+            if not data.get('has_more'):
+                break
+            payload['start_cursor'] = data['next_cursor']
+
+        self._archived_urls = urls
+        self._window_start = window_start
+
+    def _check_duplicate(self, article: Dict) -> bool:
+        """URL 집합으로 중복 확인. 조회 구간 밖에 저장됐을 수 있는 기사만 기사별 조회.
+
+        기사는 발행 이후에 저장되므로 발행 시각이 조회 구간 시작 이후면 집합에 없는 URL은
+        중복이 아니다. 발행 시각이 없거나 구간 시작보다 오래된 기사는 기존 방식으로 조회한다.
+        미러 집합(_window_start가 None)은 DB 전체를 담고 있어 조회가 필요 없다.
+        """
+        if self._archived_urls is not None:
+            if article['url'] in self._archived_urls:
+                self.query_stats['set_lookups'] += 1
+                return True
+            published_at = article.get('published_at')
+            if self._window_start is None or (
+                published_at and datetime.fromisoformat(published_at) >= self._window_start
+            ):
+                self.query_stats['set_lookups'] += 1
+                return False
+
+        self.query_stats['fallback_queries'] += 1
+        return self._is_duplicate(article['url'])
+
+    def _archived_ids(self, article: Dict) -> List[str]:
+        """기사 ID + 같은 스토리로 묶인 다른 출처 기사 ID"""
+        return [article['id']] + [related['id'] for related in article.get('related_articles', [])]
+
     def _is_duplicate(self, url: str) -> bool:
         """URL 기반 중복 체크"""
-        query_url = f"{self.BASE_URL}/databases/{self.database_id}/query"
-
         payload = {
             "filter": {
                 "property": "URL",
@@ -63,7 +278,7 @@ class NotionArchiver:
             }
         }
 
-        response = requests.post(query_url, headers=self.headers, json=payload, timeout=30)
+        response = self.client.query_database(self.database_id, payload)
 
         if response.status_code == 200:
             results = response.json().get('results', [])
@@ -72,9 +287,51 @@ class NotionArchiver:
         return False
 
     def _create_page(self, article: Dict) -> Dict:
-        """노션 페이지 생성"""
-        url = f"{self.BASE_URL}/pages"
+        """노션 페이지 생성 (outbox에 payload를 기록한 뒤 전송)"""
+        payload = self._page_payload(article)
+        entry_id = None
+        if self.outbox is not None:
+            entry_id = self.outbox.enqueue('news', self.database_id, payload, {
+                'url': article['url'],
+                'title': article['title'],
+                'published_at': article.get('published_at'),
+                'ids': self._archived_ids(article)
+            }, key=article['url'])
+        return self._send(payload, entry_id)
+
+    def _replay(self, entry: Dict) -> Dict:
+        return self._send(entry['payload'], entry['id'])
+
+    def _send(self, payload: Dict, entry_id: Optional[int] = None) -> Dict:
+        """payload를 검증 / 정규화해 페이지 생성. 200이면 outbox 항목 ack, 실패하면 실패 기록 후 예외.
+
+        rate_limiter가 노션이 처리하지 않은 것이 확실한 오류(429 / 연결 수립 실패)만 재시도한다.
+        응답을 받지 못한 요청(5xx / 응답 타임아웃)은 페이지가 이미 생겼을 수 있으므로 outbox에 남기고,
+        다음 drain이 URL을 확인한 뒤 재전송한다.
+        """
+        try:
+            page_payload, overflow = self.schemas.normalize(self.database_id, payload)
+            response = self.client.create_page(page_payload)
+            if response.status_code != 200:
+                raise NotionAPIError.from_response(response)
+        except Exception as e:
+            if entry_id is not None:
+                self.outbox.fail(entry_id, str(e), permanent=not is_transient(e))
+            raise
+
+        if entry_id is not None:
+            self.outbox.ack(entry_id)
+        page = response.json()
+        if overflow:
+            # 페이지는 생성됐으므로 블록 추가 실패는 기록만 한다
+            try:
+                self.client.append_block_children(page['id'], overflow)
+            except (NotionAPIError, requests.RequestException) as e:
+                print(f"   ⚠️ Failed to append {len(overflow)} blocks to {page.get('url', page['id'])}: {e}")
+        return page
 
+    def _page_payload(self, article: Dict) -> Dict:
+        """페이지 생성 요청 payload (속성 + 본문 블록)"""
         # 속성 매핑
         properties = {
             "이름": {
@@ -118,19 +375,12 @@ class NotionArchiver:
         # 본문 블록 생성
         children = self._create_content_blocks(article)
 
-        payload = {
+        return {
             "parent": {"database_id": self.database_id},
             "properties": properties,
             "children": children
         }
 
-        response = requests.post(url, headers=self.headers, json=payload, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to create page: {response.text}")
-
-        return response.json()
-
     def _create_content_blocks(self, article: Dict) -> List[Dict]:
         """페이지 본문 블록 생성"""
         blocks = []
@@ -171,6 +421,25 @@ class NotionArchiver:
                     }
                 })
 
+        # 같은 스토리를 다룬 다른 출처 (클러스터링 결과)
+        if article.get('related_articles'):
+            blocks.append({
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {
+                    "rich_text": [{"text": {"content": "📰 Also Covered By"}}]
+                }
+            })
+
+            for related in article['related_articles']:
+                blocks.append({
+                    "object": "block",
+                    "type": "bulleted_list_item",
+                    "bulleted_list_item": {
+                        "rich_text": [{"text": {"content": related['source'], "link": {"url": related['url']}}}]
+                    }
+                })
+
         # 원문 링크
         blocks.append({
             "object": "block",
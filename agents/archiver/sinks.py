@@ -0,0 +1,146 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class ArchiveSink(ABC):
+    """아카이브 저장소 인터페이스
+
+    archiver가 archive()마다 add()로 레코드를 넘기고, 저장 단계(또는 백필 구간)가 끝날 때
+    flush()로 모아 둔 레코드를 한 번에 쓴다. 레코드는 flush 시점에 일반 dict로 변환한다.
+    """
+
+    name = 'sink'
+
+    def __init__(self):
+        self._pending: List[Any] = []
+
+    def add(self, records: List[Any]):
+        self._pending.extend(records)
+
+    def flush(self) -> int:
+        """모아 둔 레코드를 한 번에 쓰고 쓴 개수 반환"""
+        if not self._pending:
+            return 0
+        archived_at = datetime.utcnow().isoformat()
+        rows = [{**self._plain(record), 'archived_at': archived_at} for record in self._pending]
+        self._write(rows)
+        self._pending = []
+        return len(rows)
+
+    @abstractmethod
+    def _write(self, rows: List[Dict[str, Any]]):
+        """flush된 레코드(일반 dict) 목록을 한 번에 쓰기"""
+
+    @staticmethod
+    def _plain(record: Any) -> Dict[str, Any]:
+        """Article / dict → 파생 필드(_로 시작)를 뺀 일반 dict"""
+        data = record.to_dict() if hasattr(record, 'to_dict') else record
+        return {key: value for key, value in data.items() if not key.startswith('_')}
+
+
+class JsonlSink(ArchiveSink):
+    """추가 전용 JSONL 파일 (레코드당 한 줄)"""
+
+    name = 'jsonl'
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in rows))
+
+
+class SQLiteSink(ArchiveSink):
+    """SQLite 테이블 (필드별 컬럼, 리스트 / dict는 JSON 문자열)
+
+    새 필드가 나오면 컬럼을 추가한다. key가 있으면 같은 key의 행을 덮어쓴다.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str, table: str, key: Optional[str] = None):
+        super().__init__()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.table = table
+        self.key = key
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        conn = sqlite3.connect(self.path)
+        try:
+            key_column = f'"{self.key}" TEXT PRIMARY KEY' if self.key else 'seq INTEGER PRIMARY KEY'
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" ({key_column})')
+            existing = {row[1] for row in conn.execute(f'PRAGMA table_info("{self.table}")')}
+            for column in columns:
+                if column not in existing:
+                    conn.execute(f'ALTER TABLE "{self.table}" ADD COLUMN "{column}"')
+
+            names = ', '.join(f'"{column}"' for column in columns)
+            placeholders = ', '.join('?' * len(columns))
+            verb = 'INSERT OR REPLACE' if self.key else 'INSERT'
+            conn.executemany(
+                f'{verb} INTO "{self.table}" ({names}) VALUES ({placeholders})',
+                [[self._value(row.get(column)) for column in columns] for row in rows]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _value(value: Any) -> Any:
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return value
+
+
+class ParquetSink(ArchiveSink):
+    """컬럼 기반 Parquet 파일 (실행마다 파일 1개: {directory}/{prefix}-{시각}.parquet)"""
+
+    name = 'parquet'
+
+    def __init__(self, directory: str, prefix: str):
+        super().__init__()
+        self.directory = Path(directory)
+        self.prefix = prefix
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        # pyarrow는 Parquet 저장을 켠 경우에만 필요
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            table = pa.Table.from_pylist(rows)
+        except (pa.ArrowException, TypeError):
+            # 행마다 타입이 다른 중첩 필드는 JSON 문자열로 저장
+            table = pa.Table.from_pylist([
+                {key: SQLiteSink._value(value) for key, value in row.items()} for row in rows
+            ])
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{self.prefix}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}.parquet"
+        pq.write_table(table, path)
+
+
+def build_sinks(config: Dict[str, Any], kind: str) -> List[ArchiveSink]:
+    """notion.yaml의 sinks.local 설정으로 로컬 저장소 생성 (kind: 'news' | 'posts')"""
+    local = config.get('local', {})
+    directory = Path(local.get('dir', 'data/archive'))
+    sinks = []
+    for fmt in local.get('formats', []):
+        if fmt == 'jsonl':
+            sinks.append(JsonlSink(str(directory / f"{kind}.jsonl")))
+        elif fmt == 'sqlite':
+            sinks.append(SQLiteSink(str(directory / 'archive.sqlite'), kind, key='id' if kind == 'news' else None))
+        elif fmt == 'parquet':
+            sinks.append(ParquetSink(str(directory / kind), kind))
+        else:
+            raise ValueError(f"Unknown archive sink format: {fmt}")
+    return sinks
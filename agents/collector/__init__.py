@@ -1,3 +1,5 @@
 from .rss_collector import RSSCollector
+from .seen_index import SeenIndex
+from .feed_health import FeedHealthStore
 
-__all__ = ['RSSCollector']
+__all__ = ['RSSCollector', 'SeenIndex', 'FeedHealthStore']
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+
+class AsyncFeedFetcher:
+    """asyncio 기반 HTTP 수집 엔진 (커넥션 풀 + 호스트별 동시성 제한)
+
+    하나의 httpx.AsyncClient를 모든 피드가 공유하고, 같은 호스트로의
+    동시 요청 수는 max_per_host로 제한한다. gzip/brotli 압축 해제는
+    httpx가 처리하므로 응답 본문은 그대로 feedparser에 넘기면 된다.
+    """
+
+    def __init__(self, max_connections: int = 50, max_per_host: int = 4,
+                 user_agent: str = ''):
+        self.max_per_host = max_per_host
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            headers={'User-Agent': user_agent} if user_agent else None,
+            follow_redirects=True
+        )
+
+    async def __aenter__(self) -> 'AsyncFeedFetcher':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 세마포어 (이벤트 루프 안에서만 호출)"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  connect_timeout: float = 10, read_timeout: float = 30) -> httpx.Response:
+        """GET 요청. 본문까지 모두 읽은 응답 반환."""
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        async with self._semaphore(url):
+            return await self._client.get(url, headers=headers, timeout=timeout)
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+class FeedCache:
+    """피드별 HTTP 캐시 (ETag / Last-Modified + 원문 + 파싱된 기사)
+
+    피드 URL마다 메타데이터(<key>.json)와 원문(<key>.xml)을 저장한다.
+    다음 실행 때 If-None-Match / If-Modified-Since 헤더를 보내고,
+    304 응답이면 저장해 둔 기사 목록을 그대로 재사용해 파싱을 건너뛴다.
+    기사 목록은 저장 당시 cutoff 이후 기사만 담으므로, 더 이른 cutoff로 요청하면
+    수집기가 원문을 다시 파싱한다 (cutoff 필드).
+    """
+
+    def __init__(self, cache_dir: str = 'data/cache/feeds', fresh_minutes: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 마지막 수집 후 이 시간 이내면 네트워크 요청 없이 캐시 사용
+        self.fresh_minutes = fresh_minutes
+
+    def _key(self, url: str) -> str:
+        return hashlib.md5(url.encode()).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.json"
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.xml"
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """캐시 엔트리 로드. 없거나 손상된 경우 None."""
+        path = self._meta_path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        """저장된 피드 원문 로드"""
+        path = self._body_path(url)
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """fresh_minutes 이내에 수집된 엔트리인지 확인"""
+        if not entry or self.fresh_minutes <= 0:
+            return False
+        fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        return datetime.utcnow() - fetched_at < timedelta(minutes=self.fresh_minutes)
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """조건부 GET 요청 헤더 생성"""
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              body: bytes, articles: List[Dict], cutoff: Optional[datetime] = None):
+        """200 응답 결과 저장 (cutoff: 기사 목록을 만들 때 적용한 시간 필터)"""
+        self._write_atomic(self._body_path(url), body)
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.utcnow().isoformat(),
+            'cutoff': cutoff.isoformat() if cutoff else None,
+            'articles': articles
+        }
+        self._write_atomic(
+            self._meta_path(url),
+            json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        )
+
+    def covers(self, entry: Dict[str, Any], cutoff: datetime) -> bool:
+        """저장된 기사 목록이 cutoff 이후 기사를 모두 담고 있는지 (cutoff가 없던 이전 캐시는 False)"""
+        stored = entry.get('cutoff', '')
+        return bool(stored) and datetime.fromisoformat(stored) <= cutoff
+
+    def replace_articles(self, url: str, entry: Dict[str, Any], articles: List[Dict], cutoff: datetime):
+        """원문을 다시 파싱한 기사 목록으로 교체 (더 이른 cutoff로 요청한 경우)"""
+        entry['articles'] = articles
+        entry['cutoff'] = cutoff.isoformat()
+        self._write_atomic(
+            self._meta_path(url),
+            json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        )
+
+    def touch(self, url: str, entry: Dict[str, Any]):
+        """304 응답 시 수집 시각만 갱신"""
+        entry['fetched_at'] = datetime.utcnow().isoformat()
+        self._write_atomic(
+            self._meta_path(url),
+            json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        )
+
+    def _write_atomic(self, path: Path, data: bytes):
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
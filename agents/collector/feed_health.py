@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class FeedHealthStore:
+    """피드별 수집 이력 (지연 시간, 크기, 엔트리 수, 연속 실패, 발행 주기)
+
+    data/cache/feed_health.json에 저장하고, 다음 실행의 수집 계획에 사용한다.
+      - 연속 실패한 피드는 지수 백오프로 재시도 간격을 늘린다.
+      - 드물게 발행하는 피드는 관측된 발행 주기의 절반이 지나기 전까지 건너뛴다.
+      - priority가 높고 응답이 빠른 피드를 먼저 요청한다.
+    """
+
+    PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+    # 지연 시간 / 발행 주기 지수 이동 평균 계수
+    EWMA_ALPHA = 0.3
+
+    def __init__(self, path: str = 'data/cache/feed_health.json',
+                 backoff_base_minutes: int = 60, backoff_max_hours: int = 48,
+                 adaptive_polling: bool = True, rare_interval_hours: int = 48,
+                 max_catchup_hours: Optional[float] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.backoff_base_minutes = backoff_base_minutes
+        self.backoff_max_hours = backoff_max_hours
+        self.adaptive_polling = adaptive_polling
+        # 평균 발행 간격이 이 값 이상인 피드만 건너뛰기 대상
+        self.rare_interval_hours = rare_interval_hours
+        # 마지막 성공 시점부터 다시 수집할 때 되돌아갈 최대 시간 (None이면 제한 없음)
+        self.max_catchup_hours = max_catchup_hours
+
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._feeds = json.load(f)
+            except (OSError, ValueError):
+                self._feeds = {}
+
+    def get(self, url: str) -> Dict[str, Any]:
+        return self._feeds.get(url, {})
+
+    def record_success(self, feed_config: Dict, latency: float, size: int,
+                       entries: int, published: List[datetime]):
+        """수집 성공 기록 (304 포함)"""
+        now = datetime.utcnow()
+        with self._lock:
+            stats = self._feeds.setdefault(feed_config['url'], {})
+            stats['name'] = feed_config['name']
+            stats['last_attempt'] = now.isoformat()
+            stats['last_success'] = now.isoformat()
+            stats['latency'] = self._ewma(stats.get('latency'), latency)
+            stats['bytes'] = size
+            stats['entries'] = entries
+            stats['error_streak'] = 0
+            stats['last_error'] = None
+
+            # 발행 주기: 엔트리 발행 시각 간 평균 간격 (시간)
+            published = sorted(published, reverse=True)
+            if len(published) >= 2:
+                span_hours = (published[0] - published[-1]).total_seconds() / 3600
+                interval = span_hours / (len(published) - 1)
+                stats['publish_interval_hours'] = self._ewma(stats.get('publish_interval_hours'), interval)
+            if published:
+                stats['last_published'] = published[0].isoformat()
+
+    def record_failure(self, feed_config: Dict, error: Exception):
+        """수집 실패 기록"""
+        with self._lock:
+            stats = self._feeds.setdefault(feed_config['url'], {})
+            stats['name'] = feed_config['name']
+            stats['last_attempt'] = datetime.utcnow().isoformat()
+            stats['error_streak'] = stats.get('error_streak', 0) + 1
+            stats['last_error'] = ' '.join((str(error) or type(error).__name__).split())[:200]
+
+    def is_due(self, feed_config: Dict, now: Optional[datetime] = None) -> Tuple[bool, str]:
+        """이번 실행에서 수집할지 여부와 건너뛰는 이유"""
+        now = now or datetime.utcnow()
+        stats = self.get(feed_config['url'])
+        if not stats:
+            return True, ''
+
+        # 연속 실패 → 지수 백오프
+        streak = stats.get('error_streak', 0)
+        if streak and stats.get('last_attempt'):
+            backoff = min(
+                timedelta(minutes=self.backoff_base_minutes * 2 ** (streak - 1)),
+                timedelta(hours=self.backoff_max_hours)
+            )
+            retry_at = datetime.fromisoformat(stats['last_attempt']) + backoff
+            if now < retry_at:
+                return False, f"backoff until {retry_at.strftime('%m-%d %H:%M')} ({streak} errors)"
+
+        # 드물게 발행하는 피드 → 발행 주기의 절반이 지나야 다시 확인
+        interval = stats.get('publish_interval_hours')
+        if (self.adaptive_polling and interval and interval >= self.rare_interval_hours
+                and stats.get('last_success')):
+            due_at = datetime.fromisoformat(stats['last_success']) + timedelta(hours=interval / 2)
+            if now < due_at:
+                return False, f"rarely publishes (every {interval:.0f}h), due {due_at.strftime('%m-%d %H:%M')}"
+
+        return True, ''
+
+    def feed_cutoff(self, feed_config: Dict, cutoff_time: datetime,
+                    now: Optional[datetime] = None) -> datetime:
+        """건너뛰었거나 실패했던 피드는 마지막 성공 시점부터 다시 수집 (최대 max_catchup_hours 전까지)"""
+        last_success = self.get(feed_config['url']).get('last_success')
+        if not last_success:
+            return cutoff_time
+        since = datetime.fromisoformat(last_success)
+        if self.max_catchup_hours is not None:
+            since = max(since, (now or datetime.utcnow()) - timedelta(hours=self.max_catchup_hours))
+        return min(cutoff_time, since)
+
+    def order(self, feed_configs: List[Dict]) -> List[Dict]:
+        """priority 높은 순 → 평균 지연 시간 짧은 순 (이력 없는 피드는 같은 priority 안에서 먼저)"""
+        return sorted(feed_configs, key=lambda feed: (
+            self.PRIORITY_RANK.get(feed.get('priority', 'medium'), 1),
+            self.get(feed.get('url', '')).get('latency', 0.0)
+        ))
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self._feeds, ensure_ascii=False, indent=2)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def format_report(self, feed_configs: List[Dict]) -> str:
+        """피드 상태 표 (feeds health 명령)"""
+        header = f"{'Feed':<24} {'Pri':<6} {'Latency':>8} {'KB':>7} {'Entries':>7} {'Errors':>6} {'Every':>7}  Status"
+        lines = [header, '-' * len(header)]
+        for feed in self.order(feed_configs):
+            stats = self.get(feed['url'])
+            due, reason = self.is_due(feed)
+            latency = f"{stats['latency']:.2f}s" if stats.get('latency') is not None else '-'
+            size = f"{stats['bytes'] / 1024:.0f}" if stats.get('bytes') is not None else '-'
+            interval = f"{stats['publish_interval_hours']:.0f}h" if stats.get('publish_interval_hours') else '-'
+            if not stats:
+                status = 'no history'
+            elif not due:
+                status = reason
+            elif stats.get('error_streak'):
+                status = f"retry due: {stats.get('last_error', '')[:40]}"
+            else:
+                status = 'ok'
+            lines.append(
+                f"{feed['name'][:24]:<24} {feed.get('priority', 'medium'):<6} {latency:>8} {size:>7} "
+                f"{stats.get('entries', '-')!s:>7} {stats.get('error_streak', 0):>6} {interval:>7}  {status}"
+            )
+        return '\n'.join(lines)
+
+    def _ewma(self, previous: Optional[float], value: float) -> float:
+        if previous is None:
+            return round(value, 3)
+        return round(previous + self.EWMA_ALPHA * (value - previous), 3)
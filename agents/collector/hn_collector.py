@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import requests
+
+from agents.common.article import Article
+
+
+class HackerNewsCollector:
+    """Hacker News (Algolia Search API) 수집
+
+    OR로 연결된 query를 검색어별 요청으로 나눠 병렬로 보내고,
+    `numericFilters=created_at_i>...`로 lookback 범위 안의 스토리만 페이지 단위로 가져온다.
+    end_time이 주어지면 (백필 구간) `created_at_i<...`도 붙여 구간마다 따로 상위 N개를 고른다.
+    응답은 data/cache/api에 cache_minutes 동안 저장해 재실행 시 재사용한다.
+    requests.Session은 스레드 간 공유가 안전하지 않으므로 검색어(작업 스레드)마다 따로 연다.
+    """
+
+    SOURCE_NAME = 'Hacker News'
+    ITEM_URL = 'https://news.ycombinator.com/item?id={}'
+
+    def __init__(self, config: Dict[str, Any], cache_dir: str = 'data/cache/api'):
+        self.endpoint = config.get('endpoint', 'https://hn.algolia.com/api/v1/search')
+        self.query = config.get('query', '')
+        self.results_limit = config.get('results_limit', 20)
+        self.hits_per_page = config.get('hits_per_page', 50)
+        self.max_pages = config.get('max_pages', 3)
+        self.max_workers = config.get('max_workers', 4)
+        self.timeout = (config.get('connect_timeout', 5), config.get('read_timeout', 20))
+        self.priority = config.get('priority', 'medium')
+
+        self.cache_minutes = config.get('cache_minutes', 30)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def collect(self, cutoff_time: datetime, end_time: Optional[datetime] = None) -> List[Dict]:
+        """[cutoff_time, end_time) 범위의 스토리를 수집해 RSS 기사와 같은 형태로 반환"""
+        # 캐시 키가 매 실행마다 바뀌지 않도록 cutoff를 정시 단위로 내림 (cutoff_time은 naive UTC)
+        since = cutoff_time.replace(minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+        numeric_filters = f"created_at_i>{int(since.timestamp())}"
+        if end_time is not None:
+            until = end_time.replace(tzinfo=timezone.utc)
+            numeric_filters += f",created_at_i<{int(until.timestamp())}"
+
+        terms = self._split_query(self.query)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda term: self._search(term, numeric_filters), terms)
+            hits = {}
+            for term_hits in results:
+                for hit in term_hits:
+                    hits.setdefault(hit['objectID'], hit)
+
+        # 여러 검색어에 걸친 결과를 points 순으로 합쳐 상위 results_limit개
+        ranked = sorted(hits.values(), key=lambda h: h.get('points') or 0, reverse=True)
+        articles = []
+        for hit in ranked:
+            article = self._normalize(hit)
+            published_at = article['published_at']
+            if published_at and datetime.fromisoformat(published_at) < cutoff_time:
+                continue
+            if end_time is not None and published_at and datetime.fromisoformat(published_at) >= end_time:
+                continue
+            articles.append(article)
+            if len(articles) >= self.results_limit:
+                break
+        return articles
+
+    def _split_query(self, query: str) -> List[str]:
+        """'AI OR LLM OR B2B Sales' → ['AI', 'LLM', 'B2B Sales']"""
+        return [term.strip() for term in re.split(r'\s+OR\s+', query) if term.strip()]
+
+    def _search(self, term: str, numeric_filters: str) -> List[Dict]:
+        """검색어 하나에 대해 페이지를 넘기며 hits 수집 (페이지 요청끼리 연결 재사용)"""
+        hits = []
+        with requests.Session() as session:
+            for page in range(self.max_pages):
+                params = {
+                    'query': term,
+                    'tags': 'story',
+                    'numericFilters': numeric_filters,
+                    'hitsPerPage': self.hits_per_page,
+                    'page': page
+                }
+                data = self._get(session, params)
+                hits.extend(data.get('hits', []))
+                if page + 1 >= data.get('nbPages', 0):
+                    break
+        return hits
+
+    def _get(self, session: requests.Session, params: Dict[str, Any]) -> Dict:
+        """API 요청 (cache_minutes 이내 동일 요청은 파일 캐시 사용)"""
+        key = hashlib.md5(
+            f"{self.endpoint}?{json.dumps(params, sort_keys=True)}".encode()
+        ).hexdigest()
+        path = self.cache_dir / f"hn_{key}.json"
+
+        if path.exists() and self.cache_minutes > 0:
+            age_minutes = (datetime.now().timestamp() - path.stat().st_mtime) / 60
+            if age_minutes < self.cache_minutes:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+
+        response = session.get(self.endpoint, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        return data
+
+    def _normalize(self, hit: Dict) -> Dict:
+        """Algolia hit → 기사 레코드 (RSSCollector._fetch_feed와 동일한 필드)"""
+        url = hit.get('url') or self.ITEM_URL.format(hit['objectID'])
+        created_at = hit.get('created_at_i')
+        published = datetime.utcfromtimestamp(created_at) if created_at else None
+        excerpt = re.sub(r'<[^>]+>', '', (hit.get('story_text') or '')[:500])
+
+        return Article(
+            id=hashlib.md5(url.encode()).hexdigest(),
+            title=re.sub(r'\s+', ' ', hit.get('title') or '').strip(),
+            url=url,
+            source=self.SOURCE_NAME,
+            published_at=published.isoformat() if published else None,
+            author=hit.get('author', ''),
+            excerpt=re.sub(r'\s+', ' ', excerpt).strip(),
+            image_url='',
+            language='en',
+            priority=self.priority,
+            bypass_content_filter=False
+        )
@@ -1,17 +1,35 @@
+import asyncio
 import feedparser
 import hashlib
-import socket
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 
-# RSS 피드 요청 시 무한 대기 방지 (30초)
-socket.setdefaulttimeout(30)
+import requests
+from dateutil import parser as date_parser
+
+from agents.common.article import Article
+from agents.common.keyword_matcher import KeywordMatcher
+from .feed_cache import FeedCache
+from .feed_health import FeedHealthStore
+from .hn_collector import HackerNewsCollector
+from .seen_index import SeenIndex
+from .story_clusterer import StoryClusterer
 
 
 class RSSCollector:
-    """RSS 피드에서 뉴스 수집"""
+    """RSS 피드 (+ api_sources)에서 뉴스 수집"""
+
+    # api_sources 키 → 수집기 클래스 (collect(cutoff_time, end_time) → 기사 목록)
+    API_COLLECTORS = {
+        'hacker_news': HackerNewsCollector
+    }
 
     # 기본 키워드 (config에 content_keywords가 없을 때 fallback)
     DEFAULT_KEYWORDS = [
@@ -22,87 +40,489 @@ class RSSCollector:
         '인공지능', '머신러닝', '딥러닝', '생성형'
     ]
 
-    def __init__(self, config: Dict[str, Any]):
+    # RFC 822 날짜 형태 ([요일,] 일 월 연도 ...) — email 파서는 형식이 달라도 예외 없이 일부만 읽으므로 미리 확인
+    RFC822_PATTERN = re.compile(r'(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s')
+
+    def __init__(self, config: Dict[str, Any], matcher: Optional[KeywordMatcher] = None,
+                 seen_index: Optional[SeenIndex] = None):
         self.feeds = config.get('rss_feeds', {})
         self.filters = config.get('filters', {})
+
+        # 사전 필터: 최소 단어 수 + 제외 키워드 (정규식은 한 번만 컴파일)
+        self.min_word_count = self.filters.get('min_word_count', 0)
+        exclude_keywords = [kw.lower() for kw in self.filters.get('exclude_keywords', [])]
+        self._exclude_pattern = None
+        if exclude_keywords:
+            self._exclude_pattern = re.compile(
+                r'\b(?:' + '|'.join(re.escape(kw) for kw in exclude_keywords) + r')\b',
+                re.IGNORECASE
+            )
+        self.rejected = Counter()
         self.content_keywords = config.get('content_keywords', self.DEFAULT_KEYWORDS)
 
+        # 키워드 매처 (orchestrator가 공유 매처를 넘기면 analyzer/filter와 hits 재사용)
+        self._content_keyword_set = frozenset(kw.lower() for kw in self.content_keywords)
+        self.matcher = matcher or KeywordMatcher(self.content_keywords)
+
+        # 이미 아카이브된 기사 인덱스 (있으면 중복 제거 직후 제외)
+        self.seen_index = seen_index
+        self.known_skipped = 0
+
+        # 조건부 GET 피드 캐시
+        cache_config = config.get('cache', {})
+        self.cache = None
+        if cache_config.get('enabled', True):
+            self.cache = FeedCache(
+                cache_dir=cache_config.get('dir', 'data/cache/feeds'),
+                fresh_minutes=cache_config.get('fresh_minutes', 0)
+            )
+        self._cache_stats = Counter()
+        self._cache_lock = threading.Lock()
+
+        # 수집 엔진 설정 (thread | async)
+        fetch_config = config.get('fetch', {})
+        self.fetch_mode = fetch_config.get('mode', 'thread')
+        self.max_workers = fetch_config.get('max_workers', 10)
+        self.max_connections = fetch_config.get('max_connections', 50)
+        self.max_per_host = fetch_config.get('max_per_host', 4)
+        self.connect_timeout = fetch_config.get('connect_timeout', 10)
+        self.read_timeout = fetch_config.get('read_timeout', 30)
+
+        # 피드 상태 이력 (실패 피드 백오프, 드물게 발행하는 피드 건너뛰기, 빠른 피드 우선)
+        health_config = config.get('health', {})
+        self.health = None
+        if health_config.get('enabled', True):
+            self.health = FeedHealthStore(
+                path=health_config.get('path', 'data/cache/feed_health.json'),
+                backoff_base_minutes=health_config.get('backoff_base_minutes', 60),
+                backoff_max_hours=health_config.get('backoff_max_hours', 48),
+                adaptive_polling=health_config.get('adaptive_polling', True),
+                rare_interval_hours=health_config.get('rare_interval_hours', 48),
+                # 이보다 오래된 기사는 seen 인덱스에서 빠져 다시 분석 / 아카이브 조회되므로 TTL을 기본 상한으로
+                max_catchup_hours=health_config.get(
+                    'max_catchup_hours', config.get('seen_index', {}).get('ttl_days', 7) * 24
+                )
+            )
+        self.skipped_feeds: List[Dict] = []
+
+        # 유사 기사(같은 스토리) 클러스터링
+        self.clustering_config = config.get('clustering', {})
+        self.near_duplicates = 0
+
+        # API 소스 수집기 (RSS 피드와 함께 병렬 수집)
+        self.api_collectors = {}
+        for name, api_config in config.get('api_sources', {}).items():
+            if api_config.get('enabled', False) and name in self.API_COLLECTORS:
+                self.api_collectors[name] = self.API_COLLECTORS[name](api_config)
+
     def collect(self, hours_lookback: int = 24) -> Dict[str, Any]:
         """모든 RSS 피드에서 뉴스 수집"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours_lookback)
-        all_articles = []
+        filtered_articles = []
+        for batch in self.stream(hours_lookback):
+            filtered_articles.extend(batch)
+
+        return {
+            'collected_at': datetime.utcnow().isoformat(),
+            'total_count': len(filtered_articles),
+            'articles': filtered_articles,
+            'cache': self.cache_stats()
+        }
+
+    def stream(self, hours_lookback: float = 24, end_time: Optional[datetime] = None,
+               plan_feeds: bool = True) -> Iterator[List[Dict]]:
+        """피드가 하나씩 완료될 때마다 중복 제거 + 키워드 필터링된 기사 배치를 yield
+
+        end_time을 주면 [end_time - hours_lookback, end_time) 구간에 발행된 기사만 yield한다
+        (발행일 없는 기사는 제외). 백필처럼 같은 피드를 구간별로 여러 번 훑을 때는
+        plan_feeds=False로 피드 상태 기반 건너뛰기를 끈다.
+        """
+        cutoff_time = (end_time or datetime.utcnow()) - timedelta(hours=hours_lookback)
+        self._cache_stats = Counter()
+        self.known_skipped = 0
+        self.near_duplicates = 0
+        self.rejected = Counter()
+        seen = set()
+        clusterer = None
+        if self.clustering_config.get('enabled', True):
+            clusterer = StoryClusterer(
+                max_distance=self.clustering_config.get('max_distance', 3),
+                bands=self.clustering_config.get('bands', 4)
+            )
+
+        feed_configs = self._feed_configs()
+        if plan_feeds:
+            feed_configs = self._plan_feeds(feed_configs)
+        else:
+            self.skipped_feeds = []
+
+        try:
+            yield from self._stream_feeds(feed_configs, cutoff_time, end_time, seen, clusterer)
+        finally:
+            if self.health:
+                self.health.save()
+
+    def _stream_feeds(self, feed_configs: List[Dict], cutoff_time: datetime,
+                      end_time: Optional[datetime], seen: set,
+                      clusterer: Optional[StoryClusterer]) -> Iterator[List[Dict]]:
+        """피드 결과별 필터링 파이프라인"""
+        for feed, result in self._iter_feed_results(feed_configs, cutoff_time, end_time):
+            if isinstance(result, Exception):
+                # httpx 타임아웃 예외는 메시지가 비어 있어 예외 이름으로 대체
+                print(f"Error fetching {feed['name']}: {str(result) or type(result).__name__}")
+                if self.health and 'url' in feed:
+                    self.health.record_failure(feed, result)
+                continue
+
+            # 구간 끝 이후 발행된 기사 제외 (백필 구간 수집)
+            if end_time is not None:
+                result = self._before(result, end_time)
+
+            # 짧은 글 / 광고성 콘텐츠 제외
+            result = self._apply_filters(result, feed)
+
+            # 중복 제거 (이전 배치 포함)
+            unique_articles = self._deduplicate(result, seen)
 
-        # 모든 피드 URL 수집
+            # 이전 실행에서 아카이브된 기사 제외
+            unique_articles = self._drop_known(unique_articles)
+
+            # 콘텐츠 키워드 기반 필터링
+            filtered_articles = self._filter_by_keywords(unique_articles)
+
+            # 다른 소스의 같은 스토리는 대표 기사 하나로 합침
+            if clusterer and filtered_articles:
+                canonical_articles = clusterer.cluster(filtered_articles)
+                self.near_duplicates += len(filtered_articles) - len(canonical_articles)
+                filtered_articles = canonical_articles
+                self._mark_late_related(clusterer.late_merges)
+
+            if filtered_articles:
+                yield filtered_articles
+
+    def cache_stats(self) -> Dict[str, int]:
+        """마지막 수집의 캐시 hit/miss/304 카운트"""
+        return {
+            'hit': self._cache_stats['hit'],
+            'miss': self._cache_stats['miss'],
+            'not_modified': self._cache_stats['not_modified']
+        }
+
+    def rejection_stats(self) -> Dict[str, Any]:
+        """마지막 수집에서 사전 필터 규칙별로 제외된 기사 수"""
+        return {
+            'min_word_count': self.rejected['min_word_count'],
+            'exclude_keywords': {
+                key.split(':', 1)[1]: count
+                for key, count in self.rejected.items() if key.startswith('exclude:')
+            }
+        }
+
+    def health_report(self) -> str:
+        """RSS 피드별 상태 표 (feeds health 명령)"""
+        health = self.health or FeedHealthStore()
+        return health.format_report([feed for feed in self._feed_configs() if 'url' in feed])
+
+    def _plan_feeds(self, feed_configs: List[Dict]) -> List[Dict]:
+        """상태 이력으로 이번 실행에서 수집할 피드와 요청 순서 결정"""
+        self.skipped_feeds = []
+        if not self.health:
+            return feed_configs
+
+        planned = []
+        for feed in feed_configs:
+            if 'url' in feed:
+                due, reason = self.health.is_due(feed)
+                if not due:
+                    self.skipped_feeds.append({'name': feed['name'], 'reason': reason})
+                    continue
+            planned.append(feed)
+
+        # API 소스는 이력이 없어 같은 priority 안에서 가장 먼저 시작
+        return self.health.order(planned)
+
+    def _feed_configs(self) -> List[Dict]:
+        """모든 피드 설정 (언어 코드 포함). API 소스는 'api' 키를 가진 항목으로 추가."""
         feed_configs = []
         for lang, feeds in self.feeds.items():
             for feed in feeds:
                 feed_copy = feed.copy()
                 feed_copy['language'] = lang[:2]  # 'english' -> 'en'
                 feed_configs.append(feed_copy)
+        for name, api_collector in self.api_collectors.items():
+            feed_configs.append({'name': api_collector.SOURCE_NAME, 'api': name})
+        return feed_configs
 
-        # 병렬 수집
-        with ThreadPoolExecutor(max_workers=10) as executor:
+    def _iter_feed_results(self, feed_configs: List[Dict], cutoff_time: datetime,
+                           end_time: Optional[datetime] = None) -> Iterator[Tuple[Dict, Any]]:
+        """완료 순서대로 (피드 설정, 기사 목록 또는 예외) yield"""
+        if self.fetch_mode == 'async':
+            return self._iter_async(feed_configs, cutoff_time, end_time)
+        return self._iter_threaded(feed_configs, cutoff_time, end_time)
+
+    def _iter_threaded(self, feed_configs: List[Dict], cutoff_time: datetime,
+                       end_time: Optional[datetime] = None) -> Iterator[Tuple[Dict, Any]]:
+        """ThreadPoolExecutor 기반 수집"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = {
-                executor.submit(self._fetch_feed, feed, cutoff_time): feed
+                executor.submit(self._fetch_feed, feed, cutoff_time, end_time): feed
                 for feed in feed_configs
             }
 
             for future in as_completed(futures):
                 try:
-                    articles = future.result()
-                    all_articles.extend(articles)
+                    yield futures[future], future.result()
                 except Exception as e:
-                    feed = futures[future]
-                    print(f"Error fetching {feed['name']}: {e}")
+                    yield futures[future], e
 
-        # 중복 제거
-        unique_articles = self._deduplicate(all_articles)
+    def _iter_async(self, feed_configs: List[Dict], cutoff_time: datetime,
+                    end_time: Optional[datetime] = None) -> Iterator[Tuple[Dict, Any]]:
+        """asyncio 수집을 백그라운드 스레드의 이벤트 루프에서 실행하고 결과를 큐로 전달"""
+        results = queue.Queue()
+        done = object()
 
-        # 콘텐츠 키워드 기반 필터링
-        filtered_articles = self._filter_by_keywords(unique_articles)
+        def run():
+            try:
+                asyncio.run(self._collect_async(feed_configs, cutoff_time, results.put, end_time))
+            except Exception as e:
+                results.put((None, e))
+            finally:
+                results.put(done)
 
-        return {
-            'collected_at': datetime.utcnow().isoformat(),
-            'total_count': len(filtered_articles),
-            'articles': filtered_articles
-        }
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+
+        while True:
+            item = results.get()
+            if item is done:
+                break
+            feed, result = item
+            if feed is None:
+                raise result
+            yield feed, result
+
+        thread.join()
+
+    async def _collect_async(self, feed_configs: List[Dict], cutoff_time: datetime,
+                             on_result: Callable[[Tuple[Dict, Any]], None],
+                             end_time: Optional[datetime] = None):
+        """asyncio 기반 수집 (공유 커넥션 풀, 호스트별 동시성 제한)"""
+        from .async_fetcher import AsyncFeedFetcher
+
+        async with AsyncFeedFetcher(
+            max_connections=self.max_connections,
+            max_per_host=self.max_per_host,
+            user_agent=feedparser.USER_AGENT
+        ) as fetcher:
+            async def fetch(feed):
+                try:
+                    return feed, await self._fetch_feed_async(fetcher, feed, cutoff_time, end_time)
+                except Exception as e:
+                    return feed, e
 
-    def _fetch_feed(self, feed_config: Dict, cutoff_time: datetime) -> List[Dict]:
-        """개별 피드 수집"""
-        feed = feedparser.parse(feed_config['url'])
+            for task in asyncio.as_completed([fetch(feed) for feed in feed_configs]):
+                on_result(await task)
+
+    def _fetch_feed(self, feed_config: Dict, cutoff_time: datetime,
+                    end_time: Optional[datetime] = None) -> List[Dict]:
+        """개별 피드 수집 (조건부 GET, 304이면 캐시된 기사 재사용)
+
+        end_time은 API 소스에만 전달한다 (RSS는 피드 전체를 받은 뒤 _before로 자름).
+        """
+        if 'api' in feed_config:
+            return self.api_collectors[feed_config['api']].collect(cutoff_time, end_time)
+
+        url = feed_config['url']
+        entry = self.cache.load(url) if self.cache else None
+        cutoff_time = self._feed_cutoff(feed_config, cutoff_time)
+
+        # 최근에 수집한 피드는 네트워크 요청 생략
+        if self.cache and self.cache.is_fresh(entry):
+            self._record_cache('hit')
+            return self._articles_from_cache(entry, feed_config, cutoff_time)
+
+        connect_timeout, read_timeout = self._timeouts(feed_config)
+        started = time.monotonic()
+        response = requests.get(
+            url,
+            headers=self._request_headers(entry),
+            timeout=(connect_timeout, read_timeout)
+        )
+
+        return self._handle_response(feed_config, entry, response, cutoff_time,
+                                     latency=time.monotonic() - started)
+
+    async def _fetch_feed_async(self, fetcher, feed_config: Dict, cutoff_time: datetime,
+                                end_time: Optional[datetime] = None) -> List[Dict]:
+        """개별 피드 비동기 수집. 파싱은 이벤트 루프를 막지 않도록 스레드에서 수행."""
+        if 'api' in feed_config:
+            return await asyncio.to_thread(
+                self.api_collectors[feed_config['api']].collect, cutoff_time, end_time
+            )
+
+        url = feed_config['url']
+        entry = self.cache.load(url) if self.cache else None
+        cutoff_time = self._feed_cutoff(feed_config, cutoff_time)
+
+        if self.cache and self.cache.is_fresh(entry):
+            self._record_cache('hit')
+            return self._articles_from_cache(entry, feed_config, cutoff_time)
+
+        connect_timeout, read_timeout = self._timeouts(feed_config)
+        started = time.monotonic()
+        response = await fetcher.get(
+            url,
+            headers=self._request_headers(entry),
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
+        latency = time.monotonic() - started
+
+        return await asyncio.to_thread(
+            self._handle_response, feed_config, entry, response, cutoff_time, latency
+        )
+
+    def _handle_response(self, feed_config: Dict, entry: Optional[Dict], response,
+                         cutoff_time: datetime, latency: float = 0.0) -> List[Dict]:
+        """HTTP 응답 처리 (requests / httpx 응답 공용)"""
+        url = feed_config['url']
+
+        # 304 Not Modified → 파싱 생략
+        if response.status_code == 304 and entry:
+            self.cache.touch(url, entry)
+            self._record_cache('not_modified')
+            if self.health:
+                self.health.record_success(feed_config, latency, 0, len(entry.get('articles', [])), [])
+            return self._articles_from_cache(entry, feed_config, cutoff_time)
+
+        response.raise_for_status()
+
+        feed = feedparser.parse(
+            response.content,
+            response_headers=self._feed_headers(url, response.headers)
+        )
+        articles = self._parse_entries(feed, feed_config, cutoff_time)
+
+        if self.cache:
+            self.cache.store(
+                url,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                body=response.content,
+                articles=[article.to_dict() for article in articles],
+                cutoff=cutoff_time
+            )
+        self._record_cache('miss')
+
+        if self.health:
+            published = [date for date in (self._entry_date(e) for e in feed.entries) if date]
+            self.health.record_success(feed_config, latency, len(response.content),
+                                       len(feed.entries), published)
+
+        return articles
+
+    def _feed_cutoff(self, feed_config: Dict, cutoff_time: datetime) -> datetime:
+        """백오프/건너뛰기로 lookback보다 오래 수집하지 못한 피드는 마지막 성공 시점부터"""
+        if self.health:
+            return self.health.feed_cutoff(feed_config, cutoff_time)
+        return cutoff_time
+
+    def _request_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """요청 헤더 (User-Agent + 조건부 GET 헤더)"""
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        if self.cache:
+            headers.update(self.cache.conditional_headers(entry))
+        return headers
+
+    def _timeouts(self, feed_config: Dict) -> tuple:
+        """피드별 (connect, read) 타임아웃. sources.yaml 피드 설정이 기본값보다 우선."""
+        return (
+            feed_config.get('connect_timeout', self.connect_timeout),
+            feed_config.get('read_timeout', self.read_timeout)
+        )
+
+    def _parse_entries(self, feed, feed_config: Dict, cutoff_time: datetime) -> List[Dict]:
+        """feedparser 결과를 기사 목록으로 변환"""
         articles = []
+        # 최신순으로 정렬된 피드는 cutoff 이전 기사가 나오면 나머지 엔트리 생략
+        chronological = feed_config.get('chronological', False)
 
         for entry in feed.entries:
-            published = self._parse_date(entry.get('published', entry.get('updated', '')))
+            published = self._entry_date(entry)
 
             # 시간 필터링
             if published and published < cutoff_time:
+                if chronological:
+                    break
                 continue
 
-            article = {
-                'id': self._generate_id(entry.link),
-                'title': self._clean_text(entry.title),
-                'url': entry.link,
+            # 단어 수는 잘리기 전 본문(content:encoded가 있으면 그것) 기준
+            body = entry.content[0].get('value', '') if entry.get('content') else entry.get('summary', '')
+
+            article = Article(
+                id=self._generate_id(entry.link),
+                title=self._clean_text(entry.title),
+                url=entry.link,
+                source=feed_config['name'],
+                published_at=published.isoformat() if published else None,
+                author=entry.get('author', ''),
+                excerpt=self._clean_text(entry.get('summary', '')[:500]),
+                image_url=self._extract_image(entry),
+                language=feed_config.get('language', 'en'),
+                priority=feed_config.get('priority', 'medium'),
+                bypass_content_filter=feed_config.get('bypass_content_filter', False),
+                word_count=len(self._clean_text(body).split())
+            )
+            articles.append(article)
+
+        return articles
+
+    def _articles_from_cache(self, entry: Dict, feed_config: Dict, cutoff_time: datetime) -> List[Dict]:
+        """캐시된 기사 목록에 현재 cutoff와 피드 설정을 다시 적용
+
+        캐시를 채운 실행보다 lookback이 길면 (run --hours 72, backfill) 저장된 목록에 없는
+        이전 기사가 있을 수 있으므로 저장된 원문을 현재 cutoff로 다시 파싱한다.
+        """
+        if not self.cache.covers(entry, cutoff_time):
+            body = self.cache.load_body(feed_config['url'])
+            if body is not None:
+                feed = feedparser.parse(body, response_headers={'content-location': feed_config['url']})
+                parsed = self._parse_entries(feed, feed_config, cutoff_time)
+                self.cache.replace_articles(feed_config['url'], entry,
+                                            [article.to_dict() for article in parsed], cutoff_time)
+
+        articles = []
+        for article in entry.get('articles', []):
+            published_at = article.get('published_at')
+            if published_at and datetime.fromisoformat(published_at) < cutoff_time:
+                continue
+            articles.append(Article(**{
+                **article,
                 'source': feed_config['name'],
-                'published_at': published.isoformat() if published else None,
-                'author': entry.get('author', ''),
-                'excerpt': self._clean_text(entry.get('summary', '')[:500]),
-                'image_url': self._extract_image(entry),
                 'language': feed_config.get('language', 'en'),
                 'priority': feed_config.get('priority', 'medium'),
                 'bypass_content_filter': feed_config.get('bypass_content_filter', False)
-            }
-            articles.append(article)
-
+            }))
         return articles
 
+    def _feed_headers(self, url: str, headers) -> Dict[str, str]:
+        """feedparser용 응답 헤더 (소문자 키, 상대 URI 해석용 content-location 포함)"""
+        feed_headers = {key.lower(): value for key, value in headers.items()}
+        feed_headers.setdefault('content-location', url)
+        return feed_headers
+
+    def _record_cache(self, status: str):
+        """캐시 hit/miss/304 카운트 (스레드 안전)"""
+        with self._cache_lock:
+            self._cache_stats[status] += 1
+
     def _generate_id(self, url: str) -> str:
         """URL 기반 고유 ID 생성"""
         return hashlib.md5(url.encode()).hexdigest()
 
-    def _deduplicate(self, articles: List[Dict]) -> List[Dict]:
-        """URL 기반 중복 제거"""
-        seen = set()
+    def _deduplicate(self, articles: List[Dict], seen: Optional[set] = None) -> List[Dict]:
+        """URL 기반 중복 제거. seen을 넘기면 이전 배치와의 중복도 제거."""
+        if seen is None:
+            seen = set()
         unique = []
         for article in articles:
             if article['id'] not in seen:
@@ -110,32 +530,101 @@ class RSSCollector:
                 unique.append(article)
         return unique
 
+    def _apply_filters(self, articles: List[Dict], feed_config: Dict) -> List[Dict]:
+        """filters.min_word_count / exclude_keywords 적용. 규칙별 제외 수를 집계.
+
+        word_count가 없는 기사(API 소스, 이전 형식의 캐시)는 단어 수 규칙을 건너뛴다.
+        피드 설정의 min_word_count가 전역 값보다 우선한다.
+        """
+        min_word_count = feed_config.get('min_word_count', self.min_word_count)
+        kept = []
+        for article in articles:
+            word_count = article.get('word_count')
+            if min_word_count and word_count is not None and word_count < min_word_count:
+                self.rejected['min_word_count'] += 1
+                continue
+
+            if self._exclude_pattern:
+                match = self._exclude_pattern.search(f"{article['title']} {article['excerpt']}")
+                if match:
+                    self.rejected[f"exclude:{match.group(0).lower()}"] += 1
+                    continue
+
+            kept.append(article)
+        return kept
+
+    def _before(self, articles: List[Dict], end_time: datetime) -> List[Dict]:
+        """end_time 이전에 발행된 기사만 (발행일 없는 기사 제외)"""
+        return [
+            article for article in articles
+            if article.get('published_at') and datetime.fromisoformat(article['published_at']) < end_time
+        ]
+
+    def _drop_known(self, articles: List[Dict]) -> List[Dict]:
+        """SeenIndex에 기록된(이미 아카이브된) 기사 제외"""
+        if self.seen_index is None or not articles:
+            return articles
+        known = self.seen_index.known(article['id'] for article in articles)
+        self.known_skipped += len(known)
+        return [article for article in articles if article['id'] not in known]
+
+    def _mark_late_related(self, merges: List[Tuple[str, str]]):
+        """이전 배치의 대표 기사에 합쳐진 유사 기사 ID 기록
+
+        스트리밍 수집에서는 대표 기사가 이미 아카이브되어 seen 인덱스에 있으므로, 나중에 합쳐진
+        유사 기사도 바로 기록해야 다음 실행에서 별도 기사(노션 페이지 / Haiku 평가)로 처리되지 않는다.
+        대표 기사가 아직 아카이브되지 않았으면 아카이브할 때 related_articles와 함께 기록된다.
+        """
+        if self.seen_index is None or not merges:
+            return
+        archived = self.seen_index.known({canonical_id for canonical_id, _ in merges})
+        late_ids = [related_id for canonical_id, related_id in merges if canonical_id in archived]
+        if late_ids:
+            self.seen_index.mark(late_ids)
+
     def _filter_by_keywords(self, articles: List[Dict]) -> List[Dict]:
         """콘텐츠 키워드 기반 필터링. 선정 소스(bypass_content_filter)는 무조건 통과."""
         filtered = []
         for article in articles:
             if article.get('bypass_content_filter'):
                 filtered.append(article)
-            else:
-                text = f"{article['title']} {article['excerpt']}".lower()
-                if any(keyword in text for keyword in self.content_keywords):
-                    filtered.append(article)
+            elif not self._content_keyword_set.isdisjoint(self.matcher.article_hits(article)):
+                filtered.append(article)
         return filtered
 
+    def _entry_date(self, entry) -> Optional[datetime]:
+        """엔트리 발행일. feedparser가 파싱해 둔 struct_time(UTC)을 우선 사용."""
+        for key in ('published_parsed', 'updated_parsed'):
+            parsed = entry.get(key)
+            if parsed:
+                return datetime(*parsed[:6])
+        return self._parse_date(entry.get('published', entry.get('updated', '')))
+
     def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """날짜 문자열 파싱 (timezone-naive로 변환)"""
+        """날짜 문자열 파싱 (timezone-naive로 변환)
+
+        RFC 822(RSS) / ISO 8601(Atom) 전용 파서를 먼저 시도하고,
+        둘 다 실패한 경우에만 dateutil의 범용 파서를 사용한다.
+        """
         if not date_str:
             return None
+        parsed = None
         try:
-            from dateutil import parser
-            parsed = parser.parse(date_str)
-            # timezone-aware인 경우 UTC로 변환 후 timezone 제거
-            if parsed.tzinfo is not None:
-                from datetime import timezone
-                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
-            return parsed
-        except Exception:
-            return None
+            if date_str[:4].isdigit():
+                parsed = datetime.fromisoformat(date_str)
+            elif self.RFC822_PATTERN.match(date_str):
+                parsed = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            pass
+        if parsed is None:
+            try:
+                parsed = date_parser.parse(date_str)
+            except Exception:
+                return None
+        # timezone-aware인 경우 UTC로 변환 후 timezone 제거
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
 
     def _clean_text(self, text: str) -> str:
         """HTML 태그 제거 및 텍스트 정리"""
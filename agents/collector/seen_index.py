@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Set
+
+
+class SeenIndex:
+    """이미 아카이브된 기사 ID 인덱스 (SQLite)
+
+    RSSCollector._generate_id의 md5 ID와 아카이브 시각을 저장한다.
+    수집 직후 이미 본 ID를 걸러내 분석 / 노션 중복 조회 / Haiku 필터까지
+    가지 않게 하고, ttl_days가 지난 항목은 compact()로 정리한다.
+    """
+
+    # SQLite 바인딩 변수 수 제한 대응
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: str = 'data/cache/seen.sqlite', ttl_days: int = 7):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY, archived_at TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS seen_archived_at ON seen (archived_at)")
+        self._conn.commit()
+
+    def known(self, ids: Iterable[str]) -> Set[str]:
+        """주어진 ID 중 이미 아카이브된 ID 집합"""
+        ids = list(ids)
+        found = set()
+        with self._lock:
+            for i in range(0, len(ids), self.QUERY_CHUNK):
+                chunk = ids[i:i + self.QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id FROM seen WHERE id IN ({placeholders})", chunk
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def mark(self, ids: Iterable[str]):
+        """아카이브 완료(또는 노션에 이미 존재)한 ID 기록"""
+        archived_at = datetime.utcnow().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen (id, archived_at) VALUES (?, ?)",
+                [(article_id, archived_at) for article_id in ids]
+            )
+            self._conn.commit()
+
+    def compact(self) -> int:
+        """TTL이 지난 항목 삭제. 삭제된 개수 반환."""
+        threshold = (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM seen WHERE archived_at < ?", (threshold,)
+            ).rowcount
+            self._conn.commit()
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
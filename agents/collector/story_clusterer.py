@@ -0,0 +1,121 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class StoryClusterer:
+    """SimHash + LSH 밴딩 기반 유사 기사(같은 스토리) 클러스터링
+
+    제목 + 발췌문의 단어 shingle로 64비트 SimHash를 만들고, 해밍 거리가
+    max_distance 이하인 기사를 같은 스토리로 묶는다. 지문을 bands개 구간으로
+    나눠 구간 값이 같은 기사만 비교하므로(bands > max_distance이면 비둘기집
+    원리로 후보 누락 없음) 기사 수가 늘어도 전체 쌍 비교를 하지 않는다.
+
+    먼저 들어온 기사가 클러스터의 대표(canonical)가 되고, 이후 들어온
+    유사 기사는 대표 기사의 related_articles(id / source / url)에 기록된 뒤 제외된다.
+    이전 cluster() 호출의 대표 기사에 합쳐진 기사는 late_merges에 (대표 ID, 유사 기사 ID)로 남긴다
+    (스트리밍 수집에서는 대표 기사가 이미 아카이브됐을 수 있다).
+    """
+
+    BITS = 64
+    TOKEN_PATTERN = re.compile(r'[0-9a-z가-힣]+')
+
+    def __init__(self, max_distance: int = 3, bands: int = 4, min_features: int = 8):
+        if bands <= max_distance:
+            raise ValueError("bands must be greater than max_distance")
+        self.max_distance = max_distance
+        self.bands = bands
+        self.band_bits = self.BITS // bands
+        self.band_mask = (1 << self.band_bits) - 1
+        # 특징이 너무 적은 기사(제목만 있는 짧은 글)는 오탐 방지를 위해 클러스터링 제외
+        self.min_features = min_features
+
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._fingerprints: List[int] = []
+        self._canonicals: List[Dict] = []
+        self.late_merges: List[Tuple[str, str]] = []
+
+    def cluster(self, articles: List[Dict]) -> List[Dict]:
+        """이전에 본 기사들과 비교해 대표 기사만 반환 (중복은 대표 기사에 출처로 기록)"""
+        fingerprints = self._fingerprints_for(articles)
+        canonicals = []
+        self.late_merges = []
+        previous = len(self._canonicals)
+
+        for article, fingerprint in zip(articles, fingerprints):
+            if fingerprint is None:
+                canonicals.append(article)
+                continue
+
+            match = self._find(fingerprint)
+            if match is None:
+                self._register(article, fingerprint)
+                canonicals.append(article)
+            else:
+                canonical = self._canonicals[match]
+                canonical.setdefault('related_articles', []).append({
+                    'id': article['id'],
+                    'source': article['source'],
+                    'url': article['url']
+                })
+                if match < previous:
+                    self.late_merges.append((canonical['id'], article['id']))
+
+        return canonicals
+
+    def _find(self, fingerprint: int) -> Optional[int]:
+        """같은 밴드 값을 가진 후보 중 해밍 거리 max_distance 이하인 대표 기사 인덱스"""
+        for band in range(self.bands):
+            key = (band, (fingerprint >> (band * self.band_bits)) & self.band_mask)
+            for index in self._buckets.get(key, ()):
+                if (fingerprint ^ self._fingerprints[index]).bit_count() <= self.max_distance:
+                    return index
+        return None
+
+    def _register(self, article: Dict, fingerprint: int):
+        index = len(self._canonicals)
+        self._canonicals.append(article)
+        self._fingerprints.append(fingerprint)
+        for band in range(self.bands):
+            key = (band, (fingerprint >> (band * self.band_bits)) & self.band_mask)
+            self._buckets.setdefault(key, []).append(index)
+
+    def _features(self, article: Dict) -> Dict[str, int]:
+        """제목/발췌문 단어 unigram + bigram → 가중치 (제목 특징은 2배)"""
+        features = {}
+        for text, weight in ((article.get('excerpt', ''), 1), (article.get('title', ''), 2)):
+            tokens = self.TOKEN_PATTERN.findall(text.lower())
+            for shingle in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+                features[shingle] = weight
+        return features
+
+    def _fingerprints_for(self, articles: List[Dict]) -> List[Optional[int]]:
+        """배치 단위로 SimHash 계산 (비트별 가중 합을 NumPy로 한 번에 집계)"""
+        feature_maps = [self._features(article) for article in articles]
+        eligible = [i for i, features in enumerate(feature_maps) if len(features) >= self.min_features]
+        fingerprints: List[Optional[int]] = [None] * len(articles)
+        if not eligible:
+            return fingerprints
+
+        # 프로세스 내에서만 쓰는 지문이므로 내장 hash()로 충분
+        hashes = np.array(
+            [hash(feature) & 0xFFFFFFFFFFFFFFFF for i in eligible for feature in feature_maps[i]],
+            dtype=np.uint64
+        )
+        weights = np.array(
+            [weight for i in eligible for weight in feature_maps[i].values()],
+            dtype=np.int32
+        )
+        bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+        signed = (bits.astype(np.int32) * 2 - 1) * weights[:, None]
+
+        # 기사별 특징 구간의 시작 위치로 구간 합 계산
+        counts = [len(feature_maps[i]) for i in eligible]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        totals = np.add.reduceat(signed, starts, axis=0)
+
+        packed = np.packbits(totals > 0, axis=1, bitorder='little').view(np.uint64).ravel()
+        for i, fingerprint in zip(eligible, packed):
+            fingerprints[i] = int(fingerprint)
+        return fingerprints
@@ -0,0 +1,4 @@
+from .article import Article
+from .keyword_matcher import KeywordMatcher
+
+__all__ = ['Article', 'KeywordMatcher']
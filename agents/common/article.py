@@ -0,0 +1,150 @@
+import hashlib
+from collections.abc import MutableMapping
+from itertools import chain
+from typing import Any, Dict, Iterator, Optional
+
+
+class Article(MutableMapping):
+    """수집 → 분석 → 필터 → 저장 단계가 공유하는 기사 레코드 (__slots__)
+
+    기존 기사 dict와 같은 방식(article['title'], article.get(...), {**article})으로 읽고 쓸 수 있고,
+    각 단계는 복사본을 만들지 않고 같은 레코드에 필드를 추가한다.
+    FIELDS에 없는 키(이전 형식의 캐시 등)는 별도 dict에 보관한다.
+
+    분석 캐시용 내용 해시와 키워드 hits(제목 + 발췌문 토큰 매칭 결과)는 처음 쓸 때 계산해 두고
+    title / excerpt / source를 article[...] = ... 로 바꾸면 다시 계산한다.
+    (속성 대입 article.title = ... 은 파생 필드를 비우지 않으므로 쓰지 않는다)
+    소문자 텍스트는 hits를 만들 때 한 번만 쓰이므로 기사마다 보관하지 않는다.
+    """
+
+    # 수집 필드 → 분석 필드 → LinkedIn 필터 필드 순 (to_dict / JSON 출력 순서)
+    FIELDS = (
+        'id', 'title', 'url', 'source', 'published_at', 'author', 'excerpt', 'image_url',
+        'language', 'priority', 'bypass_content_filter', 'word_count', 'related_articles',
+        'importance', 'importance_score', 'category', 'tags', 'summary', 'key_points',
+        'matched_keywords', 'keyword_match_count', 'relevance_score', 'relevance_reason'
+    )
+    # 파생 필드 (키 목록 / to_dict에는 나오지 않음)
+    DERIVED = ('_content_hash', '_keyword_hits')
+    # 바뀌면 파생 필드를 다시 계산해야 하는 필드
+    SOURCE_FIELDS = frozenset(('title', 'excerpt', 'source'))
+
+    __slots__ = FIELDS + DERIVED + ('_extra',)
+
+    def __init__(self, **fields: Any):
+        self._extra: Optional[Dict[str, Any]] = None
+        self._content_hash: Optional[str] = None
+        self._keyword_hits = None
+        for key, value in fields.items():
+            if key in _SLOTS:
+                setattr(self, key, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Article':
+        return data if isinstance(data, cls) else cls(**data)
+
+    @staticmethod
+    def hash_content(title: str, excerpt: str, source: str) -> str:
+        """분석 입력(제목 + 발췌문 + 소스) 해시"""
+        return hashlib.md5('\n'.join((title, excerpt, source)).encode()).hexdigest()
+
+    @property
+    def search_text(self) -> str:
+        """키워드 매칭용 제목 + 발췌문 소문자 텍스트"""
+        return f"{self.title} {self.get('excerpt', '')}".lower()
+
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            self._content_hash = self.hash_content(self.title, self.get('excerpt', ''), self.source)
+        return self._content_hash
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON / 캐시 저장용 일반 dict (파생 필드 제외)"""
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                data[name] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def copy(self) -> 'Article':
+        return Article(**self.to_dict())
+
+    def update(self, other: Any = (), **fields: Any):
+        """필드 일괄 대입 (MutableMapping.update는 키마다 __setitem__을 호출하므로 직접 구현)"""
+        items = other.items() if hasattr(other, 'items') else other
+        slots, source_fields = _SLOTS, self.SOURCE_FIELDS
+        source_changed = False
+        for key, value in chain(items, fields.items()):
+            if key in slots:
+                setattr(self, key, value)
+                source_changed = source_changed or key in source_fields
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+        if source_changed:
+            self._content_hash = self._keyword_hits = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # MutableMapping.get은 KeyError 예외로 기본값을 처리하므로 직접 구현
+        if key in _SLOTS:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOTS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _SLOTS:
+            setattr(self, key, value)
+            if key in self.SOURCE_FIELDS:
+                self._content_hash = self._keyword_hits = None
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _SLOTS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOTS:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return sum(1 for name in self.FIELDS if hasattr(self, name)) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        return f"Article(id={self.get('id')!r}, title={self.get('title', '')[:40]!r})"
+
+
+# 필드 슬롯 (파생 필드는 article['_keyword_hits']처럼 키로도 접근 가능)
+_SLOTS = frozenset(Article.FIELDS + Article.DERIVED)
+_MISSING = object()
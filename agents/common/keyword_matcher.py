@@ -0,0 +1,157 @@
+import hashlib
+import re
+from itertools import chain
+from typing import Dict, Iterable, FrozenSet, List, Set, Tuple
+
+from .article import Article
+
+
+class KeywordMatcher:
+    """토큰 인덱스 기반 다중 키워드 매처
+
+    텍스트를 영어(영숫자) / 한국어(한글) 단어 경계로 한 번 토큰화한 뒤,
+    토큰 → 키워드 조회와 여러 단어 키워드(구문)의 연속 토큰 비교로 hits를 만든다.
+    부분 문자열 매칭이 아니므로 'ai'가 "said", 'ban'이 "bank", 'meta'가 "metadata"에
+    걸리지 않는다. 대신 굴절형은 허용한다.
+      - 영어: 복수형 / 과거형 / 진행형 등 (launches, released, banned, agents).
+        어미를 떼면 다른 단어가 되는 단어(news → new, evening → even)는 예외.
+      - 한국어: 조사·어미가 붙은 어절의 앞부분 (출시했다, 규제를)
+
+    공백 단위 어절별 토큰 / 매칭 결과를 매처에 메모해 두므로, 기사 대부분의 단어는
+    정규식 토큰화 없이 dict 조회 한 번으로 처리된다.
+    수집기 / 분석기 / LinkedIn 필터가 같은 매처를 공유하면 기사당 한 번의
+    토큰화 결과(hits)를 각 단계가 자기 키워드 집합과 교집합해 재사용한다.
+    hits는 Article이면 파생 필드에, 일반 dict면 매처의 텍스트 → hits 표에 메모한다
+    (입력 dict는 수정하지 않음).
+    """
+
+    # 영숫자 연속 또는 한글 연속 (하이픈/공백/문자 종류가 바뀌는 곳이 단어 경계)
+    TOKEN_PATTERN = re.compile(r'[a-z0-9]+|[가-힣]+')
+    # 영어 굴절 어미 (어간 + 'e' 복원, ed/ing는 자음 중복 제거까지 후보로 추가)
+    ENGLISH_SUFFIXES = ('ments', 'ment', 'ing', 'ed', 'es', 's')
+    # 굴절 어미처럼 끝나지만 그 자체가 기본형인 단어 (어미를 떼면 다른 단어가 됨)
+    ENGLISH_BASE_FORMS = frozenset({
+        'news', 'series', 'species', 'goes', 'does', 'its', 'his', 'this', 'yes', 'plus', 'thus',
+        'status', 'focus', 'bias', 'lens', 'always', 'need', 'seed', 'feed', 'speed', 'indeed',
+        'shed', 'bed', 'red', 'thing', 'bring', 'string', 'spring', 'during', 'morning', 'evening',
+        'ceiling', 'wedding', 'nothing', 'something', 'everything', 'anything'
+    })
+    # 메모할 어절 수 상한 (넘으면 비우고 다시 채움)
+    MAX_MEMO_SIZE = 200000
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({kw.lower() for kw in keywords if kw})
+        # 매처 식별자: 기사에 캐시된 hits가 이 매처(키워드 + 매칭 방식)로 계산된 것인지 확인용
+        self.version = hashlib.md5(('token2\n' + '\n'.join(self.keywords)).encode()).hexdigest()[:12]
+
+        # 한 단어 키워드: 토큰 → 키워드
+        # 여러 단어 키워드: 앞 토큰들 → {마지막 토큰 → 키워드}, 첫 토큰 → 구문 길이들
+        self._unigrams: Dict[str, Set[str]] = {}
+        self._phrase_tails: Dict[Tuple[str, ...], Dict[str, Set[str]]] = {}
+        self._phrase_lengths: Dict[str, List[int]] = {}
+        for keyword in self.keywords:
+            tokens = self.TOKEN_PATTERN.findall(keyword)
+            if len(tokens) == 1:
+                self._unigrams.setdefault(tokens[0], set()).add(keyword)
+            elif tokens:
+                tails = self._phrase_tails.setdefault(tuple(tokens[:-1]), {})
+                tails.setdefault(tokens[-1], set()).add(keyword)
+                lengths = self._phrase_lengths.setdefault(tokens[0], [])
+                if len(tokens) not in lengths:
+                    lengths.append(len(tokens))
+        self._phrase_heads = frozenset(self._phrase_lengths)
+
+        # 어절 → hits / 어절 → 토큰 목록 / 토큰 → 굴절형 후보 메모
+        self._chunk_hits = _Memo(self._match_chunk)
+        self._chunk_tokens: Dict[str, List[str]] = {}
+        self._token_variants = _Memo(self._variants)
+        # dict 기사의 제목 + 발췌문 → hits 메모
+        self._text_hits = _Memo(self.find)
+
+    def tokenize(self, text: str) -> List[str]:
+        """소문자 텍스트 → 단어 토큰 목록"""
+        return self.TOKEN_PATTERN.findall(text)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """소문자 텍스트에 단어 단위로 포함된 모든 키워드 반환"""
+        # 공백 단위 어절을 메모 조회 (처음 보는 어절만 토큰화 + 굴절형 매칭)
+        chunks = text.split()
+        if len(self._chunk_hits) >= self.MAX_MEMO_SIZE:
+            self._chunk_hits.clear()
+            self._chunk_tokens.clear()
+            self._token_variants.clear()
+            self._text_hits.clear()
+        hits = set().union(*map(self._chunk_hits.__getitem__, chunks))
+
+        # 구문 키워드: 첫 토큰 위치마다 앞 토큰들이 일치하면 마지막 토큰은 굴절형까지 비교
+        tokens = list(chain.from_iterable(map(self._chunk_tokens.__getitem__, chunks)))
+        for head in self._phrase_heads.intersection(tokens):
+            start = tokens.index(head)
+            while True:
+                for length in self._phrase_lengths[head]:
+                    end = start + length - 1
+                    tails = self._phrase_tails.get(tuple(tokens[start:end]))
+                    if tails and end < len(tokens):
+                        for tail in tails.keys() & self._token_variants[tokens[end]]:
+                            hits |= tails[tail]
+                try:
+                    start = tokens.index(head, start + 1)
+                except ValueError:
+                    break
+
+        return frozenset(hits)
+
+    def article_hits(self, article: Dict) -> FrozenSet[str]:
+        """기사 제목 + 발췌문의 키워드 hits (다음 단계에서 재사용하도록 메모)"""
+        if not isinstance(article, Article):
+            return self._text_hits[f"{article['title']} {article.get('excerpt', '')}".lower()]
+
+        cached = article._keyword_hits
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        hits = self.find(article.search_text)
+        article._keyword_hits = (self.version, hits)
+        return hits
+
+    def _match_chunk(self, chunk: str) -> FrozenSet[str]:
+        """어절의 토큰(과 굴절형 후보)이 가리키는 한 단어 키워드. 토큰 목록도 함께 메모."""
+        tokens = self.tokenize(chunk)
+        self._chunk_tokens[chunk] = tokens
+        hits = set()
+        for token in tokens:
+            for variant in self._variants(token):
+                keywords = self._unigrams.get(variant)
+                if keywords:
+                    hits |= keywords
+        return frozenset(hits)
+
+    def _variants(self, token: str) -> Set[str]:
+        """토큰이 가리킬 수 있는 기본형 후보 (토큰 자신 포함)"""
+        variants = {token}
+        if '가' <= token[0] <= '힣':
+            # 조사/어미가 붙은 어절 → 2글자 이상 앞부분
+            variants.update(token[:end] for end in range(2, len(token)))
+            return variants
+
+        if token in self.ENGLISH_BASE_FORMS:
+            return variants
+        for suffix in self.ENGLISH_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                stem = token[:-len(suffix)]
+                variants.add(stem)
+                variants.add(stem + 'e')
+                if suffix in ('ed', 'ing') and stem[-1] == stem[-2]:
+                    variants.add(stem[:-1])  # banned → ban
+        return variants
+
+
+class _Memo(dict):
+    """없는 키는 조회 시 compute(key)로 계산해 저장하는 dict"""
+
+    def __init__(self, compute):
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, key: str):
+        value = self[key] = self._compute(key)
+        return value
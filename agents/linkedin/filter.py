@@ -1,25 +1,106 @@
 import json
+import random
+import threading
 import time
 import logging
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
 
 import anthropic
 
+from agents.common.keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 
+class AdaptiveConcurrency:
+    """동시 요청 수 제한 + 429 / 529 대응 (AIMD)
+
+    - 동시 요청은 limit개까지 (처음에는 max_concurrency)
+    - 429 / 529: 응답 헤더(retry-after, anthropic-ratelimit-*-reset)가 알려준 시각까지 모든 요청을 멈추고
+      limit을 절반으로 줄인 뒤, 성공이 limit건 쌓일 때마다 1씩 회복
+    """
+
+    def __init__(self, max_concurrency: int = 8, backoff_base: float = 1.0, backoff_max: float = 30.0):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._successes = 0
+        self.stats = {'throttled': 0, 'max_in_flight': 0, 'min_limit': max_concurrency}
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                delay = self._paused_until - time.monotonic()
+                if delay <= 0 and self._in_flight < self.limit:
+                    self._in_flight += 1
+                    self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+                    return
+                self._cond.wait(timeout=delay if delay > 0 else None)
+
+    def release(self, success: bool):
+        with self._cond:
+            self._in_flight -= 1
+            if success and self.limit < self.max_concurrency:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+    def throttle(self, delay: float):
+        """429 / 529: delay초 동안 전체 대기 + 동시 요청 수 절반"""
+        with self._cond:
+            self.stats['throttled'] += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            self.stats['min_limit'] = min(self.stats['min_limit'], self.limit)
+            self._cond.notify_all()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 상한 안에서 무작위 대기 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
 class NewsFilter:
     """2단계 뉴스 필터링: 키워드 매칭 → Claude API 관련성 평가"""
 
-    def __init__(self, config: Dict[str, Any], api_key: str):
+    # 동시 요청 수를 줄이고 헤더가 알려준 시간만큼 기다릴 상태 코드 (529: overloaded)
+    THROTTLE_STATUS = {429, 529}
+    # 백오프 후 재시도할 상태 코드
+    RETRY_STATUS = {500, 502, 503, 504}
+
+    def __init__(self, config: Dict[str, Any], api_key: str,
+                 matcher: Optional[KeywordMatcher] = None, client: Optional[Any] = None):
         self.keywords = [kw.lower() for kw in config.get('keywords', [])]
+        # 키워드 매처 (orchestrator가 공유 매처를 넘기면 collector/analyzer와 hits 재사용)
+        self.matcher = matcher or KeywordMatcher(self.keywords)
         self.relevance_threshold = config.get('relevance_threshold', 7)
-        self.client = anthropic.Anthropic(api_key=api_key)
+
+        # 관련성 평가 동시 실행 (재시도는 아래 설정으로 직접 하므로 SDK 자동 재시도는 끔)
+        relevance_config = config.get('relevance', {})
+        self.max_retries = relevance_config.get('max_retries', 4)
+        self.concurrency = AdaptiveConcurrency(
+            max_concurrency=relevance_config.get('max_concurrency', 8),
+            backoff_base=relevance_config.get('backoff_base', 1.0),
+            backoff_max=relevance_config.get('backoff_max', 30.0)
+        )
+        # 테스트 / 벤치마크에서는 messages.create만 구현한 가짜 클라이언트를 넘긴다
+        self.client = client or anthropic.Anthropic(api_key=api_key, max_retries=0)
+        self.stats = {'requests': 0, 'retries': 0, 'failed': 0}
+        self._lock = threading.Lock()
 
     def filter(self, articles: List[Dict]) -> List[Dict]:
         """2단계 필터링 실행. 필터링된 기사 리스트 반환."""
         # 1차: 키워드 매칭
-        keyword_matched = self._keyword_filter(articles)
+        keyword_matched = self.keyword_filter(articles)
         print(f"   📋 1차 키워드 필터: {len(articles)}건 → {len(keyword_matched)}건")
 
         if not keyword_matched:
@@ -27,29 +108,25 @@ class NewsFilter:
 
         # 2차: Claude API 관련성 평가
         relevance_filtered = self._relevance_filter(keyword_matched)
-        print(f"   🤖 2차 관련성 평가: {len(keyword_matched)}건 → {len(relevance_filtered)}건")
+        print(f"   🤖 2차 관련성 평가: {len(keyword_matched)}건 → {len(relevance_filtered)}건 "
+              f"(요청 {self.stats['requests']}회, 재시도 {self.stats['retries']}회, "
+              f"429/529 {self.concurrency.stats['throttled']}회, 실패 {self.stats['failed']}건)")
 
         # 관련성 점수 높은 순 정렬
         relevance_filtered.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
 
         return relevance_filtered
 
-    def _keyword_filter(self, articles: List[Dict]) -> List[Dict]:
-        """1차 필터: 제목 + 요약 + 태그에서 키워드 매칭"""
+    def keyword_filter(self, articles: List[Dict]) -> List[Dict]:
+        """1차 필터: 제목 + 요약 + 태그에서 키워드 매칭 (매칭 결과는 기사에 제자리에서 추가)"""
         matched = []
 
         for article in articles:
-            searchable = ' '.join([
-                article.get('title', ''),
-                article.get('summary', ''),
-                article.get('excerpt', ''),
-                ' '.join(article.get('tags', []))
-            ]).lower()
+            hits = self._article_hits(article)
 
-            matched_keywords = [kw for kw in self.keywords if kw in searchable]
+            matched_keywords = [kw for kw in self.keywords if kw in hits]
 
             if matched_keywords:
-                article = article.copy()
                 article['matched_keywords'] = matched_keywords
                 article['keyword_match_count'] = len(matched_keywords)
                 matched.append(article)
@@ -58,38 +135,119 @@ class NewsFilter:
         matched.sort(key=lambda x: x['keyword_match_count'], reverse=True)
         return matched
 
+    def _article_hits(self, article: Dict) -> frozenset:
+        """제목 + 발췌문은 이전 단계 스캔 결과를 재사용하고 요약 + 태그만 추가 스캔"""
+        extra = ' '.join(article.get('tags', []))
+
+        # 요약이 발췌문 앞부분을 잘라낸 것이면 (기본 요약) 다시 스캔할 필요 없음
+        summary = article.get('summary', '')
+        if not article.get('excerpt', '').startswith(summary.rstrip('.')):
+            extra = f"{summary} {extra}"
+
+        return self.matcher.article_hits(article) | self.matcher.find(extra.lower())
+
     def _relevance_filter(self, articles: List[Dict]) -> List[Dict]:
-        """2차 필터: Claude API로 관련성 평가 (Haiku 모델 사용)"""
-        filtered = []
+        """2차 필터: Claude API로 관련성 평가 (Haiku 모델, 최대 max_concurrency건 동시)
 
-        for article in articles:
-            try:
-                score, reason = self._evaluate_relevance(article)
-                article = article.copy()
-                article['relevance_score'] = score
-                article['relevance_reason'] = reason
+        결과는 입력 순서대로 반영하므로 동시 실행해도 출력 순서가 같다.
+        """
+        if not articles:
+            return []
 
-                if score >= self.relevance_threshold:
-                    filtered.append(article)
-                    logger.info(f"  ✅ [{score}/10] {article['title'][:50]} - {reason}")
-                else:
-                    logger.info(f"  ❌ [{score}/10] {article['title'][:50]} - {reason}")
+        workers = min(self.concurrency.max_concurrency, len(articles))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(self._evaluate_with_retry, articles))
 
-            except Exception as e:
+        filtered = []
+        for article, outcome in zip(articles, outcomes):
+            if isinstance(outcome, Exception):
                 # API 호출 실패 시 1차 필터 결과 기준으로 포함
-                logger.warning(f"  ⚠️ 관련성 평가 실패 ({article['title'][:40]}): {e}")
-                article = article.copy()
+                logger.warning(f"  ⚠️ 관련성 평가 실패 ({article['title'][:40]}): {outcome}")
                 article['relevance_score'] = 5  # 기본값
                 article['relevance_reason'] = f"평가 실패 (1차 필터 키워드 매칭: {article.get('keyword_match_count', 0)}건)"
                 # 키워드 매칭 2개 이상이면 포함
                 if article.get('keyword_match_count', 0) >= 2:
                     filtered.append(article)
+                continue
+
+            score, reason = outcome
+            article['relevance_score'] = score
+            article['relevance_reason'] = reason
 
-            # Rate limit 방지
-            time.sleep(0.3)
+            if score >= self.relevance_threshold:
+                filtered.append(article)
+                logger.info(f"  ✅ [{score}/10] {article['title'][:50]} - {reason}")
+            else:
+                logger.info(f"  ❌ [{score}/10] {article['title'][:50]} - {reason}")
 
         return filtered
 
+    def _evaluate_with_retry(self, article: Dict) -> Any:
+        """(score, reason) 또는 최종 실패 예외
+
+        429 / 529는 헤더가 알려준 시간만큼 전체 대기 + 동시 요청 수 감소 후 재시도,
+        5xx / 연결 오류는 백오프 후 재시도, 그 밖의 오류(4xx, 응답 파싱 실패)는 바로 실패.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.concurrency.acquire()
+            success = False
+            try:
+                self._count('requests')
+                result = self._evaluate_relevance(article)
+                success = True
+                return result
+            except anthropic.APIStatusError as e:
+                error = e
+                if e.status_code in self.THROTTLE_STATUS:
+                    delay = self._retry_after(e)
+                    self.concurrency.throttle(delay if delay is not None else self.concurrency.backoff_delay(attempt))
+                    wait = 0.0
+                elif e.status_code in self.RETRY_STATUS:
+                    wait = self.concurrency.backoff_delay(attempt)
+                else:
+                    break
+            except anthropic.APIConnectionError as e:
+                error = e
+                wait = self.concurrency.backoff_delay(attempt)
+            except Exception as e:
+                error = e
+                break
+            finally:
+                self.concurrency.release(success)
+
+            if attempt < self.max_retries:
+                self._count('retries')
+                time.sleep(wait)
+
+        self._count('failed')
+        return error
+
+    @staticmethod
+    def _retry_after(error: anthropic.APIStatusError) -> Optional[float]:
+        """응답 헤더의 대기 시간 (retry-after 초, 없으면 anthropic-ratelimit-*-reset 시각까지)"""
+        headers = error.response.headers if error.response is not None else {}
+        try:
+            return max(0.0, float(headers['retry-after']))
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        delays = []
+        for name in ('anthropic-ratelimit-requests-reset', 'anthropic-ratelimit-tokens-reset',
+                     'anthropic-ratelimit-input-tokens-reset', 'anthropic-ratelimit-output-tokens-reset'):
+            value = headers.get(name)
+            if not value:
+                continue
+            try:
+                reset = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                continue
+            delays.append((reset - datetime.now(timezone.utc)).total_seconds())
+        return max(0.0, max(delays)) if delays else None
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
     def _evaluate_relevance(self, article: Dict) -> tuple:
         """Claude Haiku로 개별 기사 관련성 평가. (score, reason) 반환."""
         prompt = f"""다음 뉴스 기사가 B2B SaaS Sales/BizOps 실무자에게 링크드인 포스트로 작성할 만한 인사이트를 줄 수 있는지 평가해주세요.
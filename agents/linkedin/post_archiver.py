@@ -1,72 +1,206 @@
-import requests
-import time
 import logging
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
+
+import requests
+
+from agents.archiver.sinks import ArchiveSink, build_sinks
+from agents.notion.client import NotionAPIError, NotionClient, NotionPageWriter, is_transient
+from agents.notion.mirror import NotionMirror
+from agents.notion.outbox import NotionOutbox
+from agents.notion.schema import NotionSchemaCache
 
 logger = logging.getLogger(__name__)
 
 
 class PostArchiver:
-    """생성된 LinkedIn 포스트를 노션 DB에 저장"""
+    """생성된 LinkedIn 포스트를 노션 DB + 로컬 저장소(JSONL / SQLite / Parquet)에 저장"""
 
-    BASE_URL = "https://api.notion.com/v1"
-    MAX_RETRIES = 3
+    URL_PROPERTY = "Source URL"
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], client: Optional[NotionClient] = None,
+                 mirror: Optional[NotionMirror] = None, outbox: Optional[NotionOutbox] = None):
         self.token = config['integration_token']
         self.database_id = config['database_id']
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
+        # 커넥션 풀 + 공유 속도 제한 클라이언트 (429 / 5xx 재시도 포함, orchestrator가 뉴스 archiver와 공유)
+        self.client = client or NotionClient(self.token)
+        self.writer = NotionPageWriter(config.get('writer', {}).get('max_workers', 4))
+        # 저장소: 로컬 일괄 저장소(flush 때 한 번에 저장) + 노션(선택)
+        sinks_config = config.get('sinks', {})
+        self.sinks: List[ArchiveSink] = build_sinks(sinks_config, 'posts')
+        self.notion_enabled = sinks_config.get('notion', {}).get('enabled', True)
+        # DB 스키마 캐시: 전송 전에 payload를 스키마 / 요청 제한에 맞춤 (400 왕복 없이 검증)
+        self.schemas = NotionSchemaCache(self.client, config.get('schema', {}).get('ttl_seconds', 3600))
+        # 포스트 DB 로컬 미러 (포스트 이력 조회 + 저장 결과 기록)
+        self.mirror = mirror
+        self.mirror_sync: Optional[Dict[str, Any]] = None
+        # 생성된 포스트 payload를 전송 전에 기록 (실패해도 포스트 생성 결과를 잃지 않고 drain()에서 재전송)
+        self.outbox = outbox
+
+    def posted_source_urls(self) -> Optional[Set[str]]:
+        """이미 포스트를 만든 원문 URL 집합 (노션 / 미러를 쓰지 않거나 동기화에 실패하면 None)"""
+        if self.mirror is None or not self.notion_enabled:
+            return None
+        if self.mirror_sync is None:
+            try:
+                self.mirror_sync = self.mirror.sync(self.client, self.database_id, self.URL_PROPERTY)
+            except (requests.RequestException, RuntimeError) as e:
+                logger.warning(f"  ⚠️ 포스트 DB 미러 동기화 실패: {e}")
+                return None
+        return self.mirror.urls(self.database_id)
 
     def archive(self, posts: List[Dict]) -> Dict[str, Any]:
-        """포스트 목록을 노션에 저장"""
+        """포스트 목록을 로컬 저장소(flush 때 일괄 저장)와 노션에 저장"""
         results = {
             'success': 0,
             'failed': 0,
             'errors': []
         }
 
-        for post in posts:
-            success = False
-            last_error = None
-
-            for attempt in range(1, self.MAX_RETRIES + 1):
-                try:
-                    page = self._create_page(post)
-                    results['success'] += 1
-                    page_url = page.get('url', 'N/A')
-                    logger.info(f"  ✅ 저장 완료: {post.get('title', '')[:40]} → {page_url}")
-                    success = True
-                    break
-                except Exception as e:
-                    last_error = e
-                    if attempt < self.MAX_RETRIES:
-                        logger.warning(f"  ⚠️ 저장 재시도 {attempt}/{self.MAX_RETRIES}: {e}")
-                        time.sleep(1)
-
-            if not success:
+        for sink in self.sinks:
+            sink.add(posts)
+        if not self.notion_enabled:
+            return results
+
+        # 포스트별 저장을 동시 실행, 결과는 포스트 순서대로
+        for post, outcome in zip(posts, self.writer.run(self._archive_post, posts)):
+            if isinstance(outcome, Exception):
                 results['failed'] += 1
                 error_info = {
                     'title': post.get('title', ''),
-                    'error': str(last_error)
+                    'error': str(outcome)
                 }
                 results['errors'].append(error_info)
                 print(f"   ❌ 저장 실패: {post.get('title', '')[:40]}")
                 print(f"      본문 미리보기: {post.get('body', '')[:100]}...")
+                continue
 
-            # Rate limit 방지
-            time.sleep(0.5)
+            results['success'] += 1
+            if self.mirror is not None:
+                self.mirror.record(self.database_id, [outcome], self.URL_PROPERTY)
+            page_url = outcome.get('url', 'N/A')
+            logger.info(f"  ✅ 저장 완료: {post.get('title', '')[:40]} → {page_url}")
 
         return results
 
-    def _create_page(self, post: Dict) -> Dict:
-        """노션 페이지 생성"""
-        url = f"{self.BASE_URL}/pages"
+    def flush(self) -> Dict[str, int]:
+        """로컬 저장소에 모아 둔 포스트를 저장소마다 한 번에 쓰기. 저장소별 기록 수 반환."""
+        return {sink.name: sink.flush() for sink in self.sinks}
+
+    def drain(self) -> Dict[str, Any]:
+        """outbox에 남은 포스트 payload 재전송 (포스트를 다시 생성하지 않음)
 
+        응답만 유실되고 페이지는 이미 만들어졌을 수 있으므로 미러의 포스트 이력에 있는 원문 URL은 건너뛴다.
+        미러를 쓰지 않거나 동기화에 실패하면 원문 URL별로 DB를 조회하고, 조회도 실패한 항목은 outbox에 남긴다.
+        """
+        results = {'success': 0, 'skipped': 0, 'failed': 0, 'errors': []}
+        if self.outbox is None or not self.notion_enabled:
+            return results
+        entries = self.outbox.pending('post', self.database_id)
+        if not entries:
+            return results
+
+        posted = self.posted_source_urls()
+        to_send = []
+        for entry in entries:
+            source_url = entry['meta'].get('source_url')
+            try:
+                if posted is not None:
+                    exists = source_url in posted
+                else:
+                    exists = self._is_posted(source_url)
+            except (NotionAPIError, requests.RequestException) as e:
+                results['failed'] += 1
+                results['errors'].append({'title': entry['meta'].get('title', ''), 'error': str(e)})
+                continue
+
+            if exists:
+                self.outbox.ack(entry['id'])
+                results['skipped'] += 1
+            else:
+                to_send.append(entry)
+
+        for entry, outcome in zip(to_send, self.writer.run(self._replay, to_send)):
+            if isinstance(outcome, Exception):
+                results['failed'] += 1
+                results['errors'].append({'title': entry['meta'].get('title', ''), 'error': str(outcome)})
+                continue
+
+            results['success'] += 1
+            if self.mirror is not None:
+                self.mirror.record(self.database_id, [outcome], self.URL_PROPERTY)
+
+        return results
+
+    def _is_posted(self, source_url: Optional[str]) -> bool:
+        """원문 URL로 포스트 DB 조회 (원문 URL이 없는 포스트는 확인할 수 없어 False)"""
+        if not source_url:
+            return False
+        payload = {
+            "filter": {
+                "property": self.URL_PROPERTY,
+                "url": {
+                    "equals": source_url
+                }
+            },
+            "page_size": 1
+        }
+
+        response = self.client.query_database(self.database_id, payload)
+        if response.status_code != 200:
+            raise NotionAPIError.from_response(response)
+        return len(response.json().get('results', [])) > 0
+
+    def _archive_post(self, post: Dict) -> Dict:
+        """포스트 1개 저장 (outbox에 payload를 기록한 뒤 전송)"""
+        payload = self._page_payload(post)
+        entry_id = None
+        if self.outbox is not None:
+            entry_id = self.outbox.enqueue('post', self.database_id, payload, {
+                'title': post.get('title', ''),
+                'source_url': post.get('source_url', '')
+            }, key=post.get('source_url') or None)
+        return self._deliver(payload, entry_id)
+
+    def _replay(self, entry: Dict) -> Dict:
+        return self._deliver(entry['payload'], entry['id'])
+
+    def _deliver(self, payload: Dict, entry_id: Optional[int] = None) -> Dict:
+        """페이지 생성. 성공하면 outbox 항목 ack, 실패하면 실패 기록 후 예외.
+
+        rate_limiter가 노션이 처리하지 않은 것이 확실한 오류(429 / 연결 수립 실패)만 재시도하므로 여기서는
+        재시도하지 않는다. 응답을 받지 못한 요청은 페이지가 이미 생겼을 수 있어 outbox에 남기고,
+        다음 drain이 원문 URL을 확인한 뒤 재전송한다.
+        """
+        try:
+            page = self._create_page(payload)
+        except Exception as e:
+            if entry_id is not None:
+                self.outbox.fail(entry_id, str(e), permanent=not is_transient(e))
+            raise
+
+        if entry_id is not None:
+            self.outbox.ack(entry_id)
+        return page
+
+    def _create_page(self, payload: Dict) -> Dict:
+        """payload를 검증 / 정규화해 노션 페이지 생성 (100개를 넘는 블록은 생성 후 추가)"""
+        page_payload, overflow = self.schemas.normalize(self.database_id, payload)
+        response = self.client.create_page(page_payload)
+
+        if response.status_code != 200:
+            raise NotionAPIError.from_response(response)
+
+        page = response.json()
+        if overflow:
+            try:
+                self.client.append_block_children(page['id'], overflow)
+            except (NotionAPIError, requests.RequestException) as e:
+                logger.warning(f"  ⚠️ 본문 블록 {len(overflow)}개 추가 실패: {e}")
+        return page
+
+    def _page_payload(self, post: Dict) -> Dict:
+        """페이지 생성 요청 payload (속성 + 본문 블록)"""
         # rich_text 2000자 제한 처리 - 본문을 여러 블록으로 분할
         body_text = post.get('body', '')
 
@@ -106,19 +240,12 @@ class PostArchiver:
         # 본문 블록 생성
         children = self._create_content_blocks(post)
 
-        payload = {
+        return {
             "parent": {"database_id": self.database_id},
             "properties": properties,
             "children": children
         }
 
-        response = requests.post(url, headers=self.headers, json=payload, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Notion API 에러 ({response.status_code}): {response.text[:300]}")
-
-        return response.json()
-
     def _create_content_blocks(self, post: Dict) -> List[Dict]:
         """페이지 본문 블록 생성"""
         blocks = []
@@ -0,0 +1,10 @@
+from .client import NotionAPIError, NotionClient, NotionPageWriter, NotionValidationError, is_transient
+from .mirror import NotionMirror
+from .outbox import NotionOutbox
+from .rate_limiter import NotionRateLimiter
+from .schema import NotionSchemaCache
+
+__all__ = [
+    'NotionAPIError', 'NotionClient', 'NotionMirror', 'NotionOutbox', 'NotionPageWriter',
+    'NotionRateLimiter', 'NotionSchemaCache', 'NotionValidationError', 'is_transient'
+]
@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import NotionRateLimiter
+
+T = TypeVar('T')
+
+
+class NotionAPIError(Exception):
+    """노션 API 오류 응답
+
+    429 / 409 / 5xx는 일시적 오류(재시도 대상), 나머지 4xx(검증 / 권한 / 없는 DB)는 재시도해도
+    같은 결과인 영구 오류다.
+    """
+
+    TRANSIENT_STATUS = {409, 429, 500, 502, 503, 504}
+
+    def __init__(self, status: int, message: str, code: str = ''):
+        super().__init__(f"Notion API {status} {code}: {message}" if code else f"Notion API {status}: {message}")
+        self.status = status
+        self.code = code
+
+    @property
+    def permanent(self) -> bool:
+        return self.status not in self.TRANSIENT_STATUS
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> 'NotionAPIError':
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        return cls(response.status_code, body.get('message') or response.text[:300], body.get('code', ''))
+
+
+class NotionValidationError(ValueError):
+    """로컬 payload 검증 실패 (스키마와 맞지 않는 속성 등, 전송해도 400이 되는 영구 오류)"""
+
+
+def is_transient(error: Exception) -> bool:
+    """다시 시도하면 성공할 수 있는 오류인지 (연결 오류 / 429 / 409 / 5xx)"""
+    if isinstance(error, NotionAPIError):
+        return not error.permanent
+    return isinstance(error, requests.RequestException)
+
+
+class NotionClient:
+    """노션 API 클라이언트 (커넥션 풀 Session + 공유 속도 제한)
+
+    요청마다 새 연결(TLS 핸드셰이크)을 맺지 않도록 하나의 requests.Session을 재사용하고,
+    모든 요청은 rate_limiter(토큰 버킷 + 429 / 5xx 재시도, 페이지 생성 등 비멱등 요청은 429 / 연결 실패만)를 거친다.
+    뉴스 archiver / LinkedIn post_archiver가 같은 인스턴스를 공유할 수 있다.
+    """
+
+    BASE_URL = "https://api.notion.com/v1"
+    NOTION_VERSION = "2022-06-28"
+
+    def __init__(self, token: str, rate_limiter: Optional[NotionRateLimiter] = None,
+                 pool_size: int = 10, timeout: int = 30, base_url: Optional[str] = None):
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or NotionRateLimiter()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Notion-Version": self.NOTION_VERSION
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                idempotent: Optional[bool] = None) -> requests.Response:
+        """속도 제한을 거쳐 요청 (path는 '/pages'처럼 BASE_URL 이후 경로)
+
+        idempotent가 False(GET 외 기본값)이면 429 / 연결 수립 실패만 재시도한다.
+        """
+        return self.rate_limiter.request(
+            method, f"{self.base_url}{path}", session=self.session, idempotent=idempotent,
+            json=payload, timeout=self.timeout
+        )
+
+    def query_database(self, database_id: str, payload: Dict) -> requests.Response:
+        # 조회만 하는 POST이므로 응답을 못 받아도 다시 보내도 된다
+        return self.request('POST', f"/databases/{database_id}/query", payload, idempotent=True)
+
+    def create_page(self, payload: Dict) -> requests.Response:
+        return self.request('POST', '/pages', payload)
+
+    def retrieve_database(self, database_id: str) -> requests.Response:
+        return self.request('GET', f"/databases/{database_id}")
+
+    def append_block_children(self, block_id: str, children: List[Dict], chunk_size: int = 100):
+        """블록 하위에 children 추가 (요청당 chunk_size개씩, 실패 시 NotionAPIError)"""
+        for start in range(0, len(children), chunk_size):
+            response = self.request(
+                'PATCH', f"/blocks/{block_id}/children", {"children": children[start:start + chunk_size]}
+            )
+            if response.status_code != 200:
+                raise NotionAPIError.from_response(response)
+
+    def close(self):
+        self.session.close()
+
+
+class NotionPageWriter:
+    """페이지 생성 등 독립적인 노션 쓰기를 max_workers개까지 동시에 실행
+
+    실제 요청 속도는 클라이언트의 공유 속도 제한이 정하고, 동시 실행은 응답 대기 시간을 겹치게 한다.
+    결과는 입력 순서대로 반환하며 실패한 항목은 예외 객체로 돌려준다 (호출 측에서 성공/실패 집계).
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+
+    def run(self, write: Callable[[Any], T], items: List[Any]) -> List[Union[T, Exception]]:
+        if not items:
+            return []
+        if self.max_workers <= 1 or len(items) == 1:
+            return [self._call(write, item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self._call(write, item), items))
+
+    @staticmethod
+    def _call(write: Callable[[Any], T], item: Any) -> Union[T, Exception]:
+        try:
+            return write(item)
+        except Exception as e:
+            return e
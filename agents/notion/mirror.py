@@ -0,0 +1,157 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .client import NotionClient
+
+
+class NotionMirror:
+    """노션 데이터베이스 로컬 미러 (SQLite)
+
+    데이터베이스별로 처음 한 번 전체 페이지를 받아 두고, 이후에는 last_edited_time이
+    저장된 워터마크 이후인 페이지만 조회해 반영한다 (델타 동기화).
+    archiver가 페이지를 만들 때마다 응답을 바로 기록하므로 중복 확인 / 리포트 / 포스트 이력 조회는
+    노션 API를 호출하지 않는다.
+
+    노션 query는 보관(삭제)된 페이지를 돌려주지 않으므로, 노션에서 지운 페이지는 미러에 남는다.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, path: str = 'data/cache/notion_mirror.sqlite'):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "page_id TEXT PRIMARY KEY, database_id TEXT NOT NULL, url TEXT, title TEXT, "
+            "created_time TEXT, last_edited_time TEXT, properties TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_database_url ON pages (database_id, url)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "database_id TEXT PRIMARY KEY, watermark TEXT, synced_at TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def sync(self, client: NotionClient, database_id: str, url_property: str = 'URL') -> Dict[str, Any]:
+        """워터마크 이후 수정된 페이지만 조회해 반영 (워터마크가 없으면 전체 조회)
+
+        노션의 last_edited_time은 분 단위로 기록되므로 워터마크와 같은 시각부터 다시 조회하고
+        page_id 기준으로 덮어쓴다. 실패하면 requests 예외 / RuntimeError를 그대로 던진다.
+        """
+        watermark = self.watermark(database_id)
+        payload: Dict[str, Any] = {
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+            "page_size": self.PAGE_SIZE
+        }
+        if watermark:
+            payload["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": watermark}
+            }
+
+        stats = {'mode': 'delta' if watermark else 'full', 'queries': 0, 'pages': 0}
+        latest = watermark
+        while True:
+            stats['queries'] += 1
+            response = client.query_database(database_id, payload)
+            if response.status_code != 200:
+                raise RuntimeError(f"Mirror sync failed ({response.status_code}): {response.text[:300]}")
+
+            data = response.json()
+            pages = data.get('results', [])
+            self.record(database_id, pages, url_property)
+            stats['pages'] += len(pages)
+            for page in pages:
+                edited = page.get('last_edited_time')
+                if edited and (latest is None or edited > latest):
+                    latest = edited
+            if not data.get('has_more'):
+                break
+            payload['start_cursor'] = data['next_cursor']
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (database_id, watermark, synced_at) VALUES (?, ?, ?)",
+                (database_id, latest, datetime.utcnow().isoformat())
+            )
+            self._conn.commit()
+        return stats
+
+    def record(self, database_id: str, pages: List[Dict], url_property: str = 'URL'):
+        """노션 페이지 객체(query 결과 / 페이지 생성 응답)를 미러에 기록"""
+        rows = []
+        for page in pages:
+            properties = page.get('properties', {})
+            rows.append((
+                page['id'], database_id,
+                properties.get(url_property, {}).get('url'),
+                self._title(properties),
+                page.get('created_time'), page.get('last_edited_time'),
+                json.dumps(properties, ensure_ascii=False)
+            ))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages "
+                "(page_id, database_id, url, title, created_time, last_edited_time, properties) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def watermark(self, database_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE database_id = ?", (database_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def urls(self, database_id: str) -> Set[str]:
+        """데이터베이스에 저장된 페이지 URL 집합"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM pages WHERE database_id = ? AND url IS NOT NULL", (database_id,)
+            )
+            return {row[0] for row in rows}
+
+    def pages(self, database_id: str, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """저장된 페이지 목록 (since: created_time 하한, ISO 형식). 최근 생성 순."""
+        query = "SELECT page_id, url, title, created_time, last_edited_time, properties FROM pages WHERE database_id = ?"
+        params: List[Any] = [database_id]
+        if since:
+            query += " AND created_time >= ?"
+            params.append(since)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_time DESC", params).fetchall()
+        return [
+            {'id': page_id, 'url': url, 'title': title, 'created_time': created_time,
+             'last_edited_time': last_edited_time, 'properties': json.loads(properties)}
+            for page_id, url, title, created_time, last_edited_time, properties in rows
+        ]
+
+    def count(self, database_id: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM pages WHERE database_id = ?", (database_id,)
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _title(properties: Dict[str, Any]) -> str:
+        """title 타입 속성의 텍스트 (속성 이름은 데이터베이스마다 다름)"""
+        for value in properties.values():
+            if value.get('type') == 'title' or 'title' in value:
+                return ''.join(
+                    part.get('plain_text') or part.get('text', {}).get('content', '')
+                    for part in value.get('title', [])
+                )
+        return ''
@@ -0,0 +1,133 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class NotionOutbox:
+    """노션 페이지 쓰기 outbox (SQLite write-ahead 큐)
+
+    archiver가 완성된 페이지 payload를 전송 전에 기록하고 200 응답을 받으면 삭제(ack)한다.
+    전송에 실패한 항목은 남아 있다가 다음 실행 시작(또는 `outbox drain`)에 수집 / 분석 / 포스트 생성을
+    다시 하지 않고 그대로 재전송된다. max_attempts번 실패했거나 영구 오류(검증 실패 / 4xx)로 실패한 항목은
+    더 이상 재전송하지 않고 보관만 한다.
+    같은 페이지(kind, database_id, key — 뉴스 URL / 포스트 원문 URL)는 항목 하나만 유지한다.
+    """
+
+    def __init__(self, path: str = 'data/cache/notion_outbox.sqlite', max_attempts: int = 5):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, database_id TEXT NOT NULL, "
+            "payload TEXT NOT NULL, meta TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "last_error TEXT, created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        # key 컬럼이 없던 이전 outbox 파일은 컬럼을 추가하고 기존 항목의 meta URL로 채움
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if 'key' not in columns:
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN key TEXT")
+            self._conn.execute(
+                "UPDATE outbox SET key = NULLIF(json_extract(meta, CASE kind WHEN 'news' THEN '$.url' "
+                "ELSE '$.source_url' END), '')"
+            )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_kind ON outbox (kind, database_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_key ON outbox (kind, database_id, key)")
+        self._conn.commit()
+
+    def enqueue(self, kind: str, database_id: str, payload: Dict[str, Any],
+                meta: Optional[Dict[str, Any]] = None, key: Optional[str] = None) -> int:
+        """전송 전 payload 기록. 항목 ID 반환.
+
+        kind: 'news' | 'post', meta: 재전송 후 처리에 필요한 정보 (기사 ID, URL, 제목 등),
+        key: 같은 페이지 식별자 (URL). 같은 key의 항목이 남아 있으면 새 payload로 교체하고 시도 횟수를 초기화한다.
+        """
+        now = datetime.utcnow().isoformat()
+        payload_json = json.dumps(payload, ensure_ascii=False)
+        meta_json = json.dumps(meta or {}, ensure_ascii=False)
+        with self._lock:
+            existing = None
+            if key:
+                existing = self._conn.execute(
+                    "SELECT id FROM outbox WHERE kind = ? AND database_id = ? AND key = ? ORDER BY id LIMIT 1",
+                    (kind, database_id, key)
+                ).fetchone()
+            if existing:
+                entry_id = existing[0]
+                self._conn.execute(
+                    "UPDATE outbox SET payload = ?, meta = ?, attempts = 0, last_error = NULL, updated_at = ? "
+                    "WHERE id = ?",
+                    (payload_json, meta_json, now, entry_id)
+                )
+            else:
+                entry_id = self._conn.execute(
+                    "INSERT INTO outbox (kind, database_id, key, payload, meta, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, database_id, key, payload_json, meta_json, now, now)
+                ).lastrowid
+            self._conn.commit()
+            return entry_id
+
+    def ack(self, entry_id: int):
+        """전송 완료 (200 응답) 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+            self._conn.commit()
+
+    def fail(self, entry_id: int, error: str, permanent: bool = False):
+        """전송 실패 기록 (시도 횟수 증가, 영구 오류는 바로 재전송 중단)"""
+        floor = self.max_attempts if permanent else 0
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = MAX(attempts + 1, ?), last_error = ?, updated_at = ? WHERE id = ?",
+                (floor, error[:1000], datetime.utcnow().isoformat(), entry_id)
+            )
+            self._conn.commit()
+
+    def pending(self, kind: str, database_id: str) -> List[Dict[str, Any]]:
+        """재전송할 항목 (시도 횟수가 max_attempts 미만, 기록 순)
+
+        같은 key의 항목이 여러 개면(key 중복 제거 이전에 쌓인 항목) 첫 항목만 남기고 나머지는 삭제한다.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, key, payload, meta, attempts FROM outbox "
+                "WHERE kind = ? AND database_id = ? AND attempts < ? ORDER BY id",
+                (kind, database_id, self.max_attempts)
+            ).fetchall()
+
+            entries, keys, duplicates = [], set(), []
+            for entry_id, key, payload, meta, attempts in rows:
+                if key is not None and key in keys:
+                    duplicates.append((entry_id,))
+                    continue
+                if key is not None:
+                    keys.add(key)
+                entries.append({
+                    'id': entry_id, 'payload': json.loads(payload), 'meta': json.loads(meta), 'attempts': attempts
+                })
+            if duplicates:
+                self._conn.executemany("DELETE FROM outbox WHERE id = ?", duplicates)
+                self._conn.commit()
+        return entries
+
+    def stats(self) -> Dict[str, int]:
+        """대기 / 재전송 중단(max_attempts 초과) 항목 수"""
+        with self._lock:
+            pending, dead = self._conn.execute(
+                "SELECT COALESCE(SUM(attempts < ?), 0), COALESCE(SUM(attempts >= ?), 0) FROM outbox",
+                (self.max_attempts, self.max_attempts)
+            ).fetchone()
+        return {'pending': pending, 'dead': dead}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
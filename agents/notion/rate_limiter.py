@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+class NotionRateLimiter:
+    """노션 API 공유 토큰 버킷 + 재시도
+
+    뉴스 archiver / LinkedIn post_archiver 등 모든 노션 호출이 같은 인스턴스를 거친다.
+      - 평균 rate건/초, 최대 burst건까지 연속 요청 (노션 권장: 평균 3건/초, 순간 버스트 허용)
+      - 429: Retry-After 동안 모든 스레드의 요청을 멈추고, 요청 속도를 절반으로 낮춘 뒤
+        성공할 때마다 조금씩 원래 속도로 회복 (AIMD)
+      - 5xx / 409 / 연결 오류: 지터를 준 지수 백오프로 재시도
+    멱등이 아닌 요청(페이지 생성, 블록 추가)은 노션이 처리하지 않았음이 확실한 경우(429, 연결 수립 실패)만
+    재시도한다. 응답 타임아웃 / 5xx 뒤에는 이미 페이지가 만들어졌을 수 있으므로 호출자에게 넘겨
+    outbox가 URL을 확인한 뒤 재전송하게 한다.
+    """
+
+    # 재시도할 상태 코드 (409: 동시 수정 충돌, 노션 문서상 재시도 대상)
+    RETRY_STATUS = {409, 500, 502, 503, 504}
+
+    def __init__(self, rate: float = 3.0, burst: int = 5, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Retry-After로 지정된 전역 대기 종료 시각
+        self._paused_until = 0.0
+
+        self._stats = {
+            'requests': 0, 'throttled': 0, 'retries': 0, 'errors': 0,
+            'wait_seconds': 0.0, 'max_wait_seconds': 0.0
+        }
+
+    def acquire(self) -> float:
+        """토큰 1개를 얻을 때까지 대기. 대기한 시간(초) 반환."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    self._stats['wait_seconds'] += waited
+                    self._stats['max_wait_seconds'] = max(self._stats['max_wait_seconds'], waited)
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def request(self, method: str, url: str, session: Optional[requests.Session] = None,
+                idempotent: Optional[bool] = None, **kwargs: Any) -> requests.Response:
+        """토큰을 얻어 요청하고 429 / 일시적 오류는 재시도. 마지막 응답(또는 예외)을 그대로 반환.
+
+        idempotent: 다시 보내도 결과가 같은 요청인지 (기본: GET만). False이면 429 / 연결 수립 실패만 재시도.
+        """
+        if idempotent is None:
+            idempotent = method.upper() == 'GET'
+        sender = session or requests
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            with self._lock:
+                self._stats['requests'] += 1
+
+            try:
+                response = sender.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._count('errors')
+                if attempt == self.max_retries or not (idempotent or self._not_sent(e)):
+                    raise
+                self._backoff(attempt)
+                continue
+
+            if response.status_code == 429:
+                self._throttle(response.headers.get('Retry-After'), attempt)
+                if attempt == self.max_retries:
+                    return response
+                continue
+
+            if response.status_code in self.RETRY_STATUS:
+                self._count('errors')
+                if attempt == self.max_retries or not idempotent:
+                    return response
+                self._backoff(attempt)
+                continue
+
+            self._recover()
+            return response
+
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['wait_seconds'] = round(stats['wait_seconds'], 2)
+        stats['max_wait_seconds'] = round(stats['max_wait_seconds'], 2)
+        stats['rate'] = round(self.rate, 2)
+        return stats
+
+    @staticmethod
+    def _not_sent(error: Exception) -> bool:
+        """연결을 맺기 전에 실패해 요청이 서버에 닿지 않은 오류 (연결 타임아웃, 연결 거부, DNS 실패)"""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def _throttle(self, retry_after: Optional[str], attempt: int):
+        """429: Retry-After(없으면 백오프 시간)만큼 전역 대기 + 요청 속도 절반"""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = self._backoff_delay(attempt)
+        with self._lock:
+            self._stats['throttled'] += 1
+            self._stats['retries'] += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _recover(self):
+        """성공 응답마다 요청 속도를 원래 값 쪽으로 조금씩 회복"""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def _backoff(self, attempt: int):
+        self._count('retries')
+        delay = self._backoff_delay(attempt)
+        with self._lock:
+            self._stats['wait_seconds'] += delay
+        time.sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 상한 안에서 무작위 대기 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from .client import NotionAPIError, NotionClient, NotionValidationError
+
+
+class NotionSchemaCache:
+    """노션 데이터베이스 스키마 캐시 + 페이지 payload 로컬 검증 / 정규화
+
+    데이터베이스 스키마(속성 이름 → 타입 / 옵션)를 ttl_seconds 동안 한 번만 조회하고,
+    전송 전에 payload를 스키마와 노션 요청 제한에 맞춘다. 400 응답을 받은 뒤에야 알던 문제를 미리 처리한다.
+      - 스키마에 없는 속성은 제외 (title 속성은 스키마의 title 속성 이름으로 변경)
+      - select ↔ status 타입 차이는 변환, 그 밖의 타입 불일치는 NotionValidationError (영구 오류)
+      - 옵션 이름: 쉼표 제거, 100자 제한 / multi_select 중복 제거
+      - rich_text: 항목당 2000자를 넘으면 여러 항목으로 분할 (최대 100개)
+      - children: 페이지 생성 요청에는 100개까지만 담고 나머지는 생성 후 블록 추가 요청으로 보냄
+    스키마 조회가 일시적으로 실패하면 스키마 검증 없이 요청 제한만 맞춘다.
+    """
+
+    RICH_TEXT_LIMIT = 2000
+    RICH_TEXT_ITEMS = 100
+    CHILDREN_LIMIT = 100
+    OPTION_NAME_LIMIT = 100
+    MULTI_SELECT_LIMIT = 100
+    URL_LIMIT = 2000
+
+    def __init__(self, client: NotionClient, ttl_seconds: int = 3600):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # database_id → (조회 시각, 속성 정의 또는 조회 실패 시 None / 영구 오류)
+        self._schemas: Dict[str, Tuple[float, Any]] = {}
+        self.stats: Counter = Counter()
+
+    def properties(self, database_id: str) -> Optional[Dict[str, Dict]]:
+        """속성 이름 → 속성 정의. 일시적 조회 실패는 None, 권한 / 없는 DB는 NotionAPIError."""
+        with self._lock:
+            cached = self._schemas.get(database_id)
+            if cached is None or time.monotonic() - cached[0] >= self.ttl_seconds:
+                cached = (time.monotonic(), self._fetch(database_id))
+                self._schemas[database_id] = cached
+        if isinstance(cached[1], NotionAPIError):
+            raise cached[1]
+        return cached[1]
+
+    def normalize(self, database_id: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict]]:
+        """(제한에 맞춘 페이지 생성 payload, 생성 후 추가할 나머지 블록)"""
+        schema = self.properties(database_id)
+
+        properties = {}
+        for name, value in payload.get('properties', {}).items():
+            kind = self._kind(value)
+            if schema is not None:
+                if name not in schema:
+                    title_name = next((key for key, prop in schema.items() if prop['type'] == 'title'), None)
+                    if kind != 'title' or title_name is None:
+                        self._count('dropped_properties')
+                        continue
+                    self._count('renamed_title')
+                    name = title_name
+                expected = schema[name]['type']
+                if kind != expected:
+                    if {kind, expected} != {'select', 'status'}:
+                        raise NotionValidationError(
+                            f"Property '{name}' is {expected} in the database but the payload sends {kind}"
+                        )
+                    value, kind = {expected: value[kind]}, expected
+            properties[name] = self._normalize_property(name, kind, value, schema.get(name) if schema else None)
+
+        children = [self._normalize_block(block) for block in payload.get('children', [])]
+        if len(children) > self.CHILDREN_LIMIT:
+            self._count('overflow_blocks', len(children) - self.CHILDREN_LIMIT)
+
+        normalized = {**payload, 'properties': properties}
+        if 'children' in payload:
+            normalized['children'] = children[:self.CHILDREN_LIMIT]
+        return normalized, children[self.CHILDREN_LIMIT:]
+
+    def _fetch(self, database_id: str) -> Any:
+        """스키마 조회 (properties()가 잠금을 잡은 채 호출하므로 _count를 쓰지 않음)"""
+        try:
+            response = self.client.retrieve_database(database_id)
+        except requests.RequestException:
+            return None
+        if response.status_code == 200:
+            self.stats['schema_fetches'] += 1
+            return response.json().get('properties', {})
+        error = NotionAPIError.from_response(response)
+        return error if error.permanent else None
+
+    def _normalize_property(self, name: str, kind: str, value: Dict, prop: Optional[Dict]) -> Dict:
+        if kind in ('title', 'rich_text'):
+            return {kind: self._split_rich_text(value[kind])}
+
+        if kind in ('select', 'status'):
+            option = value[kind]
+            if not option:
+                return value
+            option_name = self._clean_option(option['name'])
+            if kind == 'status' and prop is not None:
+                # status 옵션은 API로 만들 수 없음
+                names = {item['name'] for item in prop.get('status', {}).get('options', [])}
+                if option_name not in names:
+                    raise NotionValidationError(f"Status '{option_name}' does not exist in property '{name}'")
+            return {kind: {'name': option_name} if option_name else None}
+
+        if kind == 'multi_select':
+            names = []
+            for option in value[kind]:
+                option_name = self._clean_option(option['name'])
+                if option_name and option_name not in names:
+                    names.append(option_name)
+            return {kind: [{'name': option_name} for option_name in names[:self.MULTI_SELECT_LIMIT]]}
+
+        if kind == 'url' and value[kind] and len(value[kind]) > self.URL_LIMIT:
+            raise NotionValidationError(f"URL in property '{name}' exceeds {self.URL_LIMIT} characters")
+
+        return value
+
+    def _normalize_block(self, block: Dict) -> Dict:
+        block_type = block.get('type')
+        body = block.get(block_type)
+        if isinstance(body, dict) and 'rich_text' in body:
+            return {**block, block_type: {**body, 'rich_text': self._split_rich_text(body['rich_text'])}}
+        return block
+
+    def _split_rich_text(self, items: List[Dict]) -> List[Dict]:
+        """content가 2000자를 넘는 text 항목을 같은 서식 / 링크의 여러 항목으로 분할"""
+        result = []
+        for item in items:
+            text = item.get('text')
+            content = text.get('content', '') if text else ''
+            if len(content) <= self.RICH_TEXT_LIMIT:
+                result.append(item)
+                continue
+            self._count('split_text')
+            for start in range(0, len(content), self.RICH_TEXT_LIMIT):
+                result.append({**item, 'text': {**text, 'content': content[start:start + self.RICH_TEXT_LIMIT]}})
+        if len(result) > self.RICH_TEXT_ITEMS:
+            self._count('truncated_text')
+        return result[:self.RICH_TEXT_ITEMS]
+
+    def _clean_option(self, option_name: str) -> str:
+        """옵션 이름은 쉼표를 포함할 수 없고 100자까지"""
+        cleaned = option_name.replace(',', ' ').strip()[:self.OPTION_NAME_LIMIT]
+        if cleaned != option_name:
+            self._count('cleaned_options')
+        return cleaned
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    @staticmethod
+    def _kind(value: Dict) -> str:
+        """속성 값 객체의 타입 키 ({'select': {...}} → 'select')"""
+        return next(key for key in value if key not in ('id', 'type'))
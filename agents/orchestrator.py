@@ -1,17 +1,30 @@
+import argparse
+import heapq
 import os
+import resource
 import yaml
 import json
 import time
+from collections import Counter
+from itertools import count
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
 
+from agents.common.keyword_matcher import KeywordMatcher
 from agents.collector.rss_collector import RSSCollector
+from agents.collector.seen_index import SeenIndex
 from agents.analyzer.analyzer import ContentAnalyzer
+from agents.analyzer.analysis_cache import AnalysisCache
+from agents.analyzer.summarizer import ArticleSummarizer
 from agents.archiver.notion_archiver import NotionArchiver
 from agents.linkedin.filter import NewsFilter
 from agents.linkedin.generator import PostGenerator
 from agents.linkedin.post_archiver import PostArchiver
+from agents.notion.client import NotionClient
+from agents.notion.mirror import NotionMirror
+from agents.notion.outbox import NotionOutbox
+from agents.notion.rate_limiter import NotionRateLimiter
 
 
 class Orchestrator:
@@ -24,23 +37,92 @@ class Orchestrator:
         self.credentials = self._load_credentials()
         self.linkedin_config = self._load_yaml('linkedin.yaml')
 
+        # 공유 키워드 매처: 수집/분석/LinkedIn 필터 키워드를 하나의 오토마톤으로 컴파일
+        self.keyword_matcher = KeywordMatcher(
+            self.sources_config.get('content_keywords', RSSCollector.DEFAULT_KEYWORDS)
+            + ContentAnalyzer.keywords()
+            + self.linkedin_config.get('filter', {}).get('keywords', [])
+        )
+
+        # 이미 아카이브된 기사 인덱스 (수집 직후 제외 → 분석/노션 조회/Haiku 필터 생략)
+        seen_config = self.sources_config.get('seen_index', {})
+        self.seen_index = None
+        if seen_config.get('enabled', True):
+            self.seen_index = SeenIndex(
+                path=seen_config.get('path', 'data/cache/seen.sqlite'),
+                ttl_days=seen_config.get('ttl_days', 7)
+            )
+
         # 에이전트 초기화
-        self.collector = RSSCollector(self.sources_config)
-        self.analyzer = ContentAnalyzer()
+        self.collector = RSSCollector(
+            self.sources_config,
+            matcher=self.keyword_matcher,
+            seen_index=self.seen_index
+        )
+        # 피드가 완료되는 대로 분석/저장까지 진행 (느린 피드가 전체를 막지 않도록)
+        self.streaming = self.sources_config.get('fetch', {}).get('streaming', False)
+
+        # 분석 결과 캐시 (lookback 안에 남아 있는 기사 재분석 생략)
+        analysis_cache_config = self.sources_config.get('analysis_cache', {})
+        analysis_cache = None
+        if analysis_cache_config.get('enabled', True):
+            analysis_cache = AnalysisCache(
+                path=analysis_cache_config.get('path', 'data/cache/analysis.sqlite'),
+                max_entries=analysis_cache_config.get('max_entries', 20000)
+            )
+        # Claude 배치 요약 (API 키가 없으면 발췌문 요약)
+        summarizer_config = self.sources_config.get('summarizer', {})
+        api_key = self.credentials.get('anthropic', {}).get('api_key', '')
+        summarizer = None
+        if summarizer_config.get('enabled', True) and api_key:
+            summarizer = ArticleSummarizer(summarizer_config, api_key=api_key)
+        # 대량 분석(백필 등)은 프로세스 풀로 나눠 채점
+        analysis_config = self.sources_config.get('analysis', {})
+        self.analyzer = ContentAnalyzer(
+            matcher=self.keyword_matcher, cache=analysis_cache, summarizer=summarizer,
+            workers=analysis_config.get('workers', 1),
+            parallel_min_size=analysis_config.get('parallel_min_size')
+        )
+        # 노션 요청 속도 제한: 뉴스 / LinkedIn 포스트 저장이 하나의 토큰 버킷과 커넥션 풀을 공유
+        self.notion_limiter = NotionRateLimiter(**self.notion_config.get('rate_limit', {}))
+        writer_config = self.notion_config.get('writer', {})
+        self.notion_client = NotionClient(
+            self.credentials['notion']['integration_token'],
+            rate_limiter=self.notion_limiter,
+            pool_size=writer_config.get('pool_size', 10)
+        )
+        # 뉴스 / 포스트 DB 로컬 미러 (델타 동기화, 중복 확인과 포스트 이력을 API 호출 없이 조회)
+        mirror_config = self.notion_config.get('mirror', {})
+        self.notion_mirror = None
+        if mirror_config.get('enabled', True):
+            self.notion_mirror = NotionMirror(mirror_config.get('path', 'data/cache/notion_mirror.sqlite'))
+        # 노션 쓰기 outbox (전송 전 payload 기록, 실패분은 다음 실행 시작 / outbox drain에서 재전송)
+        outbox_config = self.notion_config.get('outbox', {})
+        self.notion_outbox = None
+        if outbox_config.get('enabled', True):
+            self.notion_outbox = NotionOutbox(
+                path=outbox_config.get('path', 'data/cache/notion_outbox.sqlite'),
+                max_attempts=outbox_config.get('max_attempts', 5)
+            )
         self.archiver = NotionArchiver({
             'integration_token': self.credentials['notion']['integration_token'],
-            'database_id': self.credentials['notion']['database_id']
-        })
+            'database_id': self.credentials['notion']['database_id'],
+            'duplicate_check': self.notion_config.get('duplicate_check', {}),
+            'writer': writer_config,
+            'schema': self.notion_config.get('schema', {}),
+            'sinks': self.notion_config.get('sinks', {})
+        }, seen_index=self.seen_index, client=self.notion_client, mirror=self.notion_mirror,
+            outbox=self.notion_outbox)
 
         # LinkedIn 포스트 생성 에이전트 초기화
-        api_key = self.credentials.get('anthropic', {}).get('api_key', '')
         linkedin_db_id = self.credentials.get('notion', {}).get('linkedin_database_id', '')
 
         self.linkedin_enabled = bool(api_key and linkedin_db_id)
         if self.linkedin_enabled:
             self.news_filter = NewsFilter(
                 config=self.linkedin_config.get('filter', {}),
-                api_key=api_key
+                api_key=api_key,
+                matcher=self.keyword_matcher
             )
             self.post_generator = PostGenerator(
                 config=self.linkedin_config,
@@ -48,8 +130,11 @@ class Orchestrator:
             )
             self.post_archiver = PostArchiver({
                 'integration_token': self.credentials['notion']['integration_token'],
-                'database_id': linkedin_db_id
-            })
+                'database_id': linkedin_db_id,
+                'writer': writer_config,
+                'schema': self.notion_config.get('schema', {}),
+                'sinks': self.notion_config.get('sinks', {})
+            }, client=self.notion_client, mirror=self.notion_mirror, outbox=self.notion_outbox)
 
     def _load_yaml(self, filename: str) -> Dict:
         """YAML 파일 로드"""
@@ -103,48 +188,178 @@ class Orchestrator:
             'steps': {}
         }
 
-        # Step 1: 수집
-        print("📡 Step 1: Collecting news...")
-        collected = self.collector.collect(hours_lookback)
-        results['steps']['collection'] = {
-            'total': collected['total_count'],
-            'sources': len(self.sources_config.get('rss_feeds', {}).get('english', []))
-        }
-        print(f"   ✓ Collected {collected['total_count']} articles\n")
+        # TTL이 지난 인덱스 항목 정리
+        if self.seen_index is not None:
+            compacted = self.seen_index.compact()
+            print(f"🗂️ Seen index: {len(self.seen_index)} ids (compacted {compacted})\n")
 
-        if collected['total_count'] == 0:
-            print("   ⚠️ No articles collected. Exiting.")
+        # 이전 실행에서 실패한 노션 쓰기 재전송
+        self.drain_outbox(results)
+
+        # Step 1~3: 수집 → 분석 → 저장
+        if self.streaming:
+            analyzed = self._run_streaming(hours_lookback, results)
+        else:
+            analyzed = self._run_batch(hours_lookback, results)
+
+        if analyzed is None:
             return results
 
-        # Step 2: 분석
-        print("🔍 Step 2: Analyzing content...")
-        analyzed = self.analyzer.analyze(collected['articles'])
+        # Step 4~6: LinkedIn 포스트 생성 (설정된 경우)
+        self._run_linkedin(analyzed, results)
 
-        importance_counts = {}
-        for article in analyzed:
-            imp = article['importance']
-            importance_counts[imp] = importance_counts.get(imp, 0) + 1
+        # 완료
+        results['finished_at'] = datetime.now().isoformat()
+        print(f"{'='*50}")
+        print("✅ Workflow completed!")
+        print(f"{'='*50}\n")
 
-        results['steps']['analysis'] = {
-            'total': len(analyzed),
-            'by_importance': importance_counts
+        return results
+
+    def backfill(self, days: int, chunk_hours: Optional[int] = None,
+                 top_k: Optional[int] = None) -> Dict[str, Any]:
+        """장기간 백필: 오래된 구간부터 chunk_hours 단위로 수집 → 분석 → 저장
+
+        구간별 배치는 저장 후 바로 버리고, LinkedIn 후보는 키워드 매칭 수 / 중요도
+        기준 상위 top_k개만 힙에 유지해 기간이 길어도 메모리가 일정하게 유지된다.
+        """
+        backfill_config = self.sources_config.get('backfill', {})
+        chunk_hours = chunk_hours or backfill_config.get('chunk_hours', 24)
+        top_k = top_k or backfill_config.get('top_k', 200)
+
+        print(f"\n{'='*50}")
+        print(f"⏪ AI News Curator Backfill - {days} days ({chunk_hours}h chunks)")
+        print(f"{'='*50}\n")
+
+        results = {
+            'started_at': datetime.now().isoformat(),
+            'steps': {}
         }
-        print(f"   ✓ Analyzed {len(analyzed)} articles")
-        for imp, count in importance_counts.items():
-            print(f"     - {imp}: {count}")
-        print()
 
-        # Step 3: 저장
-        print("💾 Step 3: Archiving to Notion...")
-        archive_result = self.archiver.archive(analyzed)
-        results['steps']['archive'] = archive_result
-        print(f"   ✓ Success: {archive_result['success']}")
-        print(f"   ✓ Skipped (duplicates): {archive_result['skipped']}")
-        if archive_result['failed'] > 0:
-            print(f"   ✗ Failed: {archive_result['failed']}")
+        if self.seen_index is not None:
+            compacted = self.seen_index.compact()
+            print(f"🗂️ Seen index: {len(self.seen_index)} ids (compacted {compacted})\n")
+
+        # 중복 체크 URL 조회 구간을 백필 기간까지 확장 (구간 밖 기사는 URL별 조회로 처리됨)
+        self.archiver.window_days = max(self.archiver.window_days, days + 1)
+
+        # 이전 실행에서 실패한 노션 쓰기 재전송
+        self.drain_outbox(results)
+
+        # 오래된 구간부터 (첫 구간에서 받은 피드 캐시를 이후 구간이 재사용)
+        end_time = datetime.utcnow()
+        chunk_end = end_time - timedelta(days=days)
+        chunks = []
+        while chunk_end < end_time:
+            chunk_start, chunk_end = chunk_end, min(chunk_end + timedelta(hours=chunk_hours), end_time)
+            chunks.append((chunk_start, chunk_end))
+
+        collection = {}
+        archive_result = {}
+        importance_counts = Counter()
+        total = 0
+        candidates = []  # (keyword_match_count, importance_score, 순번, 기사) 최소 힙
+        sequence = count()
+
+        print("📡 Step 1~3: Collecting, analyzing and archiving by time slice...")
+        for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
+            chunk_total = 0
+            hours = (chunk_end - chunk_start).total_seconds() / 3600
+            # 마지막 구간은 발행일 없는 기사도 포함 (일반 실행과 동일)
+            last = chunk_end == end_time
+            # 구간 단위로 모아 한 번에 분석 (구간이 크면 프로세스 풀 채점)
+            batch = [
+                article
+                for feed_batch in self.collector.stream(hours, end_time=None if last else chunk_end, plan_feeds=False)
+                for article in feed_batch
+            ]
+            if batch:
+                analyzed = self.analyzer.analyze(batch)
+                self._merge_counts(archive_result, self.archiver.archive(analyzed))
+                self._merge_counts(archive_result, {'local': self.archiver.flush()})
+                importance_counts.update(article['importance'] for article in analyzed)
+                chunk_total = len(analyzed)
+
+                if self.linkedin_enabled:
+                    for article in self.news_filter.keyword_filter(analyzed):
+                        item = (article['keyword_match_count'], article['importance_score'], next(sequence), article)
+                        if len(candidates) < top_k:
+                            heapq.heappush(candidates, item)
+                        else:
+                            heapq.heappushpop(candidates, item)
+
+            self._merge_counts(collection, {
+                'cache': self.collector.cache_stats(),
+                'known_skipped': self.collector.known_skipped,
+                'near_duplicates': self.collector.near_duplicates,
+                'rejected': self.collector.rejection_stats()
+            })
+            total += chunk_total
+            print(f"   [{i}/{len(chunks)}] {chunk_start.strftime('%m-%d %H:%M')} ~ {chunk_end.strftime('%m-%d %H:%M')}: "
+                  f"{chunk_total} articles (peak RSS {self._peak_rss_mb():.0f} MB)")
+
+        self.analyzer.close()
+
+        results['steps']['collection'] = {'total': total, **collection}
+        results['steps']['analysis'] = {'total': total, 'by_importance': dict(importance_counts)}
+        print(f"\n   ✓ Collected and analyzed {total} articles")
+        for imp, imp_count in importance_counts.items():
+            print(f"     - {imp}: {imp_count}")
         print()
+        if archive_result:
+            self._report_archive(archive_result, results)
+
+        # Step 4~6: 상위 후보만으로 LinkedIn 포스트 생성
+        if total:
+            ranked = [item[3] for item in sorted(candidates, reverse=True)]
+            self._run_linkedin(ranked, results)
+
+        results['steps']['backfill'] = {
+            'days': days,
+            'chunk_hours': chunk_hours,
+            'chunks': len(chunks),
+            'top_k': top_k,
+            'peak_rss_mb': round(self._peak_rss_mb(), 1)
+        }
+        results['finished_at'] = datetime.now().isoformat()
+        print(f"{'='*50}")
+        print(f"✅ Backfill completed! (peak RSS {self._peak_rss_mb():.0f} MB)")
+        print(f"{'='*50}\n")
 
-        # Step 4~6: LinkedIn 포스트 생성 (설정된 경우)
+        return results
+
+    def drain_outbox(self, results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """outbox에 남은 뉴스 / 포스트 페이지 재전송 (대기 항목이 없으면 아무것도 하지 않음)"""
+        results = results if results is not None else {'steps': {}}
+        if self.notion_outbox is None:
+            return results
+        # 재전송 중단(max_attempts 초과) 항목은 보관만 하므로 대기 항목 수로 판단
+        pending = self.notion_outbox.stats()['pending']
+        if not pending:
+            return results
+
+        print(f"📤 Draining Notion outbox ({pending} pending)...")
+        drained = {'news': self.archiver.drain()}
+        if self.linkedin_enabled:
+            drained['posts'] = self.post_archiver.drain()
+        drained['remaining'] = self.notion_outbox.stats()
+        results['steps']['outbox'] = drained
+
+        for kind in ('news', 'posts'):
+            if kind in drained:
+                counts = drained[kind]
+                print(f"   ✓ {kind}: sent {counts['success']}, already in Notion {counts['skipped']}, "
+                      f"failed {counts['failed']}")
+        print(f"   (remaining: {drained['remaining']['pending']} pending, "
+              f"{drained['remaining']['dead']} over max_attempts)\n")
+        return results
+
+    def _peak_rss_mb(self) -> float:
+        """프로세스 최대 상주 메모리 (MB, Linux의 ru_maxrss는 KB 단위)"""
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    def _run_linkedin(self, analyzed: List[Dict], results: Dict[str, Any]):
+        """Step 4~6: 관련 뉴스 필터링 → 포스트 생성 → 포스트 DB 저장"""
         if self.linkedin_enabled:
             linkedin_start = time.time()
 
@@ -155,7 +370,16 @@ class Orchestrator:
                 'input': len(analyzed),
                 'output': len(filtered)
             }
-            print(f"   ✓ Filtered {len(filtered)} relevant articles\n")
+            print(f"   ✓ Filtered {len(filtered)} relevant articles")
+
+            # 이미 포스트를 만든 기사 제외 (포스트 DB 미러 조회)
+            posted = self.post_archiver.posted_source_urls()
+            if posted:
+                before = len(filtered)
+                filtered = [article for article in filtered if article['url'] not in posted]
+                results['steps']['linkedin_filter']['already_posted'] = before - len(filtered)
+                print(f"     - already posted (skipped): {before - len(filtered)}")
+            print()
 
             if filtered:
                 # Step 5: 포스트 생성
@@ -170,8 +394,12 @@ class Orchestrator:
                     # Step 6: 포스트 DB 저장
                     print("💾 Step 6: Archiving posts to Notion...")
                     post_archive_result = self.post_archiver.archive(posts)
+                    post_archive_result['local'] = self.post_archiver.flush()
                     results['steps']['linkedin_archive'] = post_archive_result
+                    results['steps']['notion_rate_limit'] = self.notion_limiter.stats()
                     print(f"   ✓ Success: {post_archive_result['success']}")
+                    if post_archive_result['local']:
+                        print(f"     (local: {self._format_counts(post_archive_result['local'])})")
                     if post_archive_result['failed'] > 0:
                         print(f"   ✗ Failed: {post_archive_result['failed']}")
                     print()
@@ -183,23 +411,220 @@ class Orchestrator:
         else:
             print("⏭️ LinkedIn post generation skipped (API key or DB ID not configured)\n")
 
-        # 완료
-        results['finished_at'] = datetime.now().isoformat()
-        print(f"{'='*50}")
-        print("✅ Workflow completed!")
-        print(f"{'='*50}\n")
+    def _run_batch(self, hours_lookback: int, results: Dict[str, Any]) -> Optional[List[Dict]]:
+        """Step 1~3를 단계별로 실행 (전체 수집 완료 후 분석/저장)"""
+        # Step 1: 수집
+        print("📡 Step 1: Collecting news...")
+        collected = self.collector.collect(hours_lookback)
+        self._report_collection(collected['total_count'], results)
 
-        return results
+        if collected['total_count'] == 0:
+            print("   ⚠️ No articles collected. Exiting.")
+            return None
+
+        # Step 2: 분석
+        print("🔍 Step 2: Analyzing content...")
+        analyzed = self.analyzer.analyze(collected['articles'])
+        self._report_analysis(analyzed, results)
+
+        # Step 3: 저장
+        print("💾 Step 3: Archiving to Notion...")
+        archive_result = self.archiver.archive(analyzed)
+        archive_result['local'] = self.archiver.flush()
+        self._report_archive(archive_result, results)
+
+        return analyzed
+
+    def _run_streaming(self, hours_lookback: int, results: Dict[str, Any]) -> Optional[List[Dict]]:
+        """Step 1~3를 피드 단위로 실행 (피드가 완료될 때마다 바로 분석/저장)"""
+        print("📡 Step 1~3: Collecting, analyzing and archiving as feeds complete...")
+        analyzed = []
+        archive_result = {}
+
+        # 요약 요청이 피드별로 쪼개지지 않도록 동시 요청 한 번 분량까지 모아서 분석 / 저장
+        summarizer = self.analyzer.summarizer
+        group_size = summarizer.fill_size if summarizer is not None else 0
+        pending = []
+        for batch in self.collector.stream(hours_lookback):
+            pending.extend(batch)
+            print(f"   · {batch[0]['source']}: {len(batch)} articles")
+            if len(pending) >= group_size:
+                self._analyze_and_archive(pending, analyzed, archive_result)
+                pending = []
+        if pending:
+            self._analyze_and_archive(pending, analyzed, archive_result)
+        archive_result['local'] = self.archiver.flush()
+
+        self._report_collection(len(analyzed), results)
+
+        if not analyzed:
+            print("   ⚠️ No articles collected. Exiting.")
+            return None
+
+        # LinkedIn 단계용 전체 중요도 순 정렬 (배치별 정렬은 analyze에서 완료)
+        analyzed.sort(key=lambda x: x['importance_score'], reverse=True)
+        self._report_analysis(analyzed, results)
+        self._report_archive(archive_result, results)
+
+        return analyzed
+
+    def _analyze_and_archive(self, articles: List[Dict], analyzed: List[Dict], archive_result: Dict[str, Any]):
+        """스트리밍 수집에서 모은 기사 분석 + 저장"""
+        analyzed_batch = self.analyzer.analyze(articles)
+        self._merge_counts(archive_result, self.archiver.archive(analyzed_batch))
+        analyzed.extend(analyzed_batch)
+
+    def _report_collection(self, total: int, results: Dict[str, Any]):
+        """수집 결과 집계 및 출력"""
+        cache_stats = self.collector.cache_stats()
+        rejected = self.collector.rejection_stats()
+        results['steps']['collection'] = {
+            'total': total,
+            'sources': len(self.sources_config.get('rss_feeds', {}).get('english', [])),
+            'cache': cache_stats,
+            'known_skipped': self.collector.known_skipped,
+            'near_duplicates': self.collector.near_duplicates,
+            'rejected': rejected,
+            'feeds_skipped': self.collector.skipped_feeds
+        }
+        print(f"   ✓ Collected {total} articles")
+        print(f"     - cache hit: {cache_stats['hit']}, 304: {cache_stats['not_modified']}, miss: {cache_stats['miss']}")
+        print(f"     - already archived (skipped): {self.collector.known_skipped}")
+        print(f"     - near-duplicates merged: {self.collector.near_duplicates}")
+        print(f"     - rejected: min_word_count {rejected['min_word_count']}, "
+              f"exclude_keywords {sum(rejected['exclude_keywords'].values())}")
+        print(f"     - feeds skipped (backoff / not due): {len(self.collector.skipped_feeds)}\n")
+
+    def _report_analysis(self, analyzed: List[Dict], results: Dict[str, Any]):
+        """분석 결과 집계 및 출력"""
+        importance_counts = {}
+        for article in analyzed:
+            imp = article['importance']
+            importance_counts[imp] = importance_counts.get(imp, 0) + 1
+
+        results['steps']['analysis'] = {
+            'total': len(analyzed),
+            'by_importance': importance_counts
+        }
+        print(f"   ✓ Analyzed {len(analyzed)} articles")
+        if self.analyzer.cache is not None:
+            cache_stats = self.analyzer.cache.stats()
+            results['steps']['analysis']['cache'] = cache_stats
+            print(f"     (cache hit: {cache_stats['hit']}, miss: {cache_stats['miss']})")
+        if self.analyzer.summarizer is not None:
+            summary_stats = dict(self.analyzer.summarizer.stats)
+            results['steps']['analysis']['summarizer'] = summary_stats
+            print(f"     (summarized: {summary_stats['summarized']}, fallback: {summary_stats['fallback']}, "
+                  f"requests: {summary_stats['requests']}, "
+                  f"tokens in/out: {summary_stats['input_tokens']}/{summary_stats['output_tokens']}, "
+                  f"truncated: {summary_stats['truncated']})")
+        for imp, imp_count in importance_counts.items():
+            print(f"     - {imp}: {imp_count}")
+        print()
+
+    def _report_archive(self, archive_result: Dict[str, Any], results: Dict[str, Any]):
+        """저장 결과 기록 및 출력"""
+        results['steps']['archive'] = archive_result
+        print(f"   ✓ Success: {archive_result['success']}")
+        print(f"   ✓ Skipped (duplicates): {archive_result['skipped']}")
+        if archive_result.get('filtered'):
+            print(f"   ✓ Local only (Notion filter): {archive_result['filtered']}")
+        if archive_result.get('local'):
+            print(f"     (local: {self._format_counts(archive_result['local'])})")
+        if self.archiver.mirror_sync is not None:
+            mirror_sync = self.archiver.mirror_sync
+            results['steps']['notion_mirror'] = {
+                **mirror_sync, 'total_pages': self.notion_mirror.count(self.archiver.database_id)
+            }
+            print(f"     (mirror: {mirror_sync['mode']} sync, {mirror_sync['pages']} pages updated, "
+                  f"{results['steps']['notion_mirror']['total_pages']} pages mirrored)")
+        duplicate_check = archive_result.get('duplicate_check')
+        if duplicate_check:
+            print(f"     (duplicate check: {duplicate_check['sync_queries']} sync + "
+                  f"{duplicate_check['prefetch_queries']} prefetch + "
+                  f"{duplicate_check['fallback_queries']} per-article queries, "
+                  f"{duplicate_check['query_calls_saved']} query calls saved)")
+        payload_stats = dict(self.archiver.schemas.stats)
+        if payload_stats:
+            results['steps']['notion_payload'] = payload_stats
+            print(f"     (payload checks: {', '.join(f'{key} {value}' for key, value in payload_stats.items())})")
+        limiter_stats = self.notion_limiter.stats()
+        results['steps']['notion_rate_limit'] = limiter_stats
+        print(f"     (notion: {limiter_stats['requests']} requests, {limiter_stats['throttled']} throttled, "
+              f"{limiter_stats['retries']} retries, waited {limiter_stats['wait_seconds']}s)")
+        if archive_result['failed'] > 0:
+            print(f"   ✗ Failed: {archive_result['failed']}")
+        print()
+
+    @staticmethod
+    def _format_counts(counts: Dict[str, int]) -> str:
+        return ', '.join(f"{name} {value}" for name, value in counts.items())
+
+    def _merge_counts(self, total: Dict[str, Any], partial: Dict[str, Any]):
+        """배치 결과를 누적 (숫자는 합산, 리스트는 이어붙임)"""
+        for key, value in partial.items():
+            if isinstance(value, list):
+                total.setdefault(key, []).extend(value)
+            elif isinstance(value, dict):
+                self._merge_counts(total.setdefault(key, {}), value)
+            else:
+                total[key] = total.get(key, 0) + value
+
+
+def feeds_health(config_dir: str = 'config'):
+    """피드 상태 표 출력 (인증 정보 없이 실행 가능)"""
+    with open(Path(config_dir) / 'sources.yaml', 'r', encoding='utf-8') as f:
+        sources_config = yaml.safe_load(f)
+    print(RSSCollector(sources_config).health_report())
 
 
 def main():
-    """메인 실행"""
+    """메인 실행
+
+    python -m agents.orchestrator [run] [--hours N]
+    python -m agents.orchestrator backfill --days 30 [--chunk-hours 24] [--top-k 200]
+    python -m agents.orchestrator feeds health
+    python -m agents.orchestrator outbox drain
+    """
+    parser = argparse.ArgumentParser(prog='python -m agents.orchestrator', description='AI News Curator')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='전체 워크플로우 실행 (기본)')
+    run_parser.add_argument('--hours', type=int, default=24, help='수집 lookback 시간')
+
+    backfill_parser = subparsers.add_parser('backfill', help='장기간 백필 (구간별 수집 → 분석 → 저장)')
+    backfill_parser.add_argument('--days', type=int, required=True, help='백필 기간 (일)')
+    backfill_parser.add_argument('--chunk-hours', type=int, help='구간 길이 (기본: sources.yaml backfill.chunk_hours)')
+    backfill_parser.add_argument('--top-k', type=int, help='LinkedIn 후보 유지 개수 (기본: sources.yaml backfill.top_k)')
+
+    feeds_parser = subparsers.add_parser('feeds', help='피드 관리')
+    feeds_subparsers = feeds_parser.add_subparsers(dest='feeds_command', required=True)
+    feeds_subparsers.add_parser('health', help='피드별 지연 시간 / 크기 / 실패 / 발행 주기 표')
+
+    outbox_parser = subparsers.add_parser('outbox', help='노션 쓰기 outbox 관리')
+    outbox_subparsers = outbox_parser.add_subparsers(dest='outbox_command', required=True)
+    outbox_subparsers.add_parser('drain', help='실패한 노션 페이지 쓰기 재전송 (재수집 / 재생성 없음)')
+
+    args = parser.parse_args()
+
+    if args.command == 'feeds':
+        feeds_health()
+        return
+
     orchestrator = Orchestrator()
-    results = orchestrator.run(hours_lookback=24)
+    if args.command == 'outbox':
+        results = orchestrator.drain_outbox()
+        log_path = 'data/logs/last_outbox_drain.json'
+    elif args.command == 'backfill':
+        results = orchestrator.backfill(args.days, chunk_hours=args.chunk_hours, top_k=args.top_k)
+        log_path = 'data/logs/last_backfill.json'
+    else:
+        results = orchestrator.run(hours_lookback=getattr(args, 'hours', 24))
+        log_path = 'data/logs/last_run.json'
 
     # 결과 저장
     Path('data/logs').mkdir(parents=True, exist_ok=True)
-    with open('data/logs/last_run.json', 'w', encoding='utf-8') as f:
+    with open(log_path, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
 
 
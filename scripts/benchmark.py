@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""파이프라인 성능 벤치마크 스크립트 (외부 API 호출 없음, 가짜 노션 서버 / Anthropic 클라이언트는 tests/fakes.py)
+
+Usage:
+    python scripts/benchmark.py --step matcher              # 키워드 매칭: 단계별 substring 스캔 vs 공유 토큰 매처
+    python scripts/benchmark.py --step matcher --count 50000
+    python scripts/benchmark.py --step dates --count 5000  # 대형 피드 엔트리 처리: dateutil vs 단계별 날짜 파싱
+    python scripts/benchmark.py --step clustering --count 50000  # 유사 기사 클러스터링 확장성
+    python scripts/benchmark.py --step analyzer --count 50000    # 분석: 기사별 vs 히트 행렬 일괄 채점
+    python scripts/benchmark.py --step summarizer --count 300    # 요약: 기사별 요청 vs 배치 + 동시 요청 (가짜 클라이언트)
+    python scripts/benchmark.py --step article --count 50000     # 기사 레코드: dict vs Article 메모리 / 분석 + 필터 시간
+    python scripts/benchmark.py --step notion --count 150        # 노션 저장: 기사별 requests.post vs 커넥션 풀 + 동시 생성 (로컬 가짜 서버)
+    python scripts/benchmark.py --step relevance --count 300     # 관련성 평가: 순차 + 0.3초 대기 vs 동시 평가 (가짜 클라이언트, 429 주입)
+"""
+
+import sys
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from types import SimpleNamespace
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+
+import feedparser
+import requests
+import yaml
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from agents.common.article import Article
+from agents.common.keyword_matcher import KeywordMatcher
+from agents.collector.rss_collector import RSSCollector
+from agents.collector.story_clusterer import StoryClusterer
+from agents.analyzer.analyzer import ContentAnalyzer
+from agents.analyzer.summarizer import ArticleSummarizer
+from agents.archiver.notion_archiver import NotionArchiver
+from agents.notion.client import NotionClient
+from agents.notion.mirror import NotionMirror
+from agents.notion.rate_limiter import NotionRateLimiter
+from agents.linkedin.filter import NewsFilter
+from tests.fakes import FakeAnthropic, FakeNotionServer, FakeRelevanceAnthropic
+
+
+def load_config():
+    """설정 파일 로드 (credentials 불필요)"""
+    config_dir = project_root / 'config'
+
+    with open(config_dir / 'sources.yaml', 'r', encoding='utf-8') as f:
+        sources_config = yaml.safe_load(f)
+
+    with open(config_dir / 'linkedin.yaml', 'r', encoding='utf-8') as f:
+        linkedin_config = yaml.safe_load(f)
+
+    return sources_config, linkedin_config
+
+
+def make_articles(count: int, seed: int = 42):
+    """합성 기사 생성 (실제 피드와 비슷한 길이의 제목 + 발췌문)"""
+    words = (
+        "the company said on monday that its new model will launch next week with "
+        "partnership cloud startup funding valuation revenue growth pipeline churn "
+        "openai anthropic google meta microsoft nvidia claude gemini llama gpt-4 api "
+        "research paper benchmark regulation policy guide tutorial analysis agents "
+        "saas b2b crm sales automation marketing ecommerce shopify 인공지능 출시 발표 "
+        "bank metadata email training brain newsletter banned launches 출시했다 비공개"
+    ).split()
+    sources = list(ContentAnalyzer.SOURCE_CREDIBILITY) + ['Unknown Blog']
+
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        excerpt = ' '.join(rng.choice(words) for _ in range(rng.randint(30, 80)))
+        articles.append({
+            'id': f"bench-{i}",
+            'title': ' '.join(rng.choice(words) for _ in range(rng.randint(6, 12))),
+            'url': f"https://example.com/bench/{i}",
+            'source': rng.choice(sources),
+            'excerpt': excerpt,
+            'summary': excerpt[:200] + '...',
+            'tags': [],
+            'bypass_content_filter': False
+        })
+    return articles
+
+
+def legacy_scan(article, content_keywords, analyzer_keywords, linkedin_keywords):
+    """기존 방식: 단계마다 키워드 수만큼 substring 스캔"""
+    text = f"{article['title']} {article['excerpt']}".lower()
+    collector_hits = [kw for kw in content_keywords if kw in text]
+    analyzer_hits = [kw for kw in analyzer_keywords if kw in text]
+    searchable = ' '.join([
+        article['title'], article['summary'], article['excerpt'], ' '.join(article['tags'])
+    ]).lower()
+    linkedin_hits = [kw for kw in linkedin_keywords if kw in searchable]
+    return collector_hits, analyzer_hits, linkedin_hits
+
+
+def shared_scan(article, matcher, news_filter, content_keywords, analyzer_keywords, linkedin_keywords):
+    """공유 토큰 매처: 제목 + 발췌문 1회 토큰화 후 단계별로 재사용"""
+    hits = matcher.article_hits(article)
+    collector_hits = [kw for kw in content_keywords if kw in hits]
+    analyzer_hits = [kw for kw in analyzer_keywords if kw in hits]
+    linkedin_all = news_filter._article_hits(article)
+    linkedin_hits = [kw for kw in linkedin_keywords if kw in linkedin_all]
+    return collector_hits, analyzer_hits, linkedin_hits
+
+
+def bench_matcher(count: int):
+    """키워드 매칭 벤치마크"""
+    print(f"\n{'='*60}")
+    print(f"🔎 벤치마크: 키워드 매칭 ({count:,}건)")
+    print(f"{'='*60}\n")
+
+    sources_config, linkedin_config = load_config()
+    content_keywords = [kw.lower() for kw in sources_config.get('content_keywords', RSSCollector.DEFAULT_KEYWORDS)]
+    analyzer_keywords = ContentAnalyzer.keywords()
+    linkedin_keywords = [kw.lower() for kw in linkedin_config.get('filter', {}).get('keywords', [])]
+    articles = make_articles(count)
+
+    print(f"   키워드 수: collector {len(content_keywords)}, analyzer {len(analyzer_keywords)}, "
+          f"linkedin {len(linkedin_keywords)}")
+
+    start = time.time()
+    legacy = [legacy_scan(a, content_keywords, analyzer_keywords, linkedin_keywords) for a in articles]
+    legacy_elapsed = time.time() - start
+
+    start = time.time()
+    matcher = KeywordMatcher(content_keywords + analyzer_keywords + linkedin_keywords)
+    build_elapsed = time.time() - start
+    news_filter = NewsFilter({'keywords': linkedin_keywords}, api_key='bench', matcher=matcher)
+
+    start = time.time()
+    shared = [shared_scan(a, matcher, news_filter, content_keywords, analyzer_keywords, linkedin_keywords) for a in articles]
+    shared_elapsed = time.time() - start
+
+    # 단어 경계 매칭으로 사라진 hits (substring 오탐: said → ai, bank → ban 등)
+    dropped = Counter()
+    for legacy_hits, shared_hits in zip(legacy, shared):
+        for legacy_stage, shared_stage in zip(legacy_hits, shared_hits):
+            dropped.update(set(legacy_stage) - set(shared_stage))
+    legacy_passed = sum(1 for hits in legacy if hits[0])
+    shared_passed = sum(1 for hits in shared if hits[0])
+
+    print(f"   단계별 substring 스캔: {legacy_elapsed:.3f}s")
+    print(f"   공유 토큰 매처:         {shared_elapsed:.3f}s (빌드 {build_elapsed * 1000:.1f}ms)")
+    print(f"   속도 향상: x{legacy_elapsed / shared_elapsed:.2f}")
+    print(f"   content_keywords 통과: {legacy_passed:,} → {shared_passed:,}건")
+    print("   제거된 substring hits 상위: "
+          + ', '.join(f"{kw} {count:,}" for kw, count in dropped.most_common(5)))
+
+
+def make_feed(count: int) -> bytes:
+    """최신순 정렬된 대형 RSS 피드 생성 (arXiv 목록 규모)"""
+    now = datetime.utcnow().replace(microsecond=0)
+    items = []
+    for i in range(count):
+        published = format_datetime(now - timedelta(minutes=10 * i)).replace('-0000', '+0000')
+        items.append(
+            f"<item><title>Paper {i}: a new benchmark for llm agents</title>"
+            f"<link>https://example.com/paper/{i}</link><pubDate>{published}</pubDate>"
+            f"<description>We study machine learning models and report results.</description></item>"
+        )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>'
+        + ''.join(items) + '</channel></rss>'
+    ).encode('utf-8')
+
+
+def bench_dates(count: int):
+    """피드 엔트리 처리 벤치마크 (feedparser 파싱 이후 단계)"""
+    print(f"\n{'='*60}")
+    print(f"📅 벤치마크: 피드 엔트리 날짜 처리 ({count:,}건)")
+    print(f"{'='*60}\n")
+
+    feed = feedparser.parse(make_feed(count))
+    cutoff_time = datetime.utcnow() - timedelta(hours=24)
+    collector = RSSCollector({'cache': {'enabled': False}})
+    feed_config = {'name': 'bench', 'url': 'https://example.com/feed'}
+
+    # 기존 방식: 모든 엔트리를 dateutil로 파싱
+    from dateutil import parser as date_parser
+    start = time.time()
+    legacy_count = 0
+    for entry in feed.entries:
+        published = date_parser.parse(entry.get('published', ''))
+        if published.replace(tzinfo=None) >= cutoff_time:
+            legacy_count += 1
+    legacy_elapsed = time.time() - start
+
+    start = time.time()
+    tiered = collector._parse_entries(feed, feed_config, cutoff_time)
+    tiered_elapsed = time.time() - start
+
+    start = time.time()
+    early = collector._parse_entries(feed, {**feed_config, 'chronological': True}, cutoff_time)
+    early_elapsed = time.time() - start
+
+    print(f"   dateutil 날짜 파싱만:         {legacy_elapsed:.3f}s ({legacy_count}건 통과)")
+    print(f"   단계별 파싱 + 기사 변환:      {tiered_elapsed:.3f}s ({len(tiered)}건 통과)")
+    print(f"   + chronological 조기 종료:    {early_elapsed:.3f}s ({len(early)}건 통과)")
+
+
+def bench_clustering(count: int):
+    """유사 기사 클러스터링 벤치마크 (기사 수를 두 배씩 늘려 선형 증가 확인)"""
+    print(f"\n{'='*60}")
+    print(f"🧩 벤치마크: 유사 기사 클러스터링 (최대 {count:,}건)")
+    print(f"{'='*60}\n")
+
+    articles = make_articles(count)
+
+    # 5%는 다른 소스가 같은 스토리를 살짝 다르게 쓴 사본으로 교체
+    rng = random.Random(7)
+    planted = 0
+    for i in range(0, count, 20):
+        original = articles[rng.randrange(count)]
+        words = original['excerpt'].split()
+        words[rng.randrange(len(words))] = 'reportedly'
+        articles[i] = {
+            **original,
+            'id': f"copy-{i}",
+            'url': f"https://example.org/copy/{i}",
+            'source': 'Syndicated Copy',
+            'excerpt': ' '.join(words)
+        }
+        planted += 1
+
+    size = max(count // 8, 1)
+    while size <= count:
+        clusterer = StoryClusterer()
+        batch_articles = [dict(article) for article in articles[:size]]
+        start = time.time()
+        canonicals = []
+        for i in range(0, size, 50):  # 피드 단위 배치
+            canonicals.extend(clusterer.cluster(batch_articles[i:i + 50]))
+        elapsed = time.time() - start
+        print(f"   {size:>7,}건: {elapsed:6.2f}s  ({(elapsed / size) * 1e6:5.1f}µs/건, "
+              f"{size - len(canonicals):,}건 병합)")
+        size *= 2
+
+    print(f"\n   심어 둔 사본: {planted:,}건 (원본보다 먼저 나온 사본은 대표 기사가 됨)")
+
+
+def bench_analyzer(count: int):
+    """분석 벤치마크 (키워드 스캔은 양쪽 모두 포함, 결과 동일성 확인)"""
+    print(f"\n{'='*60}")
+    print(f"📊 벤치마크: 기사 분석 ({count:,}건)")
+    print(f"{'='*60}\n")
+
+    analyzer = ContentAnalyzer()
+    per_article_input = make_articles(count)
+    batch_input = make_articles(count)
+
+    start = time.time()
+    per_article = [analyzer._analyze_article(article) for article in per_article_input]
+    per_article_elapsed = time.time() - start
+
+    start = time.time()
+    batch = analyzer.analyze_batch(batch_input)
+    batch_elapsed = time.time() - start
+
+    # 키워드 스캔을 제외한 채점 단계만 (hits가 캐시된 상태에서 재실행, GC 타이밍 편차로 3회 중 최솟값)
+    per_article_scoring = batch_scoring = float('inf')
+    for _ in range(3):
+        start = time.time()
+        for article in per_article_input:
+            analyzer._analyze_article(article)
+        per_article_scoring = min(per_article_scoring, time.time() - start)
+
+        start = time.time()
+        analyzer.analyze_batch(batch_input)
+        batch_scoring = min(batch_scoring, time.time() - start)
+
+    mismatches = sum(1 for a, b in zip(per_article, batch) if a != b)
+
+    # 프로세스 풀: 키워드 스캔 포함 (hits 캐시 없는 새 기사), 풀 시작 비용 포함 / 제외
+    workers = max(2, os.cpu_count() or 1)
+    parallel_analyzer = ContentAnalyzer(workers=workers, parallel_min_size=1)
+    parallel_input = make_articles(count)
+    start = time.time()
+    parallel = parallel_analyzer._score_parallel(parallel_input)
+    parallel_cold = time.time() - start
+    start = time.time()
+    parallel_analyzer._score_parallel(make_articles(count))
+    parallel_warm = time.time() - start
+    parallel_analyzer.close()
+    parallel_mismatches = sum(1 for a, b in zip(batch, parallel) if a != b) + abs(len(batch) - len(parallel))
+
+    print(f"   기사별 분석:     {per_article_elapsed:.3f}s (채점만 {per_article_scoring:.3f}s)")
+    print(f"   히트 행렬 일괄:  {batch_elapsed:.3f}s (채점만 {batch_scoring:.3f}s)")
+    print(f"   프로세스 풀 ({workers} workers, CPU {os.cpu_count()}): "
+          f"{parallel_cold:.3f}s (풀 시작 포함), {parallel_warm:.3f}s (풀 재사용)")
+    print(f"   채점 속도 향상: x{per_article_scoring / batch_scoring:.2f}")
+    print(f"   결과 불일치: 기사별 vs 일괄 {mismatches}건, 일괄 vs 프로세스 풀 {parallel_mismatches}건")
+
+
+def bench_summarizer(count: int):
+    """요약 벤치마크: 기사당 1요청 순차 vs 배치 + 동시 요청 (가짜 클라이언트, 외부 호출 없음)"""
+    print(f"\n{'='*60}")
+    print(f"📊 벤치마크: Claude 배치 요약 ({count:,}건, 가짜 클라이언트)")
+    print(f"{'='*60}\n")
+
+    sources_config, _ = load_config()
+    config = {**sources_config.get('summarizer', {}), 'retry_delay': 0}
+
+    analyzer = ContentAnalyzer()
+    cases = [
+        ('기사별 순차 요청', {**config, 'batch_size': 1, 'max_concurrency': 1}, 0),
+        ('배치 + 동시 요청', config, 0),
+        ('배치 + 동시 요청 (5번째 요청마다 실패)', config, 5),
+    ]
+    for label, case_config, fail_every in cases:
+        client = FakeAnthropic(fail_every=fail_every)
+        summarizer = ArticleSummarizer(case_config, client=client)
+        articles = [analyzer._analyze_article(article) for article in make_articles(count)]
+
+        start = time.time()
+        summarized = summarizer.summarize(articles)
+        elapsed = time.time() - start
+
+        stats = summarizer.stats
+        with_points = sum(1 for article in articles if article['key_points'])
+        print(f"   {label}")
+        print(f"     소요 시간: {elapsed:.2f}s, 요청: {stats['requests']}회 (실패 {stats['failed_requests']})")
+        print(f"     요약: {len(summarized)}건, 발췌문 대체: {stats['fallback']}건, key_points 보유: {with_points}건")
+        print(f"     토큰 in/out: {stats['input_tokens']:,}/{stats['output_tokens']:,}, "
+              f"출력 상한에서 잘린 응답: {stats['truncated']}회\n")
+
+
+def bench_article(count: int):
+    """기사 레코드 벤치마크: 분석 + LinkedIn 키워드 필터 후 dict vs Article 메모리 / 시간"""
+    print(f"\n{'='*60}")
+    print(f"📊 벤치마크: 기사 레코드 dict vs Article ({count:,}건)")
+    print(f"{'='*60}\n")
+
+    _, linkedin_config = load_config()
+
+    rows = {}
+    outputs = {}
+    for label, record in (('dict', dict), ('Article', Article.from_dict)):
+        # 시간: 레코드 생성 + 분석 + 필터, 3회 중 최솟값 / 메모리: 남아 있는 레코드 (tracemalloc)
+        elapsed = float('inf')
+        for _ in range(3):
+            analyzer = ContentAnalyzer()
+            news_filter = NewsFilter(linkedin_config['filter'], api_key='benchmark')
+            articles = make_articles(count)
+            start = time.time()
+            analyzed = analyzer.analyze([record(article) for article in articles])
+            news_filter.keyword_filter(analyzed)
+            elapsed = min(elapsed, time.time() - start)
+
+        articles = make_articles(count)
+        tracemalloc.start()
+        records = [record(article) for article in articles]
+        del articles
+        before_annotation = tracemalloc.get_traced_memory()[0]
+        analyzer = ContentAnalyzer()
+        news_filter = NewsFilter(linkedin_config['filter'], api_key='benchmark')
+        analyzed = analyzer.analyze(records)
+        matched = news_filter.keyword_filter(analyzed)
+        del analyzer, news_filter
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        rows[label] = (elapsed, before_annotation, current, len(matched))
+        outputs[label] = [{k: v for k, v in article.items() if not k.startswith('_')} for article in analyzed]
+
+    for label, (elapsed, before_annotation, current, matched) in rows.items():
+        print(f"   {label:<8} 분석 + 필터 {elapsed:.3f}s, 레코드 메모리 {before_annotation / 1024 / 1024:.1f} MB "
+              f"→ 분석 + 필터 후 {current / 1024 / 1024:.1f} MB, 필터 통과 {matched:,}건")
+    print(f"   메모리 절감 (분석 + 필터 후): {1 - rows['Article'][2] / rows['dict'][2]:.0%}")
+    print(f"   결과 불일치: {sum(1 for a, b in zip(outputs['dict'], outputs['Article']) if a != b)}건")
+
+
+def legacy_archive(base_url: str, articles):
+    """기존 방식: 기사마다 requests.post로 URL 조회 + 페이지 생성 후 0.5초 대기 (연결 재사용 없음)"""
+    headers = {"Authorization": "Bearer benchmark", "Content-Type": "application/json"}
+    results = {'success': 0, 'skipped': 0, 'failed': 0}
+    for article in articles:
+        query = {"filter": {"property": "URL", "url": {"equals": article['url']}}}
+        response = requests.post(f"{base_url}/databases/bench/query", headers=headers, json=query, timeout=30)
+        if response.status_code == 200 and response.json().get('results'):
+            results['skipped'] += 1
+            continue
+        payload = {"parent": {"database_id": "bench"}, "properties": {"URL": {"url": article['url']}}}
+        response = requests.post(f"{base_url}/pages", headers=headers, json=payload, timeout=30)
+        if response.status_code == 200:
+            results['success'] += 1
+        else:
+            results['failed'] += 1
+        time.sleep(0.5)
+    return results
+
+
+def bench_notion(count: int):
+    """노션 저장 벤치마크: 기사별 requests.post 순차 vs 커넥션 풀 + 동시 페이지 생성 (로컬 가짜 서버)"""
+    print(f"\n{'='*60}")
+    print(f"📊 벤치마크: 노션 저장 ({count:,}건, 로컬 가짜 노션 서버)")
+    print(f"{'='*60}\n")
+
+    with open(project_root / 'config' / 'notion.yaml', 'r', encoding='utf-8') as f:
+        notion_config = yaml.safe_load(f)
+
+    published_at = (datetime.utcnow() - timedelta(hours=3)).isoformat()
+    articles = [Article.from_dict({**article, 'published_at': published_at}) for article in make_articles(count)]
+    # 10건 중 1건은 이미 저장된 기사
+    existing = [article['url'] for article in articles[::10]]
+
+    rows = {}
+    with FakeNotionServer(existing_urls=existing) as server:
+        start = time.time()
+        rows['기사별 requests.post'] = (legacy_archive(server.base_url, articles), time.time() - start,
+                                       dict(server.stats))
+
+    writer_config = notion_config.get('writer', {})
+    with FakeNotionServer(existing_urls=existing) as server:
+        limiter = NotionRateLimiter(**notion_config.get('rate_limit', {}))
+        client = NotionClient('benchmark', rate_limiter=limiter,
+                              pool_size=writer_config.get('pool_size', 10), base_url=server.base_url)
+        archiver = NotionArchiver({
+            'integration_token': 'benchmark',
+            'database_id': 'bench',
+            'duplicate_check': notion_config.get('duplicate_check', {}),
+            'writer': writer_config
+        }, client=client)
+        start = time.time()
+        results = archiver.archive(articles)
+        rows[f"Session + 동시 생성 ({archiver.writer.max_workers} workers)"] = (
+            results, time.time() - start, dict(server.stats)
+        )
+        client.close()
+
+    for label, (results, elapsed, stats) in rows.items():
+        print(f"   {label}")
+        print(f"     소요 시간: {elapsed:.2f}s, 요청 {stats.get('requests', 0)}회, "
+              f"새 연결 {stats.get('connections', 0)}회, 429 {stats.get('rate_limited', 0)}회")
+        print(f"     성공 {results['success']}, 스킵 {results['skipped']}, 실패 {results['failed']}")
+    counts = [tuple(results[key] for key in ('success', 'skipped', 'failed')) for results, _, _ in rows.values()]
+    print(f"   집계 일치: {'예' if counts[0] == counts[1] else '아니오'}")
+
+    # 로컬 미러: 1회차 전체 동기화, 2회차(같은 기사 + 새 기사 10건)는 델타 동기화만으로 중복 확인
+    print("\n   로컬 미러 (2회 실행)")
+    new_articles = [Article.from_dict({**article, 'id': f"new-{i}", 'url': f"{article['url']}/new",
+                                       'published_at': None})
+                    for i, article in enumerate(make_articles(10, seed=7))]
+    with FakeNotionServer(existing_urls=existing, latency=0.05, handshake=0.0) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        mirror = NotionMirror(str(Path(tmp) / 'mirror.sqlite'))
+        for run, batch in enumerate((articles, articles + new_articles), 1):
+            client = NotionClient('benchmark', rate_limiter=NotionRateLimiter(**notion_config.get('rate_limit', {})),
+                                  base_url=server.base_url)
+            archiver = NotionArchiver({
+                'integration_token': 'benchmark',
+                'database_id': 'bench',
+                'duplicate_check': notion_config.get('duplicate_check', {}),
+                'writer': writer_config
+            }, client=client, mirror=mirror)
+            results = archiver.archive(batch)
+            client.close()
+            check = results['duplicate_check']
+            print(f"     {run}회차: {archiver.mirror_sync['mode']} 동기화 {check['sync_queries']}회 "
+                  f"({archiver.mirror_sync['pages']} pages), 기사별 조회 {check['fallback_queries']}회, "
+                  f"성공 {results['success']}, 스킵 {results['skipped']}, 실패 {results['failed']}, "
+                  f"미러 {mirror.count('bench')} pages")
+        mirror.close()
+
+
+def legacy_relevance_filter(news_filter, articles):
+    """기존 방식: 기사마다 순차 평가 + 0.3초 대기 (재시도 없이 실패하면 키워드 매칭 기준)"""
+    filtered = []
+    for article in articles:
+        try:
+            score, reason = news_filter._evaluate_relevance(article)
+            article['relevance_score'] = score
+            article['relevance_reason'] = reason
+            if score >= news_filter.relevance_threshold:
+                filtered.append(article)
+        except Exception:
+            article['relevance_score'] = 5
+            article['relevance_reason'] = f"평가 실패 (1차 필터 키워드 매칭: {article.get('keyword_match_count', 0)}건)"
+            if article.get('keyword_match_count', 0) >= 2:
+                filtered.append(article)
+        time.sleep(0.3)
+    filtered.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+    return filtered
+
+
+def bench_relevance(count: int):
+    """관련성 평가 벤치마크: 순차 + 0.3초 대기 vs 동시 평가 (가짜 클라이언트, 지연 / 429 주입)"""
+    print(f"\n{'='*60}")
+    print(f"📊 벤치마크: LinkedIn 관련성 평가 ({count:,}건 중 키워드 매칭분, 가짜 클라이언트)")
+    print(f"{'='*60}\n")
+
+    _, linkedin_config = load_config()
+    filter_config = linkedin_config['filter']
+
+    def matched_articles():
+        articles = make_articles(count)
+        for i, article in enumerate(articles):
+            article['title'] = f"bench-title-{i} {article['title']}"
+        return NewsFilter(filter_config, api_key='', client=SimpleNamespace()).keyword_filter(articles)
+
+    print(f"   키워드 매칭: {len(matched_articles())}건\n")
+
+    # 평가 실패 로그는 벤치마크 출력에서 제외
+    logging.getLogger('agents.linkedin.filter').setLevel(logging.ERROR)
+
+    # 13번째 기사마다 400: 실패 기사는 키워드 매칭 2개 이상이면 포함 (기존 규칙)
+    fail_every = 13
+    legacy_filter = NewsFilter(filter_config, api_key='', client=FakeRelevanceAnthropic(fail_every=fail_every))
+    start = time.time()
+    legacy = legacy_relevance_filter(legacy_filter, matched_articles())
+    print("   순차 + 0.3초 대기")
+    print(f"     소요 시간: {time.time() - start:.2f}s, 통과 {len(legacy)}건\n")
+    expected = [(a['id'], a['relevance_score']) for a in legacy]
+
+    cases = [
+        ('동시 평가', {}),
+        ('동시 평가 (동시 4건 초과 시 429, retry-after 0.5초)', {'capacity': 4}),
+    ]
+    for label, fake_options in cases:
+        client = FakeRelevanceAnthropic(fail_every=fail_every, **fake_options)
+        news_filter = NewsFilter(filter_config, api_key='', client=client)
+        articles = matched_articles()
+
+        start = time.time()
+        filtered = news_filter._relevance_filter(articles)
+        filtered.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        elapsed = time.time() - start
+
+        same = [(a['id'], a['relevance_score']) for a in filtered] == expected
+        concurrency = news_filter.concurrency.stats
+        print(f"   {label}")
+        print(f"     소요 시간: {elapsed:.2f}s, 요청 {client.calls}회 (429 {client.rate_limited}회, "
+              f"재시도 {news_filter.stats['retries']}회, 실패 {news_filter.stats['failed']}건)")
+        print(f"     최대 동시 요청 {concurrency['max_in_flight']}건, 최소 제한 {concurrency['min_limit']}건, "
+              f"통과 {len(filtered)}건, 순차 결과와 {'일치' if same else '불일치'}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파이프라인 성능 벤치마크')
+    parser.add_argument(
+        '--step',
+        choices=['matcher', 'dates', 'clustering', 'analyzer', 'summarizer', 'article', 'notion', 'relevance'],
+        required=True,
+        help='벤치마크할 단계: matcher | dates | clustering | analyzer | summarizer | article | notion | relevance'
+    )
+    parser.add_argument('--count', type=int, default=10000, help='합성 기사 수 (기본 10,000)')
+    args = parser.parse_args()
+
+    step_map = {
+        'matcher': bench_matcher,
+        'dates': bench_dates,
+        'clustering': bench_clustering,
+        'analyzer': bench_analyzer,
+        'summarizer': bench_summarizer,
+        'article': bench_article,
+        'notion': bench_notion,
+        'relevance': bench_relevance
+    }
+
+    step_map[args.step](args.count)
+
+
+if __name__ == '__main__':
+    main()
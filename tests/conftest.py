@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.notion.client import NotionClient
+from agents.notion.rate_limiter import NotionRateLimiter
+from tests.fakes import FakeNotionServer
+
+
+@pytest.fixture
+def notion_server():
+    """지연 / 속도 제한 없는 로컬 가짜 노션 서버 (URL이 /bad로 끝나는 페이지는 400)"""
+    with FakeNotionServer(latency=0, handshake=0, rate=1000, burst=1000, fail_suffix='/bad') as server:
+        yield server
+
+
+@pytest.fixture
+def notion_client(notion_server):
+    client = NotionClient('test', rate_limiter=NotionRateLimiter(rate=1000, burst=1000, backoff_base=0.01),
+                          base_url=notion_server.base_url)
+    yield client
+    client.close()
+
+
+def make_news(name: str, **fields) -> dict:
+    """노션 archiver 입력 형식의 분석된 기사"""
+    return {
+        'id': f'id-{name}',
+        'title': f'Story {name}',
+        'url': f'https://example.com/{name}',
+        'source': 'TechCrunch',
+        'published_at': (datetime.utcnow() - timedelta(hours=1)).isoformat(),
+        'excerpt': 'excerpt',
+        'summary': f'Summary {name}',
+        'key_points': ['point'],
+        'category': '🚀 Product Launch',
+        'importance': '🔴 Critical',
+        'tags': ['OpenAI'],
+        'language': 'en',
+        **fields
+    }
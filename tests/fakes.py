@@ -0,0 +1,288 @@
+"""테스트 / 벤치마크 공용 가짜 외부 서비스 (노션 API 로컬 서버, Anthropic 클라이언트)"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+
+
+class FakeNotionServer:
+    """노션 API를 흉내 내는 로컬 HTTP 서버 (스키마 조회 / 데이터베이스 query / 페이지 생성 / 블록 추가)
+
+    새 연결마다 handshake초(TLS 설정 비용), 요청마다 latency초 지연.
+    평균 rate건/초(버스트 burst건)를 넘으면 429 + Retry-After, URL이 fail_suffix로 끝나는 페이지는 400.
+    lost_urls의 페이지는 만든 뒤 502(응답 유실), down_urls의 페이지는 만들지 않고 502.
+    edit_page()는 노션에서 사용자가 페이지를 고친 것처럼 속성과 last_edited_time을 바꾼다.
+    노션처럼 children 100개 초과 / rich_text 2000자 초과 / 스키마에 없는 속성 / 쉼표가 든 옵션 이름은 400.
+    기본은 뉴스 DB 스키마, 포스트 DB는 schema=POST_SCHEMA, url_property='Source URL'.
+    """
+
+    SCHEMA = {
+        '이름': 'title', 'URL': 'url', 'Source': 'select', 'Category': 'select', 'Importance': 'select',
+        'Tags': 'multi_select', 'Summary': 'rich_text', 'Archived': 'date', 'Status': 'select',
+        'Language': 'select', 'Published': 'date'
+    }
+    POST_SCHEMA = {
+        'Title': 'title', 'Post Body': 'rich_text', 'Source URL': 'url', 'Source Title': 'rich_text',
+        'Category': 'select', 'Hashtags': 'multi_select', 'Status': 'select', 'Created': 'date'
+    }
+
+    def __init__(self, latency: float = 0.2, handshake: float = 0.1, rate: float = 3.0, burst: int = 10,
+                 existing_urls=(), fail_suffix: str = '7', schema: dict = None, url_property: str = 'URL'):
+        self.schema = schema or self.SCHEMA
+        self.url_property = url_property
+        self.latency = latency
+        self.handshake = handshake
+        self.rate = rate
+        self.burst = burst
+        self.fail_suffix = fail_suffix
+        self.lost_urls = set()
+        self.down_urls = set()
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self.pages = []
+        for url in existing_urls:
+            self._add_page(url, {})
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _handle(self, method: str, path: str, body: dict):
+        if method == 'GET':
+            return 200, {'object': 'database', 'properties': {
+                name: {'id': name, 'name': name, 'type': kind, kind: {}} for name, kind in self.schema.items()
+            }}
+
+        problem = self._validate(body)
+        if problem:
+            self.stats['validation_errors'] += 1
+            return 400, {'object': 'error', 'code': 'validation_error', 'message': problem}
+        if method == 'PATCH':
+            self.stats['appended_blocks'] += len(body['children'])
+            return 200, {'object': 'list', 'results': []}
+
+        if path.endswith('/query'):
+            self.stats['queries'] += 1
+            condition = body.get('filter', {})
+            if condition.get('property') == self.url_property:
+                matches = [page for page in self.pages if page['url'] == condition['url']['equals']]
+            elif condition.get('timestamp') == 'last_edited_time':
+                since = condition['last_edited_time']['on_or_after']
+                matches = [page for page in self.pages if page['last_edited_time'] >= since]
+            else:
+                matches = list(self.pages)
+            start = int(body.get('start_cursor') or 0)
+            size = body.get('page_size', 100)
+            chunk = matches[start:start + size]
+            has_more = start + size < len(matches)
+            return 200, {
+                'results': chunk,
+                'has_more': has_more,
+                'next_cursor': str(start + size) if has_more else None
+            }
+
+        url = body['properties'].get(self.url_property, {}).get('url') or ''
+        if self.fail_suffix and url.endswith(self.fail_suffix):
+            return 400, {'object': 'error', 'code': 'validation_error', 'message': 'invalid select option'}
+        if url in self.down_urls:
+            return 502, {'object': 'error', 'code': 'bad_gateway', 'message': 'bad gateway'}
+        self.stats['created'] += 1
+        page = self._add_page(url, body['properties'])
+        if url in self.lost_urls:
+            return 502, {'object': 'error', 'code': 'bad_gateway', 'message': 'bad gateway'}
+        return 200, page
+
+    def _validate(self, body: dict) -> str:
+        if len(body.get('children', [])) > 100:
+            return 'body.children.length should be ≤ 100'
+        for name, value in body.get('properties', {}).items():
+            if name not in self.schema:
+                return f'{name} is not a property that exists.'
+            options = value.get('multi_select') or [value.get('select') or {}]
+            if any(',' in option.get('name', '') for option in options):
+                return f'{name}: select option names cannot contain commas'
+        texts = [value.get('rich_text', []) + value.get('title', []) for value in body.get('properties', {}).values()]
+        texts += [block[block['type']].get('rich_text', []) for block in body.get('children', [])]
+        if any(len(item.get('text', {}).get('content', '')) > 2000 for items in texts for item in items):
+            return 'rich_text content length should be ≤ 2000'
+        return ''
+
+    def _add_page(self, url: str, properties: dict, edited: datetime = None) -> dict:
+        now = self._timestamp(edited)
+        with self._lock:
+            page = {
+                'object': 'page', 'id': f"page-{len(self.pages)}", 'url': url,
+                'created_time': now, 'last_edited_time': now,
+                'properties': {**properties, self.url_property: {'type': 'url', 'url': url}}
+            }
+            self.pages.append(page)
+        return page
+
+    def edit_page(self, url: str, properties: dict, edited: datetime = None) -> dict:
+        with self._lock:
+            page = next(page for page in self.pages if page['url'] == url)
+            page['properties'].update(properties)
+            page['last_edited_time'] = self._timestamp(edited)
+        return page
+
+    @staticmethod
+    def _timestamp(moment: datetime = None) -> str:
+        # 노션처럼 last_edited_time은 분 단위
+        moment = moment or datetime.utcnow()
+        return moment.replace(second=0, microsecond=0).isoformat() + '.000Z'
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                server.stats['connections'] += 1
+                time.sleep(server.handshake)
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond()
+
+            def do_PATCH(self):
+                self._respond()
+
+            def _respond(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                server.stats['requests'] += 1
+                time.sleep(server.latency)
+                if server._allow():
+                    status, payload = server._handle(self.command, self.path, body)
+                else:
+                    server.stats['rate_limited'] += 1
+                    status, payload = 429, {'object': 'error', 'code': 'rate_limited'}
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class FakeAnthropic:
+    """messages.create만 흉내 내는 로컬 가짜 클라이언트
+
+    지연 시간 = 기본 지연 + 기사당 출력 시간, 토큰은 글자 수 / 4로 추정.
+    fail_every번째 요청마다 예외를 던진다.
+    """
+
+    def __init__(self, base_latency: float = 0.1, per_article: float = 0.01, fail_every: int = 0):
+        self.base_latency = base_latency
+        self.per_article = per_article
+        self.fail_every = fail_every
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.messages = self
+
+    def create(self, model, max_tokens, messages, system=None):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+
+        prompt = messages[0]['content']
+        numbers = [int(n) for n in re.findall(r'^\[(\d+)\]$', prompt, re.MULTILINE)]
+        time.sleep(self.base_latency + self.per_article * len(numbers))
+        if self.fail_every and call % self.fail_every == 0:
+            raise RuntimeError('overloaded')
+
+        items = [
+            {'n': n, 'summary': f'기사 {n} 요약입니다. 핵심 내용을 두 문장으로 정리했습니다.',
+             'key_points': ['첫 번째 포인트', '두 번째 포인트']}
+            for n in numbers
+        ]
+        text = json.dumps(items, ensure_ascii=False)
+        usage = SimpleNamespace(input_tokens=len(prompt) // 4, output_tokens=len(text) // 4)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage, stop_reason='end_turn')
+
+
+class FakeRelevanceAnthropic:
+    """관련성 평가용 가짜 클라이언트 (messages.create만 구현)
+
+    기사 ID로 점수를 정하므로 실행 방식과 관계없이 결과가 같다. 동시 요청이 capacity를 넘으면
+    retry-after 헤더가 붙은 429(RateLimitError)를 던지고, fail_every번째 기사는 400으로 실패한다.
+    """
+
+    def __init__(self, latency: float = 0.2, capacity: int = 0, retry_after: float = 0.5, fail_every: int = 0):
+        self.latency = latency
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.fail_every = fail_every
+        self.calls = 0
+        self.rate_limited = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.messages = self
+
+    def create(self, model, max_tokens, messages):
+        number = int(re.search(r'bench-title-(\d+)', messages[0]['content']).group(1))
+        with self._lock:
+            self.calls += 1
+            limited = self.capacity and self._in_flight >= self.capacity
+            if limited:
+                self.rate_limited += 1
+            else:
+                self._in_flight += 1
+        if limited:
+            self._raise(429, {'retry-after': str(self.retry_after)})
+
+        try:
+            time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        if self.fail_every and number % self.fail_every == 0:
+            self._raise(400, {})
+
+        score = (number * 7) % 11
+        text = json.dumps({'score': score, 'reason': f'기사 {number} 평가'}, ensure_ascii=False)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    @staticmethod
+    def _raise(status: int, headers: dict):
+        request = httpx.Request('POST', 'https://api.anthropic.com/v1/messages')
+        response = httpx.Response(status, headers=headers, request=request)
+        error = anthropic.RateLimitError if status == 429 else anthropic.BadRequestError
+        raise error(f'Error code: {status}', response=response, body=None)
@@ -0,0 +1,61 @@
+from agents.analyzer.analysis_cache import AnalysisCache
+from agents.analyzer.analyzer import ContentAnalyzer
+from agents.common.article import Article
+
+
+def make_articles():
+    return [
+        Article(id='a', title='OpenAI launches a model', excerpt='details', source='TechCrunch'),
+        Article(id='b', title='New research paper on agents', excerpt='arxiv', source='Nature')
+    ]
+
+
+def test_second_run_is_served_from_cache(tmp_path):
+    cache = AnalysisCache(path=str(tmp_path / 'analysis.sqlite'))
+    analyzer = ContentAnalyzer(cache=cache)
+
+    first = {article['id']: article['importance_score'] for article in analyzer.analyze(make_articles())}
+    assert cache.stats() == {'hit': 0, 'miss': 2}
+
+    second = {article['id']: article['importance_score'] for article in analyzer.analyze(make_articles())}
+    assert cache.stats() == {'hit': 2, 'miss': 2}
+    assert second == first
+
+
+def test_content_change_is_reanalyzed(tmp_path):
+    cache = AnalysisCache(path=str(tmp_path / 'analysis.sqlite'))
+    analyzer = ContentAnalyzer(cache=cache)
+    analyzer.analyze(make_articles())
+
+    articles = make_articles()
+    articles[0]['title'] = 'A quiet week'
+    analyzed = {article['id']: article for article in analyzer.analyze(articles)}
+
+    assert cache.stats() == {'hit': 1, 'miss': 3}
+    assert analyzed['a']['tags'] == []
+    # 다시 분석한 결과로 갱신되어 다음 실행에서는 hit
+    analyzer.analyze(articles)
+    assert cache.stats() == {'hit': 3, 'miss': 3}
+
+
+def test_ruleset_change_invalidates(tmp_path, monkeypatch):
+    path = str(tmp_path / 'analysis.sqlite')
+    ContentAnalyzer(cache=AnalysisCache(path=path)).analyze(make_articles())
+
+    monkeypatch.setattr(ContentAnalyzer, 'RULESET_REVISION', ContentAnalyzer.RULESET_REVISION + 1)
+    cache = AnalysisCache(path=path)
+    ContentAnalyzer(cache=cache).analyze(make_articles())
+
+    assert cache.stats() == {'hit': 0, 'miss': 2}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AnalysisCache(path=str(tmp_path / 'analysis.sqlite'), max_entries=2)
+    rows = [{'id': name, 'title': name, 'source': 's', 'importance': 'x'} for name in 'abc']
+
+    cache.put_many(rows[:2], ['importance'], 'r1')
+    cache.get_many(rows[:1], 'r1')
+    cache.put_many(rows[2:], ['importance'], 'r1')
+
+    assert len(cache) == 2
+    assert set(cache.get_many(rows, 'r1')) == {'a', 'c'}
@@ -0,0 +1,53 @@
+import copy
+import random
+
+from agents.analyzer.analyzer import ContentAnalyzer
+
+WORDS = [
+    'OpenAI', 'launches', 'Claude', 'Gemini', 'funding', 'regulation', 'ban', 'research', 'paper',
+    'github', 'open source', 'how to', 'guide', 'Nvidia', 'LLM', 'RAG', 'agents', 'API', 'Meta',
+    'metadata', 'news', '출시', '규제를', '논문', 'the', 'market', 'said', 'bank', 'new'
+]
+FILLER = ['the', 'a', 'market', 'said', 'week', 'team', 'report', 'data', 'users', 'today']
+SOURCES = ['TechCrunch', 'Nature', 'Hacker News', 'AI 타임스', 'Unknown Blog']
+
+
+def make_articles(count: int) -> list:
+    rng = random.Random(7)
+    return [
+        {
+            'id': f'a{n}',
+            'title': ' '.join(rng.choices(WORDS, k=rng.randint(0, 3)) + rng.choices(FILLER, k=5)),
+            'excerpt': ' '.join(rng.choices(WORDS, k=rng.randint(0, 4)) + rng.choices(FILLER, k=15)),
+            'source': rng.choice(SOURCES),
+            'url': f'https://example.com/{n}'
+        }
+        for n in range(count)
+    ]
+
+
+def analysis(articles: list) -> dict:
+    return {article['id']: {field: article[field] for field in ContentAnalyzer.ANALYSIS_FIELDS}
+            for article in articles}
+
+
+def test_batch_pool_and_per_article_scoring_agree():
+    articles = make_articles(400)
+    serial = ContentAnalyzer()
+    per_article = analysis([serial._analyze_article(article) for article in copy.deepcopy(articles)])
+
+    batch = analysis(serial.analyze_batch(copy.deepcopy(articles)))
+
+    pooled_analyzer = ContentAnalyzer(workers=2, parallel_min_size=100)
+    try:
+        pooled = pooled_analyzer.analyze(copy.deepcopy(articles))
+        assert pooled_analyzer._pool is not None
+    finally:
+        pooled_analyzer.close()
+
+    assert batch == per_article
+    assert analysis(pooled) == per_article
+    # 여러 중요도 구간에 걸친 입력인지 확인
+    assert len({result['importance'] for result in per_article.values()}) >= 3
+    scores = [article['importance_score'] for article in pooled]
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,61 @@
+import json
+import pickle
+
+import pytest
+
+from agents.common.article import Article
+
+
+def make_record() -> dict:
+    return {
+        'id': 'a', 'title': 'OpenAI launches', 'url': 'https://example.com/a', 'source': 'TechCrunch',
+        'published_at': '2026-10-17T09:00:00', 'excerpt': 'details', 'language': 'en',
+        'legacy_field': 'kept'
+    }
+
+
+def test_to_dict_round_trip_keeps_fields_and_extras():
+    record = make_record()
+    article = Article.from_dict(record)
+
+    assert article.to_dict() == record
+    assert Article.from_dict(article) is article
+    assert Article.from_dict(json.loads(json.dumps(article.to_dict()))).to_dict() == record
+    assert pickle.loads(pickle.dumps(article)).to_dict() == record
+
+
+def test_mapping_protocol_matches_dict():
+    article = Article.from_dict(make_record())
+
+    assert dict(article) == make_record()
+    assert {**article} == make_record()
+    assert len(article) == len(make_record())
+    assert 'legacy_field' in article and 'importance' not in article
+    assert article.get('importance', 'none') == 'none'
+    with pytest.raises(KeyError):
+        article['importance']
+
+    article['importance'] = '🟠 High'
+    del article['legacy_field']
+    assert list(article)[-1] == 'importance'
+    assert 'legacy_field' not in article.to_dict()
+
+
+def test_derived_fields_are_hidden_and_reset_on_source_change():
+    article = Article.from_dict(make_record())
+    original = article.content_hash
+
+    assert '_content_hash' not in article.to_dict() and '_content_hash' not in list(article)
+    article['summary'] = 'unchanged inputs'
+    assert article.content_hash == original
+    article['excerpt'] = 'new details'
+    assert article.content_hash != original
+
+
+def test_copy_is_independent():
+    article = Article.from_dict(make_record())
+    duplicate = article.copy()
+    duplicate['title'] = 'Changed'
+
+    assert article['title'] == 'OpenAI launches'
+    assert duplicate.content_hash != article.content_hash
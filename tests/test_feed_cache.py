@@ -0,0 +1,89 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agents.collector.rss_collector import RSSCollector
+
+
+def make_feed(now: datetime) -> bytes:
+    """12시간 간격 기사 6건 (최근 60시간)"""
+    items = ''.join(
+        f"<item><title>Story {hours}h</title><link>https://example.com/{hours}</link>"
+        f"<pubDate>{format_datetime(now - timedelta(hours=hours), usegmt=True)}</pubDate>"
+        f"<description>AI model news {hours}</description></item>"
+        for hours in (1, 12, 25, 36, 48, 60)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode()
+
+
+@pytest.fixture
+def feed_server():
+    """ETag 조건부 GET을 지원하는 로컬 RSS 서버"""
+    body = make_feed(datetime.now(timezone.utc))
+    statuses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.headers.get('If-None-Match') == '"v1"':
+                statuses.append(304)
+                self.send_response(304)
+                self.end_headers()
+                return
+            statuses.append(200)
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/feed.xml", statuses
+    server.shutdown()
+
+
+def make_collector(tmp_path):
+    return RSSCollector({
+        'cache': {'dir': str(tmp_path / 'feeds')},
+        'health': {'enabled': False}
+    })
+
+
+def test_longer_lookback_after_304_returns_older_entries(tmp_path, feed_server):
+    url, statuses = feed_server
+    collector = make_collector(tmp_path)
+    feed = {'name': 'Local', 'url': url, 'chronological': True}
+    now = datetime.utcnow()
+
+    daily = collector._fetch_feed(feed, now - timedelta(hours=24))
+    assert [article['title'] for article in daily] == ['Story 1h', 'Story 12h']
+
+    wide = collector._fetch_feed(feed, now - timedelta(hours=72))
+    assert statuses == [200, 304]
+    assert [article['title'] for article in wide] == [
+        'Story 1h', 'Story 12h', 'Story 25h', 'Story 36h', 'Story 48h', 'Story 60h'
+    ]
+
+    # 다시 파싱한 목록을 저장했으므로 이후 짧은 lookback은 저장된 목록에서 자른다
+    again = make_collector(tmp_path)._fetch_feed(feed, now - timedelta(hours=24))
+    assert statuses == [200, 304, 304]
+    assert [article['title'] for article in again] == ['Story 1h', 'Story 12h']
+
+
+def test_fresh_cache_hit_reparses_for_earlier_cutoff(tmp_path, feed_server):
+    url, statuses = feed_server
+    collector = make_collector(tmp_path)
+    collector.cache.fresh_minutes = 60
+    feed = {'name': 'Local', 'url': url}
+    now = datetime.utcnow()
+
+    assert len(collector._fetch_feed(feed, now - timedelta(hours=24))) == 2
+    assert len(collector._fetch_feed(feed, now - timedelta(hours=72))) == 6
+    assert statuses == [200]
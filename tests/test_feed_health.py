@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from agents.collector.feed_health import FeedHealthStore
+
+FEED = {'name': 'Example', 'url': 'https://example.com/feed.xml'}
+
+
+def store_with_last_success(tmp_path, last_success: datetime, **kwargs) -> FeedHealthStore:
+    store = FeedHealthStore(path=str(tmp_path / 'health.json'), **kwargs)
+    store.record_success(FEED, latency=0.1, size=100, entries=0, published=[])
+    store._feeds[FEED['url']]['last_success'] = last_success.isoformat()
+    return store
+
+
+def test_catchup_widens_to_last_success(tmp_path):
+    now = datetime(2026, 10, 17, 12)
+    store = store_with_last_success(tmp_path, now - timedelta(hours=40), max_catchup_hours=168)
+
+    assert store.feed_cutoff(FEED, now - timedelta(hours=24), now=now) == now - timedelta(hours=40)
+
+
+def test_catchup_is_capped(tmp_path):
+    now = datetime(2026, 10, 17, 12)
+    store = store_with_last_success(tmp_path, now - timedelta(days=60), max_catchup_hours=168)
+
+    assert store.feed_cutoff(FEED, now - timedelta(hours=24), now=now) == now - timedelta(hours=168)
+    # 요청한 구간이 상한보다 길면 (백필) 요청한 구간 그대로
+    assert store.feed_cutoff(FEED, now - timedelta(days=30), now=now) == now - timedelta(days=30)
+
+
+def test_unknown_feed_keeps_cutoff(tmp_path):
+    now = datetime(2026, 10, 17, 12)
+    store = FeedHealthStore(path=str(tmp_path / 'health.json'), max_catchup_hours=168)
+
+    assert store.feed_cutoff(FEED, now - timedelta(hours=24), now=now) == now - timedelta(hours=24)
@@ -0,0 +1,119 @@
+import json
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from agents.collector.hn_collector import HackerNewsCollector
+
+
+def make_stories(now: datetime) -> list:
+    """1시간 간격 AI 스토리 60건 (points는 시간순과 무관하게 섞음)"""
+    return [
+        {
+            'objectID': str(n),
+            'title': f'AI story {n}',
+            'url': f'https://example.com/hn/{n}',
+            'author': 'pg',
+            'points': (n * 37) % 101,
+            'created_at_i': int((now - timedelta(hours=n, minutes=30)).timestamp()),
+            'story_text': ''
+        }
+        for n in range(60)
+    ]
+
+
+@pytest.fixture
+def algolia_server():
+    """numericFilters / hitsPerPage / page를 해석하는 로컬 Algolia Search API"""
+    stories = make_stories(datetime.now(timezone.utc))
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+            requests_seen.append(params)
+            hits = [story for story in stories if params['query'].lower() in story['title'].lower()]
+            for op, value in re.findall(r'created_at_i([<>])(\d+)', params.get('numericFilters', '')):
+                if op == '>':
+                    hits = [story for story in hits if story['created_at_i'] > int(value)]
+                else:
+                    hits = [story for story in hits if story['created_at_i'] < int(value)]
+            # Algolia 기본 정렬과 비슷하게 최신순
+            hits.sort(key=lambda story: story['created_at_i'], reverse=True)
+            per_page, page = int(params['hitsPerPage']), int(params['page'])
+            body = json.dumps({
+                'hits': hits[page * per_page:(page + 1) * per_page],
+                'nbPages': (len(hits) + per_page - 1) // per_page
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v1/search", stories, requests_seen
+    server.shutdown()
+
+
+def make_collector(tmp_path, endpoint, **config):
+    return HackerNewsCollector({'endpoint': endpoint, 'query': 'AI', 'cache_minutes': 0, **config},
+                               cache_dir=str(tmp_path / 'api'))
+
+
+def test_backfill_slice_gets_its_own_top_n(tmp_path, algolia_server):
+    endpoint, stories, requests_seen = algolia_server
+    collector = make_collector(tmp_path, endpoint, results_limit=5)
+    end_time = datetime.utcnow() - timedelta(hours=24)
+    cutoff_time = end_time - timedelta(hours=24)
+
+    articles = collector.collect(cutoff_time, end_time)
+
+    assert all('created_at_i<' in params['numericFilters'] for params in requests_seen)
+    in_slice = [story for story in stories
+                if cutoff_time <= datetime.utcfromtimestamp(story['created_at_i']) < end_time]
+    expected = sorted(in_slice, key=lambda story: story['points'], reverse=True)[:5]
+    assert [article['url'] for article in articles] == [story['url'] for story in expected]
+    assert all(datetime.fromisoformat(article['published_at']) < end_time for article in articles)
+
+
+def test_without_end_time_only_lower_bound_is_sent(tmp_path, algolia_server):
+    endpoint, _, requests_seen = algolia_server
+    make_collector(tmp_path, endpoint).collect(datetime.utcnow() - timedelta(hours=6))
+
+    assert requests_seen and all('<' not in params['numericFilters'] for params in requests_seen)
+
+
+def test_pages_are_merged_and_ranked_by_points(tmp_path, algolia_server):
+    endpoint, stories, requests_seen = algolia_server
+    collector = make_collector(tmp_path, endpoint, query='AI OR story', results_limit=7,
+                               hits_per_page=10, max_pages=10)
+
+    articles = collector.collect(datetime.utcnow() - timedelta(hours=72))
+
+    # 검색어 2개 × 6페이지, 같은 스토리는 한 번만
+    assert len(requests_seen) == 12
+    assert sorted(int(params['page']) for params in requests_seen) == sorted(list(range(6)) * 2)
+    expected = sorted(stories, key=lambda story: story['points'], reverse=True)[:7]
+    assert [article['url'] for article in articles] == [story['url'] for story in expected]
+
+
+def test_max_pages_bounds_the_candidates(tmp_path, algolia_server):
+    endpoint, stories, requests_seen = algolia_server
+    collector = make_collector(tmp_path, endpoint, results_limit=100, hits_per_page=10, max_pages=2)
+
+    articles = collector.collect(datetime.utcnow() - timedelta(hours=72))
+
+    assert len(requests_seen) == 2
+    newest = {story['url'] for story in stories[:20]}
+    assert len(articles) == 20 and {article['url'] for article in articles} == newest
+    points = [next(s['points'] for s in stories if s['url'] == article['url']) for article in articles]
+    assert points == sorted(points, reverse=True)
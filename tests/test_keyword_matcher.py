@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from agents.common.article import Article
+from agents.common.keyword_matcher import KeywordMatcher
+
+
+@pytest.mark.parametrize('keyword, text', [
+    ('new', 'latest news today'),
+    ('ai', 'the company said on monday'),
+    ('ban', 'a bank metadata leak'),
+    ('meta', 'metadata for every file'),
+    ('even', 'an evening keynote'),
+    ('go', 'the deal goes through'),
+])
+def test_substrings_and_base_forms_do_not_match(keyword, text):
+    assert KeywordMatcher([keyword]).find(text) == frozenset()
+
+
+@pytest.mark.parametrize('keyword, text', [
+    ('new', 'a new model'),
+    ('launch', 'openai launches gpt'),
+    ('release', 'anthropic released claude'),
+    ('ban', 'eu banned the app'),
+    ('agent', 'coding agents ship'),
+    ('출시', '신제품을 출시했다'),
+    ('open source', 'open sourced weights'),
+])
+def test_inflected_forms_match(keyword, text):
+    assert KeywordMatcher([keyword]).find(text) == frozenset({keyword})
+
+
+def test_article_hits_leaves_dict_input_untouched():
+    matcher = KeywordMatcher(['openai', 'launch'])
+    article = {'title': 'OpenAI launches a model', 'excerpt': 'details'}
+
+    assert matcher.article_hits(article) == frozenset({'openai', 'launch'})
+    assert matcher.article_hits(dict(article)) == frozenset({'openai', 'launch'})
+    assert article == {'title': 'OpenAI launches a model', 'excerpt': 'details'}
+    json.dumps(article)
+
+
+def test_article_hits_memo_on_article_is_reset_by_title_change():
+    matcher = KeywordMatcher(['openai', 'anthropic'])
+    article = Article(title='OpenAI ships', excerpt='', url='https://example.com/a')
+
+    assert matcher.article_hits(article) == frozenset({'openai'})
+    article['title'] = 'Anthropic ships'
+    assert matcher.article_hits(article) == frozenset({'anthropic'})
+    assert '_keyword_hits' not in article.to_dict()
@@ -0,0 +1,91 @@
+from agents.archiver.notion_archiver import NotionArchiver
+from agents.collector.seen_index import SeenIndex
+from agents.notion.outbox import NotionOutbox
+from tests.conftest import make_news
+
+
+def make_archiver(client, **kwargs):
+    return NotionArchiver({'integration_token': 'test', 'database_id': 'db'}, client=client, **kwargs)
+
+
+def page_urls(server):
+    return [page['url'] for page in server.pages]
+
+
+def test_archive_counts_success_skipped_failed(tmp_path, notion_server, notion_client):
+    notion_server._add_page('https://example.com/old', {})
+    seen = SeenIndex(path=str(tmp_path / 'seen.sqlite'))
+    articles = [make_news('a'), make_news('old'), make_news('b'), make_news('x/bad')]
+
+    results = make_archiver(notion_client, seen_index=seen).archive(articles)
+
+    assert (results['success'], results['skipped'], results['failed']) == (2, 1, 1)
+    assert results['errors'][0]['title'] == 'Story x/bad'
+    assert sorted(page_urls(notion_server)) == [
+        'https://example.com/a', 'https://example.com/b', 'https://example.com/old'
+    ]
+    # 저장 / 이미 존재한 기사만 다음 실행에서 제외
+    assert seen.known(article['id'] for article in articles) == {'id-a', 'id-old', 'id-b'}
+
+
+def test_failed_write_is_drained_and_acked(tmp_path, notion_server, notion_client):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+    notion_server.down_urls.add('https://example.com/a')
+
+    results = make_archiver(notion_client, outbox=outbox).archive([make_news('a'), make_news('b')])
+    assert (results['success'], results['failed']) == (1, 1)
+    assert outbox.stats() == {'pending': 1, 'dead': 0}
+
+    notion_server.down_urls.clear()
+    drained = make_archiver(notion_client, outbox=outbox).drain()
+
+    assert (drained['success'], drained['skipped'], drained['failed']) == (1, 0, 0)
+    assert len(outbox) == 0
+    assert sorted(page_urls(notion_server)) == ['https://example.com/a', 'https://example.com/b']
+
+
+def test_lost_response_is_acked_without_resending(tmp_path, notion_server, notion_client):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+    notion_server.lost_urls.add('https://example.com/a')
+
+    results = make_archiver(notion_client, outbox=outbox).archive([make_news('a')])
+    # 502는 페이지 생성 요청이므로 재시도하지 않음 (페이지는 이미 생성됨)
+    assert results['failed'] == 1
+    assert page_urls(notion_server) == ['https://example.com/a']
+
+    notion_server.lost_urls.clear()
+    drained = make_archiver(notion_client, outbox=outbox).drain()
+
+    assert (drained['success'], drained['skipped']) == (0, 1)
+    assert len(outbox) == 0
+    assert page_urls(notion_server) == ['https://example.com/a']
+
+
+def test_permanent_error_is_not_drained(tmp_path, notion_server, notion_client):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+
+    make_archiver(notion_client, outbox=outbox).archive([make_news('x/bad')])
+
+    assert outbox.stats() == {'pending': 0, 'dead': 1}
+    assert make_archiver(notion_client, outbox=outbox).drain()['success'] == 0
+
+
+def test_prefetch_hit_skips_create_without_per_article_queries(notion_server, notion_client):
+    for name in ('old1', 'old2', 'old3'):
+        notion_server._add_page(f'https://example.com/{name}', {})
+    # 조회 구간(window_days)보다 오래전에 발행된 기사는 구간 밖에 저장됐을 수 있어 기사별 조회
+    stale = make_news('stale', published_at='2020-01-01T00:00:00')
+    articles = [make_news('old1'), make_news('new1'), make_news('old3'), make_news('new2'), stale]
+
+    results = make_archiver(notion_client).archive(articles)
+
+    assert (results['success'], results['skipped']) == (3, 2)
+    assert results['duplicate_check'] == {
+        'sync_queries': 0, 'prefetch_queries': 1, 'fallback_queries': 1, 'query_calls_saved': 3
+    }
+    assert notion_server.stats['queries'] == 2
+    assert notion_server.stats['created'] == 3
+    assert sorted(page_urls(notion_server)) == [
+        'https://example.com/new1', 'https://example.com/new2', 'https://example.com/old1',
+        'https://example.com/old2', 'https://example.com/old3', 'https://example.com/stale'
+    ]
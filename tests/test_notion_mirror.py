@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from agents.archiver.notion_archiver import NotionArchiver
+from agents.notion.mirror import NotionMirror
+from tests.conftest import make_news
+
+STATUS = {'Status': {'type': 'select', 'select': {'name': 'Read'}}}
+
+
+def seed_pages(server, count: int = 5):
+    now = datetime.utcnow()
+    for n in range(count):
+        server._add_page(f'https://example.com/{n}', {}, edited=now - timedelta(hours=count - n))
+
+
+def test_delta_sync_fetches_only_edited_pages(tmp_path, notion_server, notion_client):
+    seed_pages(notion_server)
+    mirror = NotionMirror(path=str(tmp_path / 'mirror.sqlite'))
+
+    assert mirror.sync(notion_client, 'db') == {'mode': 'full', 'queries': 1, 'pages': 5}
+    assert mirror.watermark('db') == notion_server.pages[-1]['last_edited_time']
+
+    notion_server.edit_page('https://example.com/1', STATUS)
+    # 워터마크와 같은 분에 수정된 마지막 페이지도 다시 받음 (last_edited_time이 분 단위)
+    assert mirror.sync(notion_client, 'db') == {'mode': 'delta', 'queries': 1, 'pages': 2}
+    edited = next(page for page in mirror.pages('db') if page['url'] == 'https://example.com/1')
+    assert edited['properties']['Status'] == STATUS['Status']
+    assert mirror.count('db') == 5
+
+    # 바뀐 페이지가 없으면 워터마크 페이지만
+    assert mirror.sync(notion_client, 'db')['pages'] == 1
+
+
+def test_archiver_uses_synced_mirror_beyond_prefetch_window(tmp_path, notion_server, notion_client):
+    seed_pages(notion_server, 2)
+    mirror = NotionMirror(path=str(tmp_path / 'mirror.sqlite'))
+    archiver = NotionArchiver({'integration_token': 'test', 'database_id': 'db'},
+                              client=notion_client, mirror=mirror)
+    # 발행이 오래된 기사도 미러 집합으로 확인 (기사별 조회 없음)
+    articles = [make_news('0', published_at='2020-01-01T00:00:00'), make_news('new')]
+
+    results = archiver.archive(articles)
+
+    assert (results['success'], results['skipped']) == (1, 1)
+    assert results['duplicate_check']['prefetch_queries'] == 0
+    assert results['duplicate_check']['fallback_queries'] == 0
+    assert notion_server.stats['queries'] == 1
+    # 생성한 페이지는 응답으로 미러에 바로 기록
+    assert mirror.urls('db') == {'https://example.com/0', 'https://example.com/1', 'https://example.com/new'}
@@ -0,0 +1,46 @@
+import json
+import sqlite3
+
+from agents.notion.outbox import NotionOutbox
+
+
+def test_enqueue_same_key_keeps_one_entry(tmp_path):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+    first = outbox.enqueue('news', 'db', {'v': 1}, {'url': 'https://a'}, key='https://a')
+    outbox.fail(first, 'timeout')
+    second = outbox.enqueue('news', 'db', {'v': 2}, {'url': 'https://a'}, key='https://a')
+    outbox.enqueue('news', 'db', {'v': 3}, {'url': 'https://b'}, key='https://b')
+
+    assert second == first
+    entries = outbox.pending('news', 'db')
+    assert [(entry['payload']['v'], entry['attempts']) for entry in entries] == [(2, 0), (3, 0)]
+
+
+def test_legacy_duplicate_rows_are_collapsed(tmp_path):
+    path = str(tmp_path / 'outbox.sqlite')
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, database_id TEXT NOT NULL, "
+        "payload TEXT NOT NULL, meta TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+        "last_error TEXT, created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+    )
+    for _ in range(2):
+        conn.execute(
+            "INSERT INTO outbox (kind, database_id, payload, meta, created_at, updated_at) "
+            "VALUES ('news', 'db', '{}', ?, 'now', 'now')", (json.dumps({'url': 'https://a'}),)
+        )
+    conn.commit()
+    conn.close()
+
+    outbox = NotionOutbox(path=path)
+    assert len(outbox.pending('news', 'db')) == 1
+    assert len(outbox) == 1
+
+
+def test_stats_separates_dead_entries(tmp_path):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'), max_attempts=2)
+    dead = outbox.enqueue('post', 'db', {}, key='https://a')
+    outbox.fail(dead, '400', permanent=True)
+
+    assert outbox.stats() == {'pending': 0, 'dead': 1}
+    assert outbox.pending('post', 'db') == []
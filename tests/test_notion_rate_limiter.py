@@ -0,0 +1,79 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from agents.notion.rate_limiter import NotionRateLimiter
+
+
+@pytest.fixture
+def server():
+    """요청 수를 세고 정해진 상태 코드(또는 지연)로 응답하는 로컬 서버"""
+    state = {'hits': 0, 'status': 502, 'delay': 0.0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            state['hits'] += 1
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            time.sleep(state['delay'])
+            self.send_response(state['status'])
+            if state['status'] == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        do_GET = do_POST = do_PATCH = _respond
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", state
+    httpd.shutdown()
+
+
+def make_limiter():
+    return NotionRateLimiter(rate=100, burst=100, max_retries=3, backoff_base=0.01)
+
+
+def test_page_create_is_not_retried_after_5xx(server):
+    url, state = server
+    assert make_limiter().request('POST', f"{url}/pages", json={}).status_code == 502
+    assert state['hits'] == 1
+
+
+def test_page_create_is_not_retried_after_read_timeout(server):
+    url, state = server
+    state['delay'] = 0.3
+    with pytest.raises(requests.ReadTimeout):
+        make_limiter().request('POST', f"{url}/pages", json={}, timeout=0.1)
+    assert state['hits'] == 1
+
+
+def test_idempotent_requests_are_retried_after_5xx(server):
+    url, state = server
+    limiter = make_limiter()
+    assert limiter.request('POST', f"{url}/query", idempotent=True, json={}).status_code == 502
+    assert limiter.request('GET', f"{url}/databases/x").status_code == 502
+    assert state['hits'] == 8
+
+
+def test_page_create_is_retried_after_429(server):
+    url, state = server
+    state['status'] = 429
+    assert make_limiter().request('POST', f"{url}/pages", json={}).status_code == 429
+    assert state['hits'] == 4
+
+
+def test_page_create_is_retried_when_connection_is_refused():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    limiter = make_limiter()
+    with pytest.raises(requests.ConnectionError):
+        limiter.request('POST', f"http://127.0.0.1:{port}/pages", json={})
+    assert limiter.stats()['requests'] == 4
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from agents.archiver.notion_archiver import NotionArchiver
+from agents.notion.client import NotionValidationError
+from agents.notion.schema import NotionSchemaCache
+from tests.conftest import make_news
+
+
+def text(content: str) -> list:
+    return [{'text': {'content': content}}]
+
+
+def test_normalize_fits_payload_to_schema_and_limits(notion_client):
+    schemas = NotionSchemaCache(notion_client)
+    payload = {
+        'parent': {'database_id': 'db'},
+        'properties': {
+            'Name': {'title': text('Title')},
+            'Unknown': {'rich_text': text('dropped')},
+            'Source': {'select': {'name': 'A, B'}},
+            'Tags': {'multi_select': [{'name': 'x,y'}, {'name': 'x y'}, {'name': 'z'}]},
+            'Summary': {'rich_text': text('가' * 4500)},
+        },
+        'children': [{'type': 'paragraph', 'paragraph': {'rich_text': text(str(i))}} for i in range(130)]
+    }
+
+    normalized, overflow = schemas.normalize('db', payload)
+
+    properties = normalized['properties']
+    assert set(properties) == {'이름', 'Source', 'Tags', 'Summary'}
+    assert properties['Source'] == {'select': {'name': 'A  B'}}
+    assert properties['Tags'] == {'multi_select': [{'name': 'x y'}, {'name': 'z'}]}
+    assert [len(item['text']['content']) for item in properties['Summary']['rich_text']] == [2000, 2000, 500]
+    assert len(normalized['children']) == 100 and len(overflow) == 30
+    assert schemas.stats['schema_fetches'] == 1
+
+    # TTL 안에서는 스키마를 다시 조회하지 않음
+    schemas.normalize('db', payload)
+    assert schemas.stats['schema_fetches'] == 1
+
+
+class SchemaClient:
+    """retrieve_database만 구현한 가짜 클라이언트"""
+
+    def __init__(self, properties: dict):
+        self.properties = properties
+
+    def retrieve_database(self, database_id):
+        return SimpleNamespace(status_code=200, json=lambda: {'properties': self.properties})
+
+
+def test_select_is_converted_to_status_and_unknown_status_fails():
+    schemas = NotionSchemaCache(SchemaClient({
+        'Name': {'type': 'title'},
+        'Status': {'type': 'status', 'status': {'options': [{'name': 'Draft'}]}}
+    }))
+
+    normalized, _ = schemas.normalize('db', {'properties': {'Status': {'select': {'name': 'Draft'}}}})
+    assert normalized['properties']['Status'] == {'status': {'name': 'Draft'}}
+
+    with pytest.raises(NotionValidationError):
+        schemas.normalize('db', {'properties': {'Status': {'select': {'name': 'Published'}}}})
+
+
+def test_archive_sends_overflow_blocks_after_create(notion_server, notion_client):
+    related = [{'id': f'r{i}', 'source': 'Feed', 'url': f'https://example.com/r{i}'} for i in range(120)]
+    article = make_news('long', summary='요약' * 1500, related_articles=related, tags=['A, B'])
+
+    results = NotionArchiver({'integration_token': 'test', 'database_id': 'db'}, client=notion_client).archive([article])
+
+    assert results['success'] == 1
+    assert notion_server.stats['validation_errors'] == 0
+    assert notion_server.stats['appended_blocks'] > 0
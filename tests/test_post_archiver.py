@@ -0,0 +1,82 @@
+import pytest
+import requests
+
+from agents.linkedin.post_archiver import PostArchiver
+from agents.notion.client import NotionClient
+from agents.notion.outbox import NotionOutbox
+from agents.notion.rate_limiter import NotionRateLimiter
+from tests.fakes import FakeNotionServer
+
+
+@pytest.fixture
+def post_server():
+    """포스트 DB 스키마의 로컬 가짜 노션 서버"""
+    with FakeNotionServer(latency=0, handshake=0, rate=1000, burst=1000, fail_suffix='/bad',
+                          schema=FakeNotionServer.POST_SCHEMA, url_property='Source URL') as server:
+        yield server
+
+
+@pytest.fixture
+def post_client(post_server):
+    client = NotionClient('test', rate_limiter=NotionRateLimiter(rate=1000, burst=1000, backoff_base=0.01),
+                          base_url=post_server.base_url)
+    yield client
+    client.close()
+
+
+def make_post(name: str) -> dict:
+    return {
+        'title': f'Post {name}',
+        'body': f'Body of {name}\nsecond paragraph',
+        'source_url': f'https://example.com/{name}',
+        'source_title': f'Story {name}',
+        'category': 'AI',
+        'hashtags': ['AI']
+    }
+
+
+def source_urls(server):
+    return sorted(page['properties']['Source URL']['url'] for page in server.pages)
+
+
+def test_drain_without_mirror_checks_each_source_url(tmp_path, post_server, post_client):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+    post_server.lost_urls.add('https://example.com/a')
+    post_server.down_urls.add('https://example.com/b')
+
+    archiver = PostArchiver({'integration_token': 'test', 'database_id': 'posts'}, client=post_client,
+                            outbox=outbox)
+    results = archiver.archive([make_post('a'), make_post('b'), make_post('c')])
+    assert (results['success'], results['failed']) == (1, 2)
+    assert source_urls(post_server) == ['https://example.com/a', 'https://example.com/c']
+
+    post_server.lost_urls.clear()
+    post_server.down_urls.clear()
+    drained = PostArchiver({'integration_token': 'test', 'database_id': 'posts'}, client=post_client,
+                           outbox=outbox).drain()
+
+    # 응답이 유실된 a는 DB 조회로 이미 있음을 확인하고 다시 만들지 않음
+    assert (drained['success'], drained['skipped'], drained['failed']) == (1, 1, 0)
+    assert len(outbox) == 0
+    assert source_urls(post_server) == [
+        'https://example.com/a', 'https://example.com/b', 'https://example.com/c'
+    ]
+
+
+def test_drain_leaves_entries_when_lookup_fails(tmp_path, post_server, post_client):
+    outbox = NotionOutbox(path=str(tmp_path / 'outbox.sqlite'))
+    post_server.down_urls.add('https://example.com/a')
+    archiver = PostArchiver({'integration_token': 'test', 'database_id': 'posts'}, client=post_client,
+                            outbox=outbox)
+    archiver.archive([make_post('a')])
+
+    def unreachable(source_url):
+        raise requests.ConnectionError('notion unreachable')
+
+    post_server.down_urls.clear()
+    archiver._is_posted = unreachable
+    drained = archiver.drain()
+
+    assert (drained['success'], drained['skipped'], drained['failed']) == (0, 0, 1)
+    assert outbox.stats() == {'pending': 1, 'dead': 0}
+    assert source_urls(post_server) == []
@@ -0,0 +1,60 @@
+from agents.linkedin.filter import NewsFilter
+from tests.fakes import FakeRelevanceAnthropic
+
+
+def make_candidates(count: int) -> list:
+    """키워드 필터를 통과한 기사 (번호가 fake 클라이언트의 점수를 결정)"""
+    return [{
+        'id': f'a{n}',
+        'title': f'bench-title-{n} SaaS update',
+        'summary': 'summary',
+        'tags': [],
+        'matched_keywords': ['saas'],
+        'keyword_match_count': 1 + n % 2
+    } for n in range(count)]
+
+
+def expected_ids(count: int, fail_every: int, threshold: int = 7) -> list:
+    """순차 평가와 같은 결과: 통과 기사를 입력 순서대로 모은 뒤 점수 내림차순 (안정 정렬)"""
+    kept = []
+    for article in make_candidates(count):
+        n = int(article['id'][1:])
+        if fail_every and n % fail_every == 0:
+            score, passed = 5, article['keyword_match_count'] >= 2
+        else:
+            score = (n * 7) % 11
+            passed = score >= threshold
+        if passed:
+            kept.append((article['id'], score))
+    kept.sort(key=lambda item: item[1], reverse=True)
+    return [article_id for article_id, _ in kept]
+
+
+def run_filter(client, count: int) -> tuple:
+    news_filter = NewsFilter({'keywords': ['saas'], 'relevance': {'max_concurrency': 8, 'backoff_base': 0.01}},
+                             api_key='', client=client)
+    articles = make_candidates(count)
+    filtered = news_filter._relevance_filter(articles)
+    filtered.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+    return news_filter, [article['id'] for article in filtered]
+
+
+def test_concurrent_evaluation_keeps_sequential_order_and_fallback():
+    client = FakeRelevanceAnthropic(latency=0.02, fail_every=5)
+    news_filter, ids = run_filter(client, 40)
+
+    assert ids == expected_ids(40, fail_every=5)
+    # 400은 재시도하지 않고 키워드 매칭 기준으로 처리
+    assert client.calls == 40
+    assert news_filter.stats['failed'] == 8
+    assert news_filter.concurrency.stats['max_in_flight'] > 1
+
+
+def test_rate_limited_requests_are_retried_with_reduced_concurrency():
+    client = FakeRelevanceAnthropic(latency=0.02, capacity=3, retry_after=0.05)
+    news_filter, ids = run_filter(client, 40)
+
+    assert ids == expected_ids(40, fail_every=0)
+    assert client.rate_limited > 0
+    assert news_filter.stats['failed'] == 0
+    assert news_filter.concurrency.stats['min_limit'] < 8
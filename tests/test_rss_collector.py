@@ -0,0 +1,111 @@
+import time
+from datetime import datetime
+
+import feedparser
+import pytest
+
+from agents.collector.rss_collector import RSSCollector
+
+
+def make_collector(tmp_path, **config):
+    return RSSCollector({
+        'cache': {'enabled': False},
+        'health': {'enabled': False},
+        **config
+    })
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Fri, 16 Oct 2026 22:30:00 GMT', datetime(2026, 10, 16, 22, 30)),
+    ('Sat, 17 Oct 2026 07:30:00 +0900', datetime(2026, 10, 16, 22, 30)),
+    ('2026-10-16T22:30:00Z', datetime(2026, 10, 16, 22, 30)),
+    ('2026-10-17T07:30:00+09:00', datetime(2026, 10, 16, 22, 30)),
+    ('2026-10-16T22:30:00', datetime(2026, 10, 16, 22, 30)),
+    # 전용 파서가 못 읽는 형식은 dateutil로
+    ('October 16, 2026 10:30 PM', datetime(2026, 10, 16, 22, 30)),
+])
+def test_parse_date_formats(tmp_path, text, expected):
+    assert make_collector(tmp_path)._parse_date(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', None, 'not a date'])
+def test_parse_date_missing_or_invalid(tmp_path, text):
+    assert make_collector(tmp_path)._parse_date(text) is None
+
+
+def test_entry_date_prefers_parsed_struct(tmp_path):
+    collector = make_collector(tmp_path)
+    parsed = time.struct_time((2026, 10, 16, 22, 30, 0, 4, 289, 0))
+
+    assert collector._entry_date({'published_parsed': parsed, 'published': 'garbage'}) == \
+        datetime(2026, 10, 16, 22, 30)
+    assert collector._entry_date({'updated': '2026-10-16T22:30:00Z'}) == datetime(2026, 10, 16, 22, 30)
+    assert collector._entry_date({}) is None
+
+
+def make_feed(dates) -> str:
+    items = ''.join(
+        f"<item><title>Story {n}</title><link>https://example.com/{n}</link>"
+        f"{f'<pubDate>{date}</pubDate>' if date else ''}<description>AI news</description></item>"
+        for n, date in enumerate(dates)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+
+def test_chronological_feed_stops_at_first_old_entry(tmp_path):
+    feed = feedparser.parse(make_feed([
+        'Fri, 16 Oct 2026 22:00:00 GMT', 'Thu, 15 Oct 2026 10:00:00 GMT', 'Fri, 16 Oct 2026 21:00:00 GMT', ''
+    ]))
+    collector = make_collector(tmp_path)
+    cutoff = datetime(2026, 10, 16)
+
+    unordered = collector._parse_entries(feed, {'name': 'Feed'}, cutoff)
+    chronological = collector._parse_entries(feed, {'name': 'Feed', 'chronological': True}, cutoff)
+
+    # 발행일 없는 기사는 cutoff로 거르지 않음
+    assert [article['title'] for article in unordered] == ['Story 0', 'Story 2', 'Story 3']
+    assert unordered[2]['published_at'] is None
+    assert [article['title'] for article in chronological] == ['Story 0']
+
+
+def filter_article(name: str, words: int = None, text: str = 'AI model news') -> dict:
+    article = {'id': name, 'title': f'{text} {name}', 'url': f'https://example.com/{name}', 'source': 'Feed',
+               'excerpt': 'details about the release', 'published_at': None, 'bypass_content_filter': False}
+    if words is not None:
+        article['word_count'] = words
+    return article
+
+
+def test_prefilter_rejections_are_counted_per_rule(tmp_path):
+    collector = make_collector(tmp_path, filters={
+        'min_word_count': 50, 'exclude_keywords': ['sponsored', 'promoted content']
+    })
+    results = [
+        ({'name': 'Feed'}, [
+            filter_article('short', words=10),
+            filter_article('ad', words=300, text='Sponsored: AI tools'),
+            filter_article('promo', words=300, text='AI promoted content'),
+            filter_article('ad2', words=300, text='SPONSORED AI'),
+            # 단어 경계 기준: 'unsponsored'는 제외 키워드가 아님
+            filter_article('ok', words=300, text='Unsponsored AI research'),
+            # word_count 없는 기사(API 소스)는 단어 수 규칙 건너뜀
+            filter_article('api'),
+        ]),
+        # 피드 설정의 min_word_count가 전역 값보다 우선
+        ({'name': 'Short feed', 'min_word_count': 5}, [filter_article('brief', words=10)]),
+    ]
+    collector._iter_feed_results = lambda feed_configs, cutoff_time, end_time: iter(results)
+    collector._feed_configs = lambda: []
+
+    kept = [article['id'] for batch in collector.stream(24) for article in batch]
+
+    assert sorted(kept) == ['api', 'brief', 'ok']
+    assert collector.rejection_stats() == {
+        'min_word_count': 1,
+        'exclude_keywords': {'sponsored': 2, 'promoted content': 1}
+    }
+
+    # 다음 수집에서는 다시 0부터 집계
+    collector._iter_feed_results = lambda feed_configs, cutoff_time, end_time: iter([])
+    list(collector.stream(24))
+    assert collector.rejection_stats() == {'min_word_count': 0, 'exclude_keywords': {}}
@@ -0,0 +1,42 @@
+import json
+import sqlite3
+
+import pytest
+
+from agents.archiver.sinks import ArchiveSink, JsonlSink, SQLiteSink, build_sinks
+
+
+def test_incomplete_sink_fails_at_construction():
+    class NoWrite(ArchiveSink):
+        name = 'broken'
+
+    with pytest.raises(TypeError):
+        NoWrite()
+
+
+def test_jsonl_sink_writes_once_per_flush(tmp_path):
+    sink = JsonlSink(str(tmp_path / 'news.jsonl'))
+    sink.add([{'id': 'a', '_keyword_hits': 'x'}, {'id': 'b'}])
+    assert sink.flush() == 2
+    assert sink.flush() == 0
+
+    rows = [json.loads(line) for line in (tmp_path / 'news.jsonl').read_text().splitlines()]
+    assert [row['id'] for row in rows] == ['a', 'b']
+    assert all('archived_at' in row and '_keyword_hits' not in row for row in rows)
+
+
+def test_sqlite_sink_replaces_by_key_and_adds_columns(tmp_path):
+    path = str(tmp_path / 'archive.sqlite')
+    sink = SQLiteSink(path, 'news', key='id')
+    sink.add([{'id': 'a', 'title': 'old'}])
+    sink.flush()
+    sink.add([{'id': 'a', 'title': 'new', 'tags': ['ai']}])
+    sink.flush()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute('SELECT id, title, tags FROM news').fetchall() == [('a', 'new', '["ai"]')]
+
+
+def test_build_sinks_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        build_sinks({'local': {'dir': str(tmp_path), 'formats': ['csv']}}, 'news')
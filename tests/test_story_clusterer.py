@@ -0,0 +1,51 @@
+from agents.collector.rss_collector import RSSCollector
+from agents.collector.seen_index import SeenIndex
+from agents.collector.story_clusterer import StoryClusterer
+
+
+def make_article(article_id: str, source: str) -> dict:
+    return {
+        'id': article_id,
+        'title': 'OpenAI releases new AI model for enterprise agents',
+        'url': f'https://{source.lower()}.example.com/{article_id}',
+        'source': source,
+        'excerpt': 'OpenAI announced a new AI model on Monday that targets enterprise agents and coding tools',
+        'published_at': None,
+        'bypass_content_filter': False
+    }
+
+
+def test_late_near_duplicate_is_marked_seen_when_canonical_was_archived(tmp_path):
+    seen = SeenIndex(path=str(tmp_path / 'seen.sqlite'))
+    collector = RSSCollector({
+        'cache': {'enabled': False},
+        'health': {'enabled': False},
+        'content_keywords': ['ai']
+    }, seen_index=seen)
+    results = [({'name': 'FeedA'}, [make_article('A', 'FeedA')]),
+               ({'name': 'FeedB'}, [make_article('B', 'FeedB')])]
+    collector._iter_feed_results = lambda feed_configs, cutoff_time, end_time: iter(results)
+
+    batches = []
+    for batch in collector._stream_feeds([], None, None, set(), StoryClusterer()):
+        batches.append(batch)
+        # 스트리밍 모드: 배치를 받자마자 아카이브 + seen 기록
+        seen.mark(article['id'] for article in batch)
+
+    assert [[article['id'] for article in batch] for batch in batches] == [['A']]
+    assert [related['id'] for related in batches[0][0]['related_articles']] == ['B']
+    assert seen.known(['A', 'B']) == {'A', 'B'}
+
+
+def test_merge_into_unarchived_canonical_is_not_marked(tmp_path):
+    seen = SeenIndex(path=str(tmp_path / 'seen.sqlite'))
+    collector = RSSCollector({'cache': {'enabled': False}, 'health': {'enabled': False}}, seen_index=seen)
+    clusterer = StoryClusterer()
+
+    clusterer.cluster([make_article('A', 'FeedA')])
+    clusterer.cluster([make_article('B', 'FeedB')])
+    assert clusterer.late_merges == [('A', 'B')]
+
+    # 대표 기사 아카이브가 실패했으면 다음 실행에서 함께 다시 수집되도록 기록하지 않음
+    collector._mark_late_related(clusterer.late_merges)
+    assert seen.known(['A', 'B']) == set()
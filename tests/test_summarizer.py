@@ -0,0 +1,85 @@
+import json
+from types import SimpleNamespace
+
+from agents.analyzer.summarizer import ArticleSummarizer
+from tests.fakes import FakeAnthropic
+
+
+class ScriptedClient:
+    """요청마다 정해진 응답 텍스트를 돌려주는 가짜 클라이언트 (요청 인자 기록)"""
+
+    def __init__(self, text: str, stop_reason: str = 'end_turn'):
+        self.text = text
+        self.stop_reason = stop_reason
+        self.calls = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        usage = SimpleNamespace(input_tokens=10, output_tokens=10)
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)], usage=usage,
+                               stop_reason=self.stop_reason)
+
+
+def make_articles(count: int):
+    return [{'id': f'a{i}', 'title': f'Title {i}', 'source': 'S', 'excerpt': f'Excerpt {i} ' * 30}
+            for i in range(count)]
+
+
+def test_truncated_response_is_salvaged_without_retry():
+    complete = [{'n': n, 'summary': f'요약 {n}', 'key_points': ['포인트']} for n in (1, 2)]
+    text = json.dumps(complete, ensure_ascii=False)[:-1] + ', {"n": 3, "summary": "잘린'
+    client = ScriptedClient(text, stop_reason='max_tokens')
+    summarizer = ArticleSummarizer({'batch_size': 3, 'retry_delay': 0}, client=client)
+    articles = make_articles(3)
+
+    summarized = summarizer.summarize(articles)
+
+    assert len(client.calls) == 1
+    assert summarized == {'a0', 'a1'}
+    assert articles[0]['summary'] == '요약 1'
+    assert articles[2]['summary'] == ArticleSummarizer.fallback_summary(articles[2])
+    assert articles[2]['key_points'] == []
+    assert summarizer.stats['truncated'] == 1
+    assert summarizer.stats['fallback'] == 1
+
+
+def test_unparseable_response_falls_back_without_retry():
+    client = ScriptedClient('요약할 수 없습니다')
+    summarizer = ArticleSummarizer({'batch_size': 2, 'retry_delay': 0}, client=client)
+    articles = make_articles(2)
+
+    assert summarizer.summarize(articles) == set()
+    assert len(client.calls) == 1
+    assert all(article['summary'].endswith('...') for article in articles)
+
+
+def test_max_tokens_is_sized_from_batch():
+    client = ScriptedClient('[]')
+    summarizer = ArticleSummarizer({'batch_size': 40, 'max_tokens': 6100, 'max_tokens_per_article': 600},
+                                   client=client)
+    # 6100 토큰 안에는 10건까지
+    assert summarizer.batch_size == 10
+
+    summarizer.summarize(make_articles(12))
+    assert sorted(call['max_tokens'] for call in client.calls) == [
+        ArticleSummarizer.RESPONSE_OVERHEAD_TOKENS + 600 * 2,
+        ArticleSummarizer.RESPONSE_OVERHEAD_TOKENS + 600 * 10
+    ]
+
+
+def test_failed_batches_fall_back_to_excerpt():
+    # 2번째 요청마다 실패: 재시도로 모든 배치가 결국 요약됨
+    flaky = ArticleSummarizer({'batch_size': 5, 'max_concurrency': 1, 'retry_delay': 0},
+                              client=FakeAnthropic(base_latency=0, per_article=0, fail_every=2))
+    assert len(flaky.summarize(make_articles(10))) == 10
+    assert flaky.stats['requests'] == 3 and flaky.stats['failed_requests'] == 1
+
+    # 항상 실패: max_retries 후 발췌문 요약, key_points 없음
+    broken = ArticleSummarizer({'batch_size': 5, 'retry_delay': 0, 'max_retries': 2},
+                               client=FakeAnthropic(base_latency=0, per_article=0, fail_every=1))
+    articles = make_articles(10)
+    assert broken.summarize(articles) == set()
+    assert broken.stats['requests'] == 4
+    assert all(article['summary'] == ArticleSummarizer.fallback_summary(article) for article in articles)
+    assert all(article['key_points'] == [] for article in articles)